@@ -0,0 +1,145 @@
+"""
+Benchmarks each stage of ``Book.write`` on the synthetic layouts in
+``layouts.py``, in wall time and peak memory.
+
+Stages are measured by ``Book.write(profile=True)``. Times are the best of
+several runs. Peak memory is measured on a separate run with :mod:`tracemalloc`,
+since tracing slows everything down. ``build`` is the time to construct the
+layout, before ``Book.write`` is called.
+
+    python benchmarks/bench_write.py
+    python benchmarks/bench_write.py --size 20000 --runs 5 --layouts tall_frame expr_chain
+    python benchmarks/bench_write.py --save before.json
+    python benchmarks/bench_write.py --compare before.json --threshold 0.15
+
+With ``--compare``, exits with status 1 if any stage got slower than the saved
+results by more than ``--threshold``.
+"""
+from __future__ import annotations
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from excelbird import Globals
+
+from layouts import LAYOUTS
+
+# Stages faster than this are too noisy to compare
+MIN_COMPARED_SECONDS = 0.005
+
+
+def _stages(name: str, n: int, path: str, mode: str, formulas: str):
+    """
+    Builds layout `name` and writes it, yielding ``(stage, seconds, peak_bytes)``
+    for each stage. `peak_bytes` is None unless :mod:`tracemalloc` is tracing.
+    """
+    Globals.clear_references()
+    Globals.clear_global_references()
+    gc.collect()
+
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.reset_peak()
+    start = time.perf_counter()
+    book = LAYOUTS[name](n)
+    seconds = time.perf_counter() - start
+    yield "build", seconds, tracemalloc.get_traced_memory()[1] if tracing else None
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        profile = book.write(path, mode=mode, formulas=formulas, profile=True)
+    for stage in profile.stages:
+        peak = stage.peak_kb * 1024 if stage.peak_kb is not None else None
+        yield stage.name, stage.seconds, peak
+
+
+def run_layout(name: str, n: int, runs: int, mode: str, formulas: str) -> dict:
+    """
+    ``{stage: {"seconds": best time, "peak_kb": peak memory}}`` for layout `name`.
+    """
+    results = dict()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, f"{name}.xlsx")
+        # Warm up, so one-time costs like imports and compiled patterns aren't timed
+        for _ in _stages(name, min(n, 100), path, mode, formulas):
+            pass
+
+        for _ in range(runs):
+            for stage, seconds, _ in _stages(name, n, path, mode, formulas):
+                best = results.setdefault(stage, {"seconds": seconds})
+                best["seconds"] = min(best["seconds"], seconds)
+
+        tracemalloc.start()
+        try:
+            for stage, _, peak in _stages(name, n, path, mode, formulas):
+                results[stage]["peak_kb"] = round(peak / 1024)
+        finally:
+            tracemalloc.stop()
+    return results
+
+
+def report(name: str, results: dict, baseline: dict | None, threshold: float) -> list[str]:
+    """
+    Prints the results of one layout. Returns the stages that regressed
+    compared to `baseline`.
+    """
+    total = sum(r["seconds"] for r in results.values())
+    print(f"\n{name}: {total:.3f}s")
+    print(f"  {'stage':<20}{'seconds':>10}{'peak KB':>12}{'change':>10}")
+    regressed = []
+    for stage, res in results.items():
+        line = f"  {stage:<20}{res['seconds']:>10.4f}{res['peak_kb']:>12,}"
+        before = (baseline or {}).get(stage)
+        if before is not None:
+            change = res["seconds"] / max(before["seconds"], 1e-9) - 1
+            line += f"{change:>+10.0%}"
+            if change > threshold and res["seconds"] > MIN_COMPARED_SECONDS:
+                regressed.append(f"{name}.{stage}")
+                line += "  <- slower"
+        print(line)
+    return regressed
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--layouts", nargs="+", choices=list(LAYOUTS), default=list(LAYOUTS))
+    parser.add_argument("--size", type=int, default=5000, help="Rows in each layout's largest element")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--mode", choices=["default", "stream"], default="default")
+    parser.add_argument("--formulas", choices=["shared", "array", "cell"], default="shared")
+    parser.add_argument("--save", help="Save the results as json to this path")
+    parser.add_argument("--compare", help="Compare to results saved with --save")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    baseline = dict()
+    if args.compare is not None:
+        with open(args.compare) as f:
+            baseline = json.load(f)["layouts"]
+
+    print(f"size={args.size} runs={args.runs} mode={args.mode} formulas={args.formulas}")
+    results, regressed = dict(), []
+    for name in args.layouts:
+        results[name] = run_layout(name, args.size, args.runs, args.mode, args.formulas)
+        regressed += report(name, results[name], baseline.get(name), args.threshold)
+
+    if args.save is not None:
+        with open(args.save, "w") as f:
+            json.dump({"args": vars(args), "layouts": results}, f, indent=2)
+
+    if len(regressed) > 0:
+        print(f"\nSlower by more than {args.threshold:.0%}: {', '.join(regressed)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""
+Tracks how long it takes to import excelbird, using ``python -X importtime``.
+
+Each run starts a fresh interpreter, so nothing is already in ``sys.modules``.
+Prints the best total over all runs, the modules that took longest to import,
+and whether any of the heavy optional dependencies were loaded.
+
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py excelbird.fn --runs 10 --top 20
+"""
+from __future__ import annotations
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+# Optional dependencies that shouldn't be imported unless they're used
+OPTIONAL = ["pandas", "xlwings", "pygments", "excelbird._pygments", "excelbird._formulae"]
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+def import_times(module: str) -> dict[str, tuple[int, int]]:
+    """
+    Self and cumulative import time, in microseconds, of every module imported
+    by ``import <module>`` in a new interpreter.
+    """
+    root = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [root, env.get("PYTHONPATH")]))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    times = dict()
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if match is not None:
+            times[match.group(4)] = (int(match.group(1)), int(match.group(2)))
+    return times
+
+
+def main(argv: list[str] | None = None) -> dict[str, tuple[int, int]]:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("module", nargs="?", default="excelbird")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    # The fastest run is the least affected by noise
+    best = min(
+        (import_times(args.module) for _ in range(args.runs)),
+        key=lambda times: times[args.module][1],
+    )
+
+    print(f"import {args.module}: {best[args.module][1] / 1000:.1f} ms (best of {args.runs})")
+    print(f"\nSlowest {args.top} modules, by self time:")
+    slowest = sorted(best.items(), key=lambda item: item[1][0], reverse=True)
+    for name, (own, cumulative) in slowest[: args.top]:
+        print(f"  {own / 1000:8.1f} ms  {cumulative / 1000:8.1f} ms  {name}")
+
+    print("\nOptional dependencies:")
+    for name in OPTIONAL:
+        print(f"  {name}: {'imported' if name in best else 'not imported'}")
+    return best
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+Synthetic layouts for the write benchmarks. Each builds a new :class:`Book`
+from `n`, the number of rows its largest element should have, so every stage
+of ``Book.write`` has something to do at any size.
+"""
+from __future__ import annotations
+import numpy as np
+import pandas as pd
+
+from excelbird import Book, Sheet, Stack, VStack, Frame, Col, Row, Cell, Expr, Gap
+import excelbird.fn as fn
+
+
+def _df(rows: int, cols: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    data = {f"col_{i}": rng.integers(0, 1000, rows) for i in range(cols)}
+    data["col_0"] = [f"name {i}" for i in range(rows)]
+    return pd.DataFrame(data)
+
+
+def tall_frame(n: int) -> Book:
+    """
+    A few columns with many rows, from a DataFrame.
+    """
+    return Book(Sheet(Frame(_df(n, 6), table_style=True)))
+
+
+def wide_frame(n: int) -> Book:
+    """
+    Many columns with fewer rows, from a DataFrame.
+    """
+    return Book(Sheet(Frame(_df(max(n // 50, 2), 200), border=True)))
+
+
+def expr_chain(n: int) -> Book:
+    """
+    A column of inputs, and a long chain of expressions that each reference
+    the one before, in another frame and on another sheet.
+    """
+    depth = 40
+    exprs = [Expr(f"[step_{i - 1}] + {i}", header=f"step_{i}") for i in range(1, depth)]
+    return Book(
+        Sheet(
+            Frame(Col(*range(n), header="step_0"), *exprs[: depth // 2]),
+            Frame(*exprs[depth // 2:], Expr("[step_1] * [step_2] - [step_3]", header="mix")),
+        ),
+        Sheet(Frame(Expr("[step_0] - [mix]", header="diff"), Expr("[diff] / 2", header="half"))),
+    )
+
+
+def fn_heavy(n: int) -> Book:
+    """
+    Functions from :mod:`excelbird.fn`, over whole series and single cells.
+    """
+    a = Col(*range(n), header="a")
+    b = Col(*range(n, 0, -1), header="b")
+    rows = max(n // 10, 1)
+    return Book(
+        Sheet(
+            Frame(
+                a,
+                b,
+                fn.MAX(a, ", ", b, header="max"),
+                fn.IF(a, " > ", b, ", ", a, ", ", b, header="if"),
+                fn.ROUND(Expr("[a] / [b]"), ", 2", header="ratio"),
+            ),
+            Frame(
+                Col(*[fn.SUM(a[i], ", ", b[i], res_type=Cell) for i in range(rows)], header="sum"),
+                Col(*[fn.CONCAT(a[i], ', "-", ', b[i], res_type=Cell) for i in range(rows)], header="text"),
+            ),
+        )
+    )
+
+
+def nested_stacks(n: int) -> Book:
+    """
+    Stacks and VStacks nested a few levels deep, with padding, margin,
+    background colors, and an end gap on every sheet.
+    """
+    def block(i: int) -> Stack:
+        return Stack(
+            Frame(Col(*range(i, i + 5), header="x"), Col(*range(5), header="y")),
+            Row(*range(4), fill_color="DDEEFF"),
+            padding=1,
+            margin=[1, 2],
+            background_color="F2F2F2",
+        )
+
+    blocks = max(n // 40, 1)
+    return Book(
+        Sheet(
+            VStack(
+                *[Stack(block(i), block(i + 1), sep=Gap(1)) for i in range(blocks)],
+                padding=2,
+                background_color="CCCCCC",
+            ),
+            end_gap=dict(size=3, fill_color="EEEEEE"),
+        ),
+        Sheet(Stack(*[block(i) for i in range(blocks)], margin=1), end_gap=True),
+    )
+
+
+def table_styles(n: int) -> Book:
+    """
+    Many small frames, each formatted as an Excel table.
+    """
+    frames = max(n // 20, 1)
+    return Book(
+        Sheet(
+            VStack(
+                *[
+                    Frame(
+                        Col(*range(10), header=f"key_{i}"),
+                        Col(*range(10, 20), header=f"value_{i}"),
+                        table_style=dict(
+                            displayName=f"Table{i}",
+                            name=["TableStyleMedium2", "TableStyleLight9"][i % 2],
+                            showRowStripes=i % 3 == 0,
+                        ),
+                    )
+                    for i in range(frames)
+                ],
+                sep=Gap(1),
+            )
+        )
+    )
+
+
+def dropdowns(n: int) -> Book:
+    """
+    Cells with dropdowns of literal values, and of another column's cells.
+    """
+    options = Col("low", "medium", "high", header="options")
+    return Book(
+        Sheet(
+            Frame(
+                options,
+                Col(*[Cell(None, dropdown=["yes", "no"]) for _ in range(n)], header="flag"),
+                Col(*[Cell("low", dropdown=options) for _ in range(n)], header="level"),
+            )
+        )
+    )
+
+
+LAYOUTS = {
+    "tall_frame": tall_frame,
+    "wide_frame": wide_frame,
+    "expr_chain": expr_chain,
+    "fn_heavy": fn_heavy,
+    "nested_stacks": nested_stacks,
+    "table_styles": table_styles,
+    "dropdowns": dropdowns,
+}
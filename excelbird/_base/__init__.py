@@ -3,5 +3,6 @@ from excelbird._base.dotdict import *
 from excelbird._base.help import *
 from excelbird._base.identifier import *
 from excelbird._base.loc import *
+from excelbird._base.writer import *
 from excelbird._base.math import *
 from excelbird._base.styling import *
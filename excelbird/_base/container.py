@@ -1,8 +1,65 @@
 from __future__ import annotations
 from typing import Any
 from excelbird.core.gap import Gap
+from excelbird._base.identifier import HasId
+from copy import deepcopy
 from dataclasses import dataclass
 
+class Stored(int):
+    """
+    Placeholder for a value held in a series' column store, instead of in its
+    own Cell. The int is the value's index in the store. See `_Series._store`.
+    """
+
+    __slots__ = ()
+    width = 1
+    height = 1
+
+    # Immutable, so copies can be the same object
+    def __copy__(self) -> Stored:
+        return self
+
+    def __deepcopy__(self, memo: dict) -> Stored:
+        return self
+
+
+class Derived(Stored):
+    """
+    Placeholder for a Cell of a series made by elementwise math, like
+    ``col_a + col_b``. The int is the row of the operands it's computed from,
+    and its formula is the column store's `formula`, written for that row.
+    """
+
+    __slots__ = ()
+
+
+class ColumnStore(list):
+    """
+    Values held by a series in place of Cells. At write time, `template` is the
+    Cell used to style them, and `empty_value` replaces any None value.
+    For a series made by elementwise math, `formula` holds the parts of each
+    `Derived` element's expression.
+    """
+
+    __slots__ = ("template", "empty_value", "formula")
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.template = None
+        self.empty_value = None
+        self.formula = None
+
+    def __deepcopy__(self, memo: dict) -> ColumnStore:
+        # Stored values are never changed once stored, so they're shared
+        new = ColumnStore()
+        memo[id(self)] = new
+        list.extend(new, self)
+        new.template = deepcopy(self.template, memo)
+        new.empty_value = self.empty_value
+        new.formula = deepcopy(self.formula, memo)
+        return new
+
+
 @dataclass(slots=True)
 class Locable:
     elem: ListIndexableById
@@ -22,6 +79,65 @@ class Locable:
         return elem_from >> elem_to
 
 
+def _elem_id(elem: Any) -> Any:
+    return elem.id if hasattr(elem, "_id") else None
+
+
+def _elem_header(elem: Any) -> Any:
+    if hasattr(elem, "_header"):
+        return elem.header
+    if hasattr(elem, "kwargs"):
+        return elem.kwargs.get("header", None)
+    return None
+
+
+class _KeyIndex:
+    """
+    A container's elements by id and by header, as ``{key: index}``. Indexed
+    elements that can be given a key refer to it, and mark it `stale` when they
+    are, since it can't tell which keys they had before.
+    """
+
+    __slots__ = ("ids", "headers", "stale")
+
+    def __init__(self) -> None:
+        self.ids = dict()
+        self.headers = dict()
+        self.stale = False
+
+
+def _index_keys(key_index: _KeyIndex, index: int, elem: Any) -> None:
+    """
+    Add `elem`'s id and header to the index, unless an earlier element has them.
+    """
+    for keys, key in ((key_index.ids, _elem_id(elem)), (key_index.headers, _elem_header(elem))):
+        if key is not None:
+            try:
+                if keys.get(key, index) >= index:
+                    keys[key] = index
+            except TypeError:
+                pass
+
+    if not isinstance(elem, HasId):
+        return
+    # Only Cells and containers can be given a key later
+    indexes = getattr(elem, "_key_indexes", None)
+    if indexes is None or indexes is key_index:
+        elem._key_indexes = key_index
+    elif isinstance(indexes, _KeyIndex):
+        elem._key_indexes = key_index if indexes.stale else [indexes, key_index]
+    else:
+        indexes[:] = [i for i in indexes if i.stale is False and i is not key_index]
+        indexes.append(key_index)
+
+
+def _shift_keys(key_index: _KeyIndex, start: int, amount: int) -> None:
+    for keys in (key_index.ids, key_index.headers):
+        for key, index in keys.items():
+            if index >= start:
+                keys[key] = index + amount
+
+
 class ListIndexableById(list):
     """
     A simple child class of list that can accept an `id` string as a
@@ -31,14 +147,106 @@ class ListIndexableById(list):
     access elements.
     """
 
+    # The `_KeyIndex` of its elements, built on the first lookup, and those
+    # of the containers it's in. Slots, so they're never copied along with
+    # __dict__. `_mutations` counts the changes made with its own methods.
+    __slots__ = ("_key_index", "_key_indexes", "_mutations")
+
     @property
     def loc(self) -> Locable:
         return Locable(self)
 
+    def __deepcopy__(self, memo: dict) -> ListIndexableById:
+        # The default would iterate with __iter__, turning every stored value
+        # into a Cell. Copy the raw list instead. `_key_index` is rebuilt when needed.
+        cls = type(self)
+        new = cls.__new__(cls)
+        memo[id(self)] = new
+        new.__dict__.update(deepcopy(self.__dict__, memo))
+        new._mutations = getattr(self, "_mutations", 0)
+        list.extend(
+            new,
+            [e if isinstance(e, Stored) else deepcopy(e, memo) for e in list.__iter__(self)],
+        )
+        return new
+
     def insert(self, index, new) -> None:
         index = self._key_to_idx(index)
+        self._mutated()
+        key_index = getattr(self, "_key_index", None)
+        if key_index is not None:
+            index = max(0, min(index + len(self) if index < 0 else index, len(self)))
+            _shift_keys(key_index, index, 1)
+            _index_keys(key_index, index, new)
         super().insert(index, new)
 
+    def append(self, new) -> None:
+        self._mutated()
+        key_index = getattr(self, "_key_index", None)
+        if key_index is not None:
+            _index_keys(key_index, len(self), new)
+        super().append(new)
+
+    def extend(self, new) -> None:
+        self._mutated()
+        key_index = getattr(self, "_key_index", None)
+        if key_index is not None:
+            new = list(new)
+            for i, elem in enumerate(new, len(self)):
+                _index_keys(key_index, i, elem)
+        super().extend(new)
+
+    def pop(self, index=-1) -> Any:
+        self._mutated()
+        elem = super().pop(index)
+        self._unindex(index, elem)
+        return elem
+
+    def remove(self, value) -> None:
+        self._mutated()
+        index = super().index(value)
+        elem = list.__getitem__(self, index)
+        super().__delitem__(index)
+        self._unindex(index, elem)
+
+    def clear(self) -> None:
+        self._mutated()
+        self._drop_key_index()
+        super().clear()
+
+    def sort(self, **kwargs) -> None:
+        self._mutated()
+        self._drop_key_index()
+        super().sort(**kwargs)
+
+    def reverse(self) -> None:
+        self._mutated()
+        self._drop_key_index()
+        super().reverse()
+
+    def __delitem__(self, key) -> None:
+        self._mutated()
+        if isinstance(key, int):
+            elem = list.__getitem__(self, key)
+            super().__delitem__(key)
+            self._unindex(key, elem)
+            return
+        self._drop_key_index()
+        super().__delitem__(key)
+
+    def __iadd__(self, other):
+        self.extend(other)
+        return self
+
+    def __imul__(self, other):
+        self._mutated()
+        self._drop_key_index()
+        return super().__imul__(other)
+
+    def _mutated(self) -> None:
+        # Lets a copy of the elements tell if they're still in the same place
+        self._mutations = getattr(self, "_mutations", 0) + 1
+
     def set(self, **kwargs) -> ListIndexableById:
         """
         Set attributes inline.
@@ -117,24 +325,94 @@ class ListIndexableById(list):
         if isinstance(key, int):
             return key
 
-        ids = [i.id if hasattr(i, "_id") else None for i in self]
-        if key in ids:
-            return ids.index(key)
-
-        headers = [
-            i.header if hasattr(i, "_header") else 
-            i.kwargs.get('header', None) if hasattr(i, 'kwargs')
-            else None for i in self
-        ]
-        if key in headers:
-            return headers.index(key)
-        else:
+        try:
+            return self._find_key(key)
+        except TypeError:
             raise KeyError(f"Invalid key, {key}")
 
+    def _find_key(self, key) -> int:
+        """
+        Index of the first element whose id is `key`, or if there are none,
+        the first whose header is `key`.
+
+        The index is kept up to date as elements are added and removed, and
+        rebuilt after one of its elements is given another id or header.
+        """
+        key_index = getattr(self, "_key_index", None)
+        if key_index is None or key_index.stale is True:
+            key_index = self._build_key_index()
+
+        if key in key_index.ids:
+            return key_index.ids[key]
+        if key in key_index.headers:
+            return key_index.headers[key]
+        raise KeyError(f"Invalid key, {key}")
+
+    def _build_key_index(self) -> _KeyIndex:
+        key_index = _KeyIndex()
+        # Iterate the raw list, so stored values aren't turned into Cells
+        for i, elem in enumerate(list.__iter__(self)):
+            _index_keys(key_index, i, elem)
+        self._key_index = key_index
+        return key_index
+
+    def _drop_key_index(self) -> None:
+        """
+        Forget the index, after a change that moves most elements. It's rebuilt
+        on the next lookup.
+        """
+        key_index = getattr(self, "_key_index", None)
+        if key_index is not None:
+            # So its elements stop referring to it
+            key_index.stale = True
+            self._key_index = None
+
+    def _unindex(self, index: int, old: Any) -> None:
+        """
+        Update the index after `old`, the element at `index`, was removed.
+        """
+        key_index = getattr(self, "_key_index", None)
+        if key_index is None:
+            return
+        if index < 0:
+            index += len(self) + 1
+        _shift_keys(key_index, index + 1, -1)
+        self._find_next_keys(key_index, index, old)
+
+    def _find_next_keys(self, key_index: _KeyIndex, index: int, old: Any) -> None:
+        """
+        Point each of `old`'s keys that were found at `index` to the next
+        element with that key, from `index` on, now that `old` isn't there.
+        """
+        for keys, get_key in ((key_index.ids, _elem_id), (key_index.headers, _elem_header)):
+            key = get_key(old)
+            try:
+                if key is None or keys.get(key) != index:
+                    continue
+            except TypeError:
+                continue
+            del keys[key]
+            for i in range(index, len(self)):
+                if get_key(list.__getitem__(self, i)) == key:
+                    keys[key] = i
+                    break
 
     def __setitem__(self, key, val) -> None:
         from excelbird.core.function import Func
         if isinstance(key, int):
+            self._mutated()
+            old = list.__getitem__(self, key)
+            super().__setitem__(key, val)
+            key_index = getattr(self, "_key_index", None)
+            if key_index is not None:
+                if key < 0:
+                    key += len(self)
+                self._find_next_keys(key_index, key, old)
+                _index_keys(key_index, key, val)
+            return
+        if isinstance(key, slice):
+            self._mutated()
+            self._drop_key_index()
             return super().__setitem__(key, val)
         if isinstance(val, Func):
             val.kwargs['id'] = key
@@ -179,17 +457,16 @@ class ListIndexableById(list):
         A container should finish its initialization by
         calling this function
         """
-        from excelbird.core.expression import Expr
-        from excelbird.core.function import Func
+        from excelbird.core.resolver import Resolver
 
         list.__init__(self, list(args))
+        self._drop_key_index()
 
         for key, val in kwargs.items():
             setattr(self, key, val)
 
-        Expr._set_use_ref_for_container_recursive(self)
-        Expr._resolve_container_recursive(self)
-        Func._resolve_container_recursive(self)
+        # Child containers already tried to resolve their own expressions
+        Resolver(self, nested=False).run()
 
     def _insert_separator(self, separator: Gap | int | bool | dict) -> None:
         if type(separator) in [int, bool, dict]:
@@ -200,6 +477,13 @@ class ListIndexableById(list):
             elif isinstance(separator, dict):
                 separator = Gap(1, **separator)
 
-        for i, _ in reversed(list(enumerate(self))):
-            if i > 0:
-                self.insert(i, separator)
+        if len(self) < 2:
+            return
+        # Built in one pass, since inserting each would shift the rest every time.
+        # The raw list, so stored values aren't turned into Cells
+        new = []
+        for elem in list.__iter__(self):
+            new += [elem, separator]
+        list.__init__(self, new[:-1])
+        self._mutated()
+        self._drop_key_index()
@@ -1,11 +1,26 @@
 from excelbird._layout_references import Globals
 
+
+def _mark_indexes_stale(elem) -> None:
+    """
+    The containers `elem` is in find their elements by id and header. Have them
+    rebuild that index, since one of `elem`'s keys changed.
+    """
+    indexes = getattr(elem, "_key_indexes", None)
+    if indexes is None:
+        return
+    for key_index in indexes if isinstance(indexes, list) else [indexes]:
+        key_index.stale = True
+    elem._key_indexes = None
+
 class HasId:
     """
     Has an id property which, when set, inserts a reference to
     self in `Globals.ids`.
     """
 
+    __slots__ = ()
+
     @property
     def id(self):
         if not hasattr(self, "_id"):
@@ -17,6 +32,9 @@ class HasId:
         self._set_id(new)
 
     def _set_id(self, new):
+        if new != getattr(self, "_id", None):
+            Globals.key_generation += 1
+            _mark_indexes_stale(self)
         if new is not None:
             if not isinstance(new, str):
                 raise ValueError(f"Invalid id, `{new}`. Ids must be strings.")
@@ -44,6 +62,9 @@ class HasHeader:
         self._set_header(new)
 
     def _set_header(self, new):
+        if new != getattr(self, "_header", None):
+            Globals.key_generation += 1
+            _mark_indexes_stale(self)
         if new is not None:
             if not isinstance(new, str):
                 raise ValueError(f"Invalid header, `{new}`. Headers must be strings.")
@@ -0,0 +1,149 @@
+"""
+Reuses what was rendered for a sheet the last time a book was written, if
+nothing the sheet's output depends on has changed. See the `incremental`
+parameter of :meth:`Book.write <excelbird.Book.write>`.
+
+Once every cell has a location, a sheet's output depends only on its own
+placed layout, and on where the elements it references in other sheets were
+placed. A sheet's fingerprint is a hash of exactly that. Each sheet is rendered
+with a `RecordingSheetWriter`, and its recording is kept along with its
+fingerprint. On the next write, a sheet with the same fingerprint replays its
+recording instead of being rendered again. A sheet that references a changed
+one only gets a new fingerprint if the cells it references moved.
+"""
+from __future__ import annotations
+import hashlib
+import pickle
+from copy import deepcopy
+from typing import Any, Iterator
+
+from excelbird._layout_references import Globals
+from excelbird._base.container import ListIndexableById
+from excelbird._base.loc import Loc
+from excelbird._base.writer import SheetWriter, RecordingSheetWriter
+from excelbird._base.parallel import render_sheets
+from excelbird.core.cell import Cell
+
+
+class _Fingerprinter(pickle.Pickler):
+    """
+    Pickles a placed sheet into a hash, instead of into bytes.
+    """
+
+    def __init__(self, writer: SheetWriter) -> None:
+        self.hash = hashlib.blake2b(digest_size=20)
+        super().__init__(self, protocol=pickle.HIGHEST_PROTOCOL)
+        self.writer = writer
+
+    def write(self, data: bytes) -> None:
+        self.hash.update(data)
+
+    def reducer_override(self, obj: Any) -> Any:
+        if type(obj) is Cell:
+            loc = obj._loc
+            if isinstance(loc, Loc) and loc.writer is self.writer:
+                # Most of what's pickled. Flattened, so its Loc isn't reduced on its own
+                return tuple, ((
+                    loc.y, loc.x, obj.value, obj.dropdown, obj._id, obj._style, obj._expr, obj._func
+                ),)
+        if isinstance(obj, Loc):
+            return tuple, ((obj.y, obj.x, obj.ws.title),)
+        if isinstance(obj, SheetWriter):
+            return str, (obj.ws.title,)
+
+        loc = getattr(obj, "_loc", None)
+        if isinstance(loc, Loc) and loc.writer is not self.writer:
+            # On another sheet. Only where it is can change this sheet's output
+            size = list.__len__(obj) if isinstance(obj, list) else None
+            return tuple, ((type(obj).__name__, loc.full_str, size, getattr(obj, "header", None)),)
+
+        if isinstance(obj, ListIndexableById):
+            # The raw list, so stored values aren't turned into Cells
+            return tuple, ((type(obj).__name__, list(list.__iter__(obj)), obj.__dict__),)
+        return NotImplemented
+
+
+def fingerprint(sheet: Any, formulas: str) -> bytes | None:
+    """
+    Hash of everything `sheet`'s output depends on, once every cell in the
+    book is placed. None if some part of it can't be pickled.
+    """
+    writer = sheet._loc.writer
+    pickler = _Fingerprinter(writer)
+    try:
+        pickler.dump((
+            formulas,
+            Globals.expression_sign_spacing,
+            Globals.force_valid_references,
+            sheet,
+        ))
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return None
+    return pickler.hash.digest()
+
+
+def _record(sheet: Any) -> dict:
+    """
+    Write `sheet` to a recorder, and return its recording. Its writer is
+    put back afterwards, since every `Loc` in the sheet holds it.
+    """
+    writer = sheet._loc.writer
+    cls, state = type(writer), dict(writer.__dict__)
+    recorder = RecordingSheetWriter.replacing(writer)
+    try:
+        sheet._write()
+        return recorder.recording()
+    finally:
+        writer.__dict__.clear()
+        writer.__dict__.update(state)
+        writer.__class__ = cls
+
+
+def _recordings(book: Any, indices: list[int], workers: int) -> Iterator[dict]:
+    if workers > 1 and len(indices) > 1:
+        yield from render_sheets(book, indices, workers)
+    else:
+        for i in indices:
+            yield _record(book[i])
+
+
+def write_sheets(book: Any, rendered: dict, formulas: str, workers: int = 1) -> None:
+    """
+    Write every sheet of `book`, whose cells have all been placed. Sheets whose
+    fingerprint is in `rendered` (title -> (fingerprint, recording)) are replayed
+    from there. The rest are rendered, and `rendered` is updated with them.
+    """
+    prints = [fingerprint(sheet, formulas) for sheet in book]
+    dirty = []
+    for i, (sheet, print_) in enumerate(zip(book, prints)):
+        cached = rendered.get(sheet.title)
+        if print_ is None or cached is None or cached[0] != print_:
+            dirty.append(i)
+    is_dirty = set(dirty)
+
+    titles = {sheet.title for sheet in book}
+    for title in list(rendered):
+        if title not in titles:
+            del rendered[title]
+
+    recordings = _recordings(book, dirty, workers)
+    for i, sheet in enumerate(book):
+        if i in is_dirty:
+            recording = next(recordings)
+            if prints[i] is None:
+                rendered.pop(sheet.title, None)
+            else:
+                rendered[sheet.title] = (prints[i], recording)
+        else:
+            recording = rendered[sheet.title][1]
+
+        writer = sheet._loc.writer
+        # Replaying can rename tables, and the recording may be replayed again
+        writer.replay(dict(
+            recording,
+            tables=deepcopy(recording["tables"]),
+            validations=deepcopy(recording["validations"]),
+        ))
+        writer.close()
+        if sheet.isolate is True:
+            Globals.clear_references(writer.ws.title)
@@ -1,8 +1,9 @@
 from typing import overload, TypeVar
-from openpyxl.worksheet.worksheet import Worksheet
 from openpyxl.utils.cell import coordinate_from_string, column_index_from_string
 from openpyxl.utils import get_column_letter
 
+from excelbird._base.writer import SheetWriter
+
 TLoc = TypeVar("TLoc", bound="Loc")
 
 class Loc:
@@ -18,44 +19,77 @@ class Loc:
         2 positionals (y and x)
 
     Conversion to string (`str(my_loc)`) will return an Excel cell location "C7"
+
+    Cells are accessed through `writer`, a :class:`SheetWriter` wrapping
+    the openpyxl worksheet, `ws`.
+
+    Locs are immutable. Use `.shift()` to get a Loc relative to another.
     """
 
+    __slots__ = ("y", "x", "writer")
+
     @overload
-    def __init__(self, loc: TLoc, ws: None = None) -> None:
+    def __init__(self, loc: TLoc, writer: None = None) -> None:
         ...
 
     @overload
-    def __init__(self, loc: str | tuple[int, int] | list[int], ws: Worksheet) -> None:
+    def __init__(
+        self, loc: str | tuple[int, int] | list[int], writer: SheetWriter
+    ) -> None:
         ...
 
     def __init__(
-        self, loc: TLoc | str | tuple[int, int] | list[int], ws: Worksheet | None = None
+        self,
+        loc: TLoc | str | tuple[int, int] | list[int],
+        writer: SheetWriter | None = None,
     ) -> None:
         if isinstance(loc, Loc):
-            self.y = loc.y
-            self.x = loc.x
-            self.ws = loc.ws
+            y, x, writer = loc.y, loc.x, loc.writer
 
         elif isinstance(loc, (tuple, list)):
-            self.y = loc[0]
-            self.x = loc[1]
-            self.ws = ws
+            y, x = loc[0], loc[1]
 
         elif isinstance(loc, str):
             col_str, row_num = coordinate_from_string(loc)
             col_num = column_index_from_string(col_str)
-            self.y = row_num - 1
-            self.x = col_num - 1
-            self.ws = ws
+            y, x = row_num - 1, col_num - 1
         else:
             raise ValueError(f"Invalid argument, {loc}")
 
-        if self.ws is None:
+        if writer is None:
             raise ValueError("A Loc must have a worksheet")
 
+        _set_y(self, y)
+        _set_x(self, x)
+        _set_writer(self, writer)
+
+    def __setattr__(self, name, value) -> None:
+        raise AttributeError("Loc is immutable. Use .shift() to get a new one")
+
+    # Immutable, so copies can be the same object. Its worksheet is never copied.
+    def __copy__(self) -> TLoc:
+        return self
+
+    def __deepcopy__(self, memo: dict) -> TLoc:
+        return self
+
+    def shift(self, y: int = 0, x: int = 0) -> TLoc:
+        """
+        A new Loc, `y` rows down and `x` columns across from this one.
+        """
+        new = object.__new__(Loc)
+        _set_y(new, self.y + y)
+        _set_x(new, self.x + x)
+        _set_writer(new, self.writer)
+        return new
+
     @property
-    def cell(self) -> str:
-        return self.ws[self.cell_str]
+    def ws(self):
+        return self.writer.ws
+
+    @property
+    def cell(self):
+        return self.writer.cell(self.y + 1, self.x + 1)
 
     @property
     def col_letter(self) -> str:
@@ -63,23 +97,26 @@ class Loc:
 
     @property
     def cell_str(self) -> str:
-        return f"{get_column_letter(self.x+1)}{self.y+1}"
+        return get_column_letter(self.x + 1) + str(self.y + 1)
 
     @property
     def title_str(self) -> str:
-        chars_to_trigger_quotes = [" ", "-"]
-        if any(c in self.ws.title for c in chars_to_trigger_quotes):
-            return "'" + self.ws.title + "'" + "!"
-        return self.ws.title + "!"
+        return self.writer.title_str
 
     @property
     def full_str(self) -> str:
-        return self.title_str + self.cell_str
+        return self.writer.title_str + get_column_letter(self.x + 1) + str(self.y + 1)
 
     @property
     def column_dimensions(self):
-        return self.ws.column_dimensions[self.col_letter]
+        return self.ws.column_dimensions[get_column_letter(self.x + 1)]
 
     @property
     def row_dimensions(self):
         return self.ws.row_dimensions[self.y + 1]
+
+
+# Slot setters, for use around `Loc.__setattr__`
+_set_y = Loc.y.__set__
+_set_x = Loc.x.__set__
+_set_writer = Loc.writer.__set__
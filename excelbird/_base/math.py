@@ -1,8 +1,7 @@
 # REFACTOR SO & ACTS NORMAL AGAIN
 from typing import Any
-from pandas import Series, DataFrame
 
-from excelbird._utils.util import get_dimensions
+from excelbird._utils.util import get_dimensions, loaded_type
 from excelbird.core.gap import Gap
 from excelbird._layout_references import Globals
 
@@ -27,11 +26,13 @@ func_error = ValueError(
 
 def elem_math(a: Any, b: Any, func, sign: str) -> Any:
     from excelbird.core.cell import Cell
-    from excelbird.core.series import Col
+    from excelbird.core.series import Col, _Series
     from excelbird.core.frame import Frame
     from excelbird.core.function import Func
     from excelbird.core.expression import Expr
 
+    Series, DataFrame = loaded_type("pandas", "Series"), loaded_type("pandas", "DataFrame")
+
     a_cls, b_cls = type(a), type(b)
     a_dim, b_dim = get_dimensions(a), get_dimensions(b)
 
@@ -93,6 +94,11 @@ def elem_math(a: Any, b: Any, func, sign: str) -> Any:
     if a_dim == 0 and b_dim == 0:
         return Cell(_expr=[a, sign, b])
 
+    if a_dim < 2 and b_dim < 2:
+        res = _Series._elementwise(a, b, sign)
+        if res is not None:
+            return res
+
     if a_dim == b_dim:
         a = [a for a in a if not isinstance(a, Gap)]
         b = [b for b in b if not isinstance(b, Gap)]
@@ -113,6 +119,8 @@ def elem_math(a: Any, b: Any, func, sign: str) -> Any:
 
 class CanDoMath:
 
+    __slots__ = ()
+
     def _space_sign(self, sign: str) -> str:
         space = Globals.expression_sign_spacing
         return (space * " ") + sign + (space * " ")
@@ -0,0 +1,63 @@
+"""
+Writes the sheets of a book with a pool of processes. See the `workers`
+parameter of :meth:`Book.write <excelbird.Book.write>`.
+
+Once every cell has a location, each sheet's values, formulas and style keys
+can be worked out without the others. Worker processes are forked from the
+main one, so each has the whole placed layout without it being copied over.
+Each renders its sheets with a `RecordingSheetWriter`, and sends back what was
+recorded. The main process writes the recordings to the workbook in order,
+while the rest are still being rendered.
+"""
+from __future__ import annotations
+import multiprocessing
+from typing import Any, Iterator
+
+from excelbird._layout_references import Globals
+from excelbird._base.writer import RecordingSheetWriter
+
+# The book being written. Set before the pool is forked, so workers inherit it.
+_book = None
+
+
+def can_fork() -> bool:
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+def _render(index: int) -> dict:
+    """
+    In a worker: write sheet `index` to a recorder, and return its recording.
+    """
+    sheet = _book[index]
+    writer = RecordingSheetWriter.replacing(sheet._loc.writer)
+    sheet._write()
+    return writer.recording()
+
+
+def render_sheets(book: Any, indices: list[int], workers: int) -> Iterator[dict]:
+    """
+    Recordings of the sheets of `book` at `indices`, in order, rendered in up
+    to `workers` processes. Each is yielded as soon as it's ready.
+    """
+    global _book
+    _book = book
+    try:
+        context = multiprocessing.get_context("fork")
+        with context.Pool(min(workers, len(indices))) as pool:
+            yield from pool.imap(_render, indices)
+    finally:
+        _book = None
+
+
+def write_sheets(book: Any, workers: int) -> None:
+    """
+    Write every sheet of `book`, whose cells have all been placed, rendering
+    them in up to `workers` processes.
+    """
+    for i, recording in enumerate(render_sheets(book, list(range(len(book))), workers)):
+        sheet = book[i]
+        writer = sheet._loc.writer
+        writer.replay(recording)
+        writer.close()
+        if sheet.isolate is True:
+            Globals.clear_references(writer.ws.title)
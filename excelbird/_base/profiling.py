@@ -0,0 +1,179 @@
+"""
+Opt-in measurements of :meth:`Book.write <excelbird.Book.write>`, taken with
+``book.write(path, profile=True)``.
+
+Each stage of the write is measured on its own, and stages that run once per
+sheet are also broken down by sheet. Nothing here runs unless profiling is on.
+"""
+from __future__ import annotations
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+
+@dataclass(slots=True)
+class StageProfile:
+    """
+    Measurements of one stage of a write, or of one sheet in that stage.
+
+    `nodes` and `cells` are the size of the layout once the stage is done:
+    containers, and everything else they hold. `blocks` is the net change in
+    memory blocks allocated by Python, and `peak_kb` the peak traced memory,
+    only if :mod:`tracemalloc` was already tracing. `styles_created` and
+    `style_hits` count styles resolved for the first time, and styles reused.
+    `cells_written` and `formulas_written` are only counted when sheets are written.
+    """
+
+    name: str
+    seconds: float = 0.0
+    nodes: int = 0
+    cells: int = 0
+    blocks: int = 0
+    peak_kb: int | None = None
+    styles_created: int = 0
+    style_hits: int = 0
+    cells_written: int = 0
+    formulas_written: int = 0
+    sheets: dict[str, StageProfile] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class WriteProfile:
+    """
+    Returned by ``book.write(path, profile=True)``. `stages` are in the order
+    they ran. Print it for a summary.
+    """
+
+    stages: list[StageProfile] = field(default_factory=list)
+
+    @property
+    def seconds(self) -> float:
+        return sum(s.seconds for s in self.stages)
+
+    @property
+    def counters(self) -> dict[str, int]:
+        """
+        Totals over every stage.
+        """
+        return {
+            name: sum(getattr(s, name) for s in self.stages)
+            for name in ["cells_written", "formulas_written", "styles_created", "style_hits"]
+        }
+
+    def __getitem__(self, name: str) -> StageProfile:
+        for stage in self.stages:
+            if stage.name == name:
+                return stage
+        raise KeyError(name)
+
+    def __str__(self) -> str:
+        columns = ["seconds", "nodes", "cells", "blocks", "cells_written", "formulas_written", "styles_created"]
+        header = f"{'stage':<24}" + "".join(f"{c:>17}" for c in columns)
+        lines = [header, "-" * len(header)]
+
+        def line(label: str, stage: StageProfile) -> str:
+            values = [f"{stage.seconds:.4f}"] + [f"{getattr(stage, c):,}" for c in columns[1:]]
+            return f"{label:<24}" + "".join(f"{v:>17}" for v in values)
+
+        for stage in self.stages:
+            lines.append(line(stage.name, stage))
+            for title, sheet in stage.sheets.items():
+                lines.append(line("  " + title[:22], sheet))
+        lines.append(f"total: {self.seconds:.4f} seconds")
+        return "\n".join(lines)
+
+
+def _layout_size(container: list) -> tuple[int, int]:
+    """
+    Number of containers in `container` (including itself), and of other elements.
+    """
+    nodes, cells = 0, 0
+    stack = [container]
+    while len(stack) > 0:
+        elem = stack.pop()
+        nodes += 1
+        # The raw lists, so stored values aren't turned into Cells
+        for child in list.__iter__(elem):
+            if isinstance(child, list):
+                stack.append(child)
+            else:
+                cells += 1
+    return nodes, cells
+
+
+class Profiler:
+    """
+    Runs the stages of a write for `book`, and measures each one.
+
+    `callback`, if given, is called with each stage's `StageProfile` as
+    soon as it's done.
+    """
+
+    def __init__(self, book: list, callback: Callable[[StageProfile], Any] | None = None) -> None:
+        self.book = book
+        self.callback = callback
+        self.profile = WriteProfile()
+
+    def run(self, name: str, func: Callable, per_sheet: bool) -> None:
+        """
+        Run `func` for stage `name`, once for each sheet if `per_sheet`.
+        """
+        if per_sheet is False:
+            stage = self._measure(name, func)
+        else:
+            stage = StageProfile(name)
+            for i, sheet in enumerate(self.book):
+                title = sheet.title if sheet.title is not None else f"Sheet{i+1}"
+                stage.sheets[title] = self._measure(title, func, sheet)
+            for sheet in stage.sheets.values():
+                for attr in ["seconds", "blocks", "styles_created", "style_hits", "cells_written", "formulas_written"]:
+                    setattr(stage, attr, getattr(stage, attr) + getattr(sheet, attr))
+                if sheet.peak_kb is not None:
+                    stage.peak_kb = max(stage.peak_kb or 0, sheet.peak_kb)
+            stage.nodes, stage.cells = _layout_size(self.book)
+
+        self.profile.stages.append(stage)
+        if self.callback is not None:
+            self.callback(stage)
+
+    def _measure(self, name: str, func: Callable, *args: Any) -> StageProfile:
+        styles = getattr(self.book, "style_cache", None)
+        before = (styles.misses, styles.hits) if styles is not None else (0, 0)
+        writer = self._writer(*args)
+        if writer is not None:
+            writer.keep_stats = True
+
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+        blocks = sys.getallocatedblocks()
+        start = time.perf_counter()
+        func(*args)
+        stage = StageProfile(name, seconds=time.perf_counter() - start)
+        stage.blocks = sys.getallocatedblocks() - blocks
+        if tracing:
+            stage.peak_kb = round(tracemalloc.get_traced_memory()[1] / 1024)
+
+        new_styles = getattr(self.book, "style_cache", None)
+        if new_styles is not None:
+            if new_styles is not styles:
+                # Created by this stage
+                before = (0, 0)
+            stage.styles_created = new_styles.misses - before[0]
+            stage.style_hits = new_styles.hits - before[1]
+
+        if writer is not None:
+            stage.cells_written, stage.formulas_written = writer.stats()
+        stage.nodes, stage.cells = _layout_size(args[0] if args else self.book)
+        return stage
+
+    def _writer(self, *args: Any) -> Any:
+        """
+        The writer of the sheet given, once it's been placed.
+        """
+        if len(args) == 0:
+            return None
+        loc = getattr(args[0], "_loc", None)
+        return getattr(loc, "writer", None)
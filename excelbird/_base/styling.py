@@ -96,6 +96,8 @@ class HasBorder:
     has variable, 'border_x' for each side.
     """
 
+    __slots__ = ()
+
     empty = [None, None, None, None]
     negated = [False, False, False, False]
     default_weight = "thin"
@@ -318,3 +320,88 @@ class HasBorder:
                         elem.value = ""
                     elem.border = mask.middle
 
+
+
+class CellStyle(tuple):
+    """
+    Immutable record of a Cell's style attributes, in the order of `fields`.
+
+    Records are interned, so every Cell with the same style holds the same
+    record. Setting an attribute on a Cell swaps its record for another
+    (also shared) one, instead of copying anything. Style combinations are
+    few compared to cells, so interned records are never released.
+    """
+
+    __slots__ = ()
+
+    fields = (
+        "align_x",
+        "align_y",
+        "indent",
+        "center",
+        "wrap",
+        "size",
+        "bold",
+        "italic",
+        "color",
+        "num_fmt",
+        "currency",
+        "ignore_format",
+        "fill_color",
+        "auto_color_font",
+        "auto_shade_font",
+        "border_top",
+        "border_right",
+        "border_bottom",
+        "border_left",
+        "col_width",
+        "row_height",
+        "merge",
+        "autofit",
+    )
+    _interned: dict[tuple, "CellStyle"] = {}
+
+    @classmethod
+    def get(cls, values: Iterable) -> "CellStyle":
+        """
+        The shared record holding `values`.
+        """
+        values = tuple(values)
+        # Types are part of the key, so 1, 1.0 and True stay distinct
+        key = (values, tuple(map(type, values)))
+        try:
+            style = cls._interned.get(key)
+        except TypeError:
+            # Unhashable value (i.e. a list passed as `merge`). Can't be shared.
+            return tuple.__new__(cls, values)
+        if style is None:
+            style = cls._interned[key] = tuple.__new__(cls, values)
+        return style
+
+    def set(self, index: int, value: Any) -> "CellStyle":
+        values = list(self)
+        values[index] = value
+        return type(self).get(values)
+
+    def __reduce__(self):
+        # Copies and pickles resolve to the shared record
+        return (type(self).get, (tuple(self),))
+
+    def __deepcopy__(self, memo: dict) -> "CellStyle":
+        return self
+
+    @classmethod
+    def attribute(cls, name: str) -> property:
+        """
+        Property exposing field, `name` of an object's `_style` record.
+        """
+        index = cls.fields.index(name)
+
+        def fget(self) -> Any:
+            return self._style[index]
+
+        def fset(self, value: Any) -> None:
+            if self._style[index] is not value:
+                self._style = self._style.set(index, value)
+
+        return property(fget, fset)
@@ -0,0 +1,649 @@
+"""
+Worksheet writers. Every `Loc` holds one of these instead of a raw openpyxl
+worksheet, so that layout elements can write cells, merges, tables and
+data validation without knowing how the workbook is being built.
+"""
+from __future__ import annotations
+# External
+import re
+import warnings
+from typing import Any, Hashable, Iterable
+from openpyxl import Workbook
+from openpyxl.cell.cell import Cell as XlCell, MergedCell
+from openpyxl.styles import Border
+from openpyxl.styles.cell_style import StyleArray
+from openpyxl.worksheet.cell_range import CellRange, MultiCellRange
+from openpyxl.worksheet.datavalidation import DataValidation
+from openpyxl.worksheet.formula import ArrayFormula
+from openpyxl.worksheet.merge import MergedCellRange
+from openpyxl.worksheet.table import Table
+from openpyxl.utils.cell import range_boundaries
+
+
+# Cell attribute -> the StyleArray field openpyxl stores its table index in
+_style_array_keys = {
+    "number_format": "numFmtId",
+    "font": "fontId",
+    "fill": "fillId",
+    "border": "borderId",
+    "alignment": "alignmentId",
+}
+
+
+class StyleCache:
+    """
+    Shares resolved styles between the cells of one workbook.
+
+    openpyxl stores a cell's style as indices into the workbook's tables of
+    fonts, fills, borders, alignments and number formats, and looks up those
+    indices by hashing each style object it's given. The first cell styled
+    under a key is styled normally, and the indices it gets are remembered.
+    Every later cell with that key gets the indices directly.
+
+    `hits` and `misses` count lookups, so the cache can be checked.
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self._indices: dict[Hashable, tuple] = {}
+        # (border index, side name, border index of the side's cell) -> border index
+        self._added_borders: dict[tuple, int] = {}
+
+    def apply(self, cell: XlCell, key: Hashable) -> bool:
+        """
+        Style `cell` with the styles cached under `key`. False if there are none.
+        """
+        try:
+            indices = self._indices.get(key)
+        except TypeError:
+            indices = None
+        if indices is None:
+            self.misses += 1
+            return False
+
+        self.hits += 1
+        if cell._style is None:
+            cell._style = StyleArray()
+        for name, index in indices:
+            setattr(cell._style, name, index)
+        return True
+
+    def apply_all(self, cells: list[XlCell], key: Hashable) -> bool:
+        """
+        Same as `apply()` for each of `cells`, but the styles cached under
+        `key` are only looked up once. False if there are none.
+        """
+        if not self.apply(cells[0], key):
+            return False
+        indices = self._indices[key]
+        for cell in cells[1:]:
+            if cell._style is None:
+                cell._style = StyleArray()
+            style = cell._style
+            for name, index in indices:
+                setattr(style, name, index)
+        self.hits += len(cells) - 1
+        return True
+
+    def add(self, cell: XlCell, key: Hashable, styles: dict[str, Any]) -> None:
+        """
+        Set `styles` (cell attribute name -> openpyxl style object) on `cell`,
+        and cache the result under `key`.
+        """
+        for name, style in styles.items():
+            setattr(cell, name, style)
+
+        names = [_style_array_keys[name] for name in styles]
+        try:
+            self._indices[key] = tuple(
+                (name, getattr(cell._style, name)) for name in names
+            )
+        except TypeError:
+            # Unhashable key. Nothing to share.
+            pass
+
+
+    def add_border(self, cell: XlCell, name: str, start: XlCell) -> None:
+        """
+        Same as ``cell.border += Border(top=start.border.top)``, for side `name`.
+        The border it ends up with only depends on the two borders, so the
+        result is cached like in `apply()`. Merged ranges repeat a few of them.
+        """
+        if cell._style is None:
+            cell._style = StyleArray()
+        if start._style is None:
+            start._style = StyleArray()
+        key = (cell._style.borderId, name, start._style.borderId)
+        index = self._added_borders.get(key)
+        if index is None:
+            cell.border += Border(**{name: getattr(start.border, name)})
+            self._added_borders[key] = cell._style.borderId
+        else:
+            cell._style.borderId = index
+
+
+class _InlineStyles:
+    """
+    Styles recorded for a cell whose key can't be hashed, so can't be shared.
+    """
+
+    __slots__ = ("styles",)
+
+    def __init__(self, styles: dict[str, Any]) -> None:
+        self.styles = styles
+
+    def __reduce__(self):
+        return (type(self), (self.styles,))
+
+
+class RecordingStyleCache(StyleCache):
+    """
+    Records the style key of each cell instead of styling it, along with the
+    styles of each key. See `RecordingSheetWriter`.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.keys: dict[tuple[int, int], Any] = {}
+        self.styles: dict[Hashable, dict[str, Any]] = {}
+
+    def apply(self, cell: XlCell, key: Hashable) -> bool:
+        try:
+            known = key in self.styles
+        except TypeError:
+            known = False
+        if known is False:
+            self.misses += 1
+            return False
+
+        self.hits += 1
+        self.keys[cell.row, cell.column] = key
+        return True
+
+    def apply_all(self, cells: list[XlCell], key: Hashable) -> bool:
+        if not self.apply(cells[0], key):
+            return False
+        keys = self.keys
+        for cell in cells[1:]:
+            keys[cell.row, cell.column] = key
+        self.hits += len(cells) - 1
+        return True
+
+    def add(self, cell: XlCell, key: Hashable, styles: dict[str, Any]) -> None:
+        try:
+            self.styles[key] = styles
+        except TypeError:
+            key = _InlineStyles(styles)
+        self.keys[cell.row, cell.column] = key
+
+
+def next_table_name(name: str) -> str:
+    """
+    The table name to try when `name` is taken: its number incremented, or
+    "1" appended if it has none.
+    """
+    name_and_num = re.search(r"(.+)(\d+)", name)
+    if name_and_num is None:
+        return name + "1"
+    label, num = name_and_num.groups()
+    return f"{label}{int(num)+1}"
+
+
+def _cell_ranges(cells: Iterable[tuple[int, int]]) -> list[CellRange]:
+    """
+    The fewest rectangles this method finds that cover `cells`, as (row, column).
+    Runs of rows are joined within each column, then runs that span the same
+    rows are joined across neighbouring columns.
+    """
+    by_column: dict[int, list[int]] = {}
+    for row, column in cells:
+        by_column.setdefault(column, []).append(row)
+
+    # (min_row, max_row) -> [min_col, max_col] of the range still being extended
+    spans: dict[tuple[int, int], list[int]] = {}
+    ranges = []
+    for column in sorted(by_column):
+        rows = sorted(set(by_column[column]))
+        start = rows[0]
+        for prev, row in zip(rows, rows[1:] + [None]):
+            if row == prev + 1:
+                continue
+            span = spans.get((start, prev))
+            if span is not None and span[1] == column - 1:
+                span[1] = column
+            else:
+                span = spans[start, prev] = [column, column]
+                ranges.append(((start, prev), span))
+            start = row
+    return [
+        CellRange(min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col)
+        for (min_row, max_row), (min_col, max_col) in ranges
+    ]
+
+
+def _without_contained(ranges: list[CellRange]) -> list[CellRange]:
+    """
+    `ranges` in order, without those inside one that comes before them. Same as
+    adding each to a `MultiCellRange`, without comparing each to all the others.
+    A range is inside another if both of its corners are.
+    """
+    kept = []
+    # (row, column) -> index in `kept` of each range that covers it
+    covering: dict[tuple[int, int], list[int]] = {}
+    for cr in ranges:
+        first = covering.get((cr.min_row, cr.min_col))
+        last = covering.get((cr.max_row, cr.max_col))
+        if first is not None and last is not None and not set(first).isdisjoint(last):
+            continue
+        for cell in cr.cells:
+            covering.setdefault(cell, []).append(len(kept))
+        kept.append(cr)
+    return kept
+
+
+def _merged_border_sides(start: XlCell) -> list[str]:
+    """
+    Sides of `start`'s border that a merged range starting at `start` copies
+    to the cells on its edges, like openpyxl's `MergedCellRange.format()`.
+    """
+    border = start.border
+    return [
+        name for name in ["top", "left", "right", "bottom"]
+        if not (getattr(border, name) and getattr(border, name).style is None)
+    ]
+
+
+def _count_cells(cells: Iterable[XlCell]) -> tuple[int, int]:
+    """
+    Number of `cells`, and how many hold a formula.
+    """
+    total, formulas = 0, 0
+    for cell in cells:
+        total += 1
+        if cell.data_type == "f":
+            formulas += 1
+    return total, formulas
+
+
+class SharedFormula(ArrayFormula):
+    """
+    A cell's part of a formula shared by the cells in range `ref`, which
+    differ only by their offset from the first. The first cell holds the
+    `text` and `ref`, and the rest only the index, `si`.
+
+    openpyxl has no type for these, but writes any `ArrayFormula` from its
+    attributes, and expands shared formulas when reading.
+    """
+
+    t = "shared"
+
+    def __init__(self, si: int, ref: str | None = None, text: str | None = None) -> None:
+        super().__init__(ref, text)
+        self.si = si
+
+    def __iter__(self):
+        for k in ["t", "ref", "si"]:
+            v = getattr(self, k)
+            if v is not None:
+                yield k, str(v)
+
+
+class SheetWriter:
+    """
+    Writes directly to a regular (in-memory) openpyxl worksheet.
+
+    Writers for sheets in the same workbook should share a `StyleCache`, and
+    `formulas`, where cells keep the formula strings of the unplaced cells they
+    reference. `formula_mode` is how a series writes rows whose formulas only
+    differ by their offset: "shared", "array" or "cell". See `Book.write()`.
+
+    If `keep_stats` is set before the sheet is written, `stats()` can tell
+    what was written once it's closed. Only used when profiling.
+    """
+
+    keep_stats = False
+
+    def __init__(
+        self,
+        ws,
+        styles: StyleCache | None = None,
+        formulas: dict | None = None,
+        formula_mode: str = "shared",
+    ) -> None:
+        self.ws = ws
+        self.styles = styles if styles is not None else StyleCache()
+        self.formulas = formulas if formulas is not None else dict()
+        self.formula_mode = formula_mode
+        self._title = None
+        self._title_str = None
+        self._shared_formulas = 0
+        # formula -> (row, column) of each cell with that dropdown list
+        self._dropdowns: dict[str, list[tuple[int, int]]] = {}
+        self._merges: list[CellRange] = []
+
+    @property
+    def title_str(self) -> str:
+        """
+        Sheet prefix of a cell reference, like "'My Sheet'!". Cached until
+        the worksheet is renamed.
+        """
+        title = self.ws.title
+        if title != self._title:
+            chars_to_trigger_quotes = [" ", "-"]
+            if any(c in title for c in chars_to_trigger_quotes):
+                self._title_str = "'" + title + "'" + "!"
+            else:
+                self._title_str = title + "!"
+            self._title = title
+        return self._title_str
+
+    def cell(self, row: int, column: int) -> XlCell:
+        return self.ws.cell(row=row, column=column)
+
+    def shared_formula_index(self) -> int:
+        """
+        A new `si` for a `SharedFormula`. Unique within the worksheet.
+        """
+        self._shared_formulas += 1
+        return self._shared_formulas - 1
+
+    def merge_cells(
+        self, start_row: int, start_column: int, end_row: int, end_column: int
+    ) -> None:
+        """
+        Merge a range of cells. Ranges are merged together by `add_merges()`.
+        """
+        self._merges.append(CellRange(
+            min_col=start_column, min_row=start_row, max_col=end_column, max_row=end_row
+        ))
+
+    def add_merges(self) -> None:
+        """
+        Merge each range given to `merge_cells()`, once the cells they cover
+        are written. Like openpyxl, a range inside one merged before is skipped.
+        """
+        for cr in _without_contained(self._merges):
+            self._merge(cr)
+        self._merges = []
+
+    def _merge(self, cr: CellRange) -> None:
+        """
+        Same as ``ws.merge_cells()``, but without comparing the range to every
+        merged range, and with each cell's border and protection set by index.
+        """
+        ws = self.ws
+        mcr = MergedCellRange(ws, cr.coord)
+        ws.merged_cells.ranges.add(mcr)
+        start = mcr.start_cell
+        for row, column in mcr.cells:
+            if (row, column) != (start.row, start.column):
+                ws._cells[row, column] = MergedCell(ws, row, column)
+
+        for name in _merged_border_sides(start):
+            for row, column in getattr(mcr, name):
+                self.styles.add_border(ws._cells[row, column], name, start)
+
+        protection = start._style.protectionId if start._style is not None else 0
+        for row, column in mcr.cells:
+            cell = ws._cells[row, column]
+            if cell._style is None:
+                cell._style = StyleArray()
+            cell._style.protectionId = protection
+
+    def add_data_validation(self, dv: DataValidation) -> None:
+        self.ws.add_data_validation(dv)
+
+    def add_dropdown(self, formula: str, row: int, column: int) -> None:
+        """
+        Give the cell at `row`, `column` a dropdown list of `formula`. Cells
+        with the same list share one `DataValidation`, added by `add_dropdowns()`.
+        """
+        cells = self._dropdowns.get(formula)
+        if cells is None:
+            cells = self._dropdowns[formula] = []
+        cells.append((row, column))
+
+    def add_dropdowns(self) -> None:
+        """
+        Add a `DataValidation` for each dropdown list given to `add_dropdown()`,
+        covering every cell that has it in as few ranges as possible.
+        """
+        for formula, cells in self._dropdowns.items():
+            dv = DataValidation(type="list", formula1=formula, allow_blank=True)
+            dv.sqref = MultiCellRange(_cell_ranges(cells))
+            self.add_data_validation(dv)
+        self._dropdowns = {}
+
+    def add_table(self, table: Table) -> None:
+        self.ws.add_table(table)
+
+    def close(self) -> None:
+        self.add_merges()
+        self.add_dropdowns()
+
+    def stats(self) -> tuple[int, int]:
+        """
+        Number of cells written to the worksheet, and how many hold a formula.
+        """
+        return _count_cells(self.ws._cells.values())
+
+    def replay(self, recording: dict) -> None:
+        """
+        Write everything a `RecordingSheetWriter` recorded for this sheet.
+        Styles are resolved with this writer's `styles`, as if the cells had
+        been written here.
+        """
+        styles = self.styles
+        shared = recording["styles"]
+        for row, column, value, key in recording["cells"]:
+            cell = self.cell(row, column)
+            cell.value = value
+            if type(key) is _InlineStyles:
+                styles.add(cell, None, key.styles)
+            elif key is not None and not styles.apply(cell, key):
+                styles.add(cell, key, shared[key])
+
+        for kwargs in recording["merged"]:
+            self.merge_cells(**kwargs)
+        for dv in recording["validations"]:
+            self.add_data_validation(dv)
+        for table in recording["tables"]:
+            # The name was only checked against the sheet's own tables
+            for _ in range(30):
+                try:
+                    self.add_table(table)
+                    break
+                except ValueError:
+                    table.displayName = table.name = next_table_name(table.name)
+            else:
+                raise ValueError(f"Couldn't find a unique name for table, '{table.name}'")
+
+        ws = self.ws
+        for letter, width in recording["columns"].items():
+            ws.column_dimensions[letter].width = width
+        for row, height in recording["rows"].items():
+            ws.row_dimensions[row].height = height
+        tab_color, state, zoom = recording["properties"]
+        ws.sheet_properties.tabColor = tab_color
+        ws.sheet_state = state
+        ws.sheet_view.zoomScale = zoom
+
+
+class StreamSheetWriter(SheetWriter):
+    """
+    Writes to a write-only openpyxl worksheet.
+
+    Write-only worksheets only accept whole rows, in order, and can't be
+    read back. So cells are buffered by row while a sheet is written, and
+    emitted top to bottom on `.close()`. Only one sheet is buffered at a time.
+    """
+
+    def __init__(
+        self,
+        ws,
+        styles: StyleCache | None = None,
+        formulas: dict | None = None,
+        formula_mode: str = "shared",
+    ) -> None:
+        super().__init__(ws, styles, formulas, formula_mode)
+        self._rows: dict[int, dict[int, XlCell]] = {}
+        self._stats = (0, 0)
+
+    def cell(self, row: int, column: int) -> XlCell:
+        cells = self._rows.setdefault(row, {})
+        cell = cells.get(column)
+        if cell is None:
+            cell = XlCell(self.ws, row=row, column=column)
+            cells[column] = cell
+        return cell
+
+    def _merge(self, cr: CellRange) -> None:
+        self.ws.merged_cells.ranges.add(cr)
+        self._format_merged_range(cr)
+
+    def add_data_validation(self, dv: DataValidation) -> None:
+        self.ws.data_validations.append(dv)
+
+    def add_table(self, table: Table) -> None:
+        # Columns get named from the buffer in `.close()`, so openpyxl's
+        # warning about adding them manually doesn't apply.
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)
+            self.ws.add_table(table)
+
+    def close(self) -> None:
+        """
+        Apply merge borders and table headers from the buffer, then send
+        every buffered row to the worksheet.
+        """
+        self.add_merges()
+        self.add_dropdowns()
+
+        for table in self.ws.tables.values():
+            self._initialise_table_columns(table)
+
+        if self.keep_stats is True:
+            # Counted now, since the buffer is emptied below
+            self._stats = _count_cells(
+                cell for cells in self._rows.values() for cell in cells.values()
+            )
+
+        if len(self._rows) > 0:
+            for row in range(1, max(self._rows) + 1):
+                cells = self._rows.pop(row, None)
+                if cells is None:
+                    self.ws.append([])
+                    continue
+                values = [None] * max(cells)
+                for column, cell in cells.items():
+                    values[column - 1] = cell
+                self.ws.append(values)
+
+    def stats(self) -> tuple[int, int]:
+        return self._stats
+
+    def _format_merged_range(self, cr: CellRange) -> None:
+        """
+        Same as openpyxl's `MergedCellRange.format()`, for buffered cells.
+        Cells covered by the merge are dropped, except for those on its
+        edges, which keep only the border of the top-left cell.
+        """
+        start = self.cell(cr.min_row, cr.min_col)
+        end = self._rows.get(cr.max_row, {}).get(cr.max_col)
+        if end is not None and end is not start:
+            start.border += Border(right=end.border.right, bottom=end.border.bottom)
+
+        for row, column in cr.cells:
+            if (row, column) != (cr.min_row, cr.min_col):
+                self._rows.get(row, {}).pop(column, None)
+
+        for name in _merged_border_sides(start):
+            for row, column in getattr(cr, name):
+                if (row, column) == (cr.min_row, cr.min_col):
+                    continue
+                self.styles.add_border(self.cell(row, column), name, start)
+
+    def _initialise_table_columns(self, table: Table) -> None:
+        """
+        openpyxl names table columns by reading the header cells at save
+        time, which a write-only worksheet can't do. Name them from the buffer.
+        """
+        if table.tableColumns:
+            return
+        table._initialise_columns()
+        if not table.headerRowCount:
+            return
+        min_col, min_row, _, _ = range_boundaries(table.ref)
+        headers = self._rows.get(min_row, {})
+        for i, col in enumerate(table.tableColumns):
+            cell = headers.get(min_col + i)
+            if cell is not None and cell.value is not None:
+                col.name = str(cell.value)
+
+
+class RecordingSheetWriter(SheetWriter):
+    """
+    Records what's written to a sheet instead of writing it, so the sheet can
+    be rendered in another process. The main process then writes the
+    `recording()` with its own writer's `.replay()`.
+
+    Cells aren't styled. Only their style key is kept, along with the styles of
+    each key. Sizes and sheet properties are set on a worksheet of its own.
+    """
+
+    def __init__(self, title: str, formulas: dict | None = None, formula_mode: str = "shared") -> None:
+        ws = Workbook().active
+        ws.title = title
+        super().__init__(ws, RecordingStyleCache(), formulas, formula_mode)
+        self._cells: dict[tuple[int, int], XlCell] = {}
+        self._merged: list[dict] = []
+        self._validations: list[DataValidation] = []
+
+    @classmethod
+    def replacing(cls, writer: SheetWriter) -> RecordingSheetWriter:
+        """
+        Turn `writer` into a recorder for its sheet. Every `Loc` in a sheet holds
+        the same writer, so it's changed in place instead of replaced. Only for
+        a process's own copy of the writer, since it can't write afterwards.
+        """
+        title, formulas, mode = writer.ws.title, writer.formulas, writer.formula_mode
+        shared = writer._shared_formulas
+        writer.__dict__.clear()
+        writer.__class__ = cls
+        cls.__init__(writer, title, formulas, mode)
+        writer._shared_formulas = shared
+        return writer
+
+    def cell(self, row: int, column: int) -> XlCell:
+        cell = self._cells.get((row, column))
+        if cell is None:
+            cell = self._cells[row, column] = XlCell(self.ws, row=row, column=column)
+        return cell
+
+    def merge_cells(self, **kwargs) -> None:
+        self._merged.append(kwargs)
+
+    def add_data_validation(self, dv: DataValidation) -> None:
+        self._validations.append(dv)
+
+    def recording(self) -> dict:
+        """
+        Everything written, as plain data that can be pickled.
+        """
+        self.add_dropdowns()
+        keys = self.styles.keys
+        ws = self.ws
+        return {
+            "cells": [
+                (row, column, cell._value, keys.get((row, column)))
+                for (row, column), cell in self._cells.items()
+            ],
+            "styles": self.styles.styles,
+            "merged": self._merged,
+            "validations": self._validations,
+            "tables": list(ws.tables.values()),
+            "columns": {k: d.width for k, d in ws.column_dimensions.items()},
+            "rows": {k: d.height for k, d in ws.row_dimensions.items()},
+            "properties": (ws.sheet_properties.tabColor, ws.sheet_state, ws.sheet_view.zoomScale),
+        }
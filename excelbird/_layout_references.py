@@ -5,6 +5,9 @@ class Globals:
     global_headers = dict()
     force_valid_references = True
     expression_sign_spacing = 2
+    # Incremented whenever any element's id or header changes, so expressions
+    # waiting on a key know when to try again
+    key_generation = 0
 
     @classmethod
     def clear_references(cls, sheet_title: str | None = None) -> None:
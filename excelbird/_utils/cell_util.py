@@ -1,5 +1,8 @@
 import re
-from excelbird._formulae import FORMULAE
+import sys
+from functools import lru_cache
+from numbers import Real
+from typing import Any
 
 def remove_paren_enclosure(value: str) -> str:
     if not isinstance(value, str):
@@ -9,6 +12,25 @@ def remove_paren_enclosure(value: str) -> str:
     return value
 
 
+def is_blank(value: Any) -> bool:
+    """
+    Whether a cell value should be skipped instead of written
+    """
+    if value is None:
+        return True
+    pd = sys.modules.get("pandas")
+    if pd is None:
+        # Without pandas loaded, values can't be NaT or pd.NA. Only NaN is left
+        return isinstance(value, (float, Real)) and value != value
+    try:
+        if pd.isnull(value):
+            return True
+    except Exception:
+        # Just making sure pd.isnull doesn't throw, if given a data type it doesn't like
+        pass
+    return False
+
+
 def autofit_algorithm(value: str) -> int:
     """
     Decides column width given string value of a cell
@@ -35,35 +57,76 @@ def approximate_arial_string_width(st):
     return size * 6 / 1000.0 # Convert to picas
 
 
-def format_formula(s: str) -> str:
+# Characters of a function name, or an unquoted sheet name or cell reference
+_word_char = r"[A-Za-z0-9_.]"
+
+
+@lru_cache(maxsize=None)
+def _formula_pattern(sheet_prefix: str, functions: bool) -> re.Pattern:
     """
-    The last step in finalizing a formula. Attempting to correct
-    user mistakes, trailing commas, unwanted spaces, etc. Assume
-    the function is fully built, starts with '=', and all functions
-    are prefixed with '_xlfn.'
+    Tokens of a formula that `finalize_formula` rewrites, as named groups.
+    Strings are matched too, so nothing inside them is rewritten.
     """
-    s = re.sub(r"\([, ]+", r"(", s)  # comma before opening paren
-    s = re.sub(r"[, ]+\)", r")", s) # trailing comma before closing paren
-    s = re.sub(r"^= +", "=", s)  # leading space
-    s = re.sub(r"[, ]+$", "", s)  # trailing comma
-    s = re.sub(r"= *'(.*?)'", r'="\1"', s)  # using single quotes instead of double
-    return s
+    tokens = [r'(?P<string>"(?:[^"]|"")*")']
+    if functions:
+        # Single quoted string after '=', unless it's a quoted sheet name
+        tokens.append(r"(?P<eq_single>= *)'(?P<single>(?:[^']|'')*)'(?!!)")
+    if sheet_prefix != "":
+        # Not the end of a longer sheet name
+        tokens.append(r"(?<![A-Za-z_.])(?P<prefix>" + re.escape(sheet_prefix) + ")")
+    tokens.append(r"(?P<quoted>'(?:[^']|'')*')")
+    if functions:
+        tokens += [
+            r"(?<!" + _word_char + r")(?P<func>" + _word_char + r"+)\([, ]*",
+            r"(?P<open>\()[, ]+",
+            r"(?P<leading>^= +)",
+            r"[, ]+(?P<close>\)|$)",
+        ]
+    return re.compile("|".join(tokens))
 
 
-def prefix_formulae_funcs(func: str) -> str:
-    """
-    Openpyxl will insert '@' before any function it doesn't think is a valid
-    excel function. Its list of functions is outdated, so newer functions, like "CONCAT"
-    will be interpreted as invalid incorrectly.
+@lru_cache(maxsize=None)
+def _function_name(name: str) -> str:
+    # Imported on first use, since it's only needed once formulas are written
+    from excelbird._formulae import FORMULAE
+
+    if name.upper() in FORMULAE:
+        return "_xlfn." + name
+    return name
+
 
-    Our solution is to find functions in the string, where there are capital letters, dots,
-    or digits, followed by a starting parenthese, check if they are in openpyxl's
-    `FORMULAE`, and if not, prefix them with "_xlfn."
+def _finalize_token(match: re.Match) -> str:
+    kind = match.lastgroup
+    if kind == "func":
+        return _function_name(match.group("func")) + "("
+    if kind == "single":
+        value = match.group("single").replace("''", "'").replace('"', '""')
+        return '="' + value + '"'
+    if kind == "prefix":
+        return ""
+    if kind == "open":
+        return "("
+    if kind == "leading":
+        return "="
+    if kind == "close":
+        return match.group("close")
+    return match.group(0)
+
+
+@lru_cache(maxsize=4096)
+def finalize_formula(formula: str, sheet_prefix: str = "", functions: bool = True) -> str:
     """
+    The last step in building a formula, in one scan. Never changes the
+    contents of a string.
 
-    matches = re.findall(r"([A-Z\.a-z0-9]+)\(", func)
-    # matches = re.findall(r"^([A-Z\.0-9]+)\(", func) + re.findall(r"(?<![^\.A-Za-z0-9])([A-Za-z\.0-9]+)\(", func)
-    matches = set([match for match in matches if match.upper() in FORMULAE])
-    for match in matches:
-        func = func.replace(match + "(", "_xlfn." + match + "(")
-    return func
+    - Removes `sheet_prefix` (like "'My Sheet'!") from references, since
+      they're on the same sheet as the formula.
+    - If `functions` is True, also prefixes each function name in `FORMULAE`
+      with "_xlfn.", since openpyxl's list of functions is outdated and it would
+      insert "@" before newer ones, like "CONCAT". And attempts to correct user
+      mistakes: commas and spaces after an opening or before a closing parenthese,
+      or at the end of the formula, spaces after the leading '=', and single
+      quoted strings after '='.
+    """
+    pattern = _formula_pattern(sheet_prefix, functions)
+    return pattern.sub(_finalize_token, formula)
@@ -1,4 +1,4 @@
-from numpy import sqrt
+from math import sqrt
 
 def hex_to_rgb(hex_string: str) -> tuple[int, int, int]:
     hex_string = hex_string.lstrip("#")
@@ -38,6 +38,25 @@ def pass_dict_to_children(container: list, dict_name: str) -> None:
                     getattr(elem, dict_name)[attr] = value
 
 
+def pass_to_descendants(root: list) -> None:
+    """
+    Call ``_pass_to_children()`` on `root` and every container under it, each
+    before its children, in one walk over the tree. Each container passes
+    down what it's been given along with its own, so by the time anything is
+    written, every element holds everything it inherits.
+
+    Mutates inplace: `root`
+    """
+    stack = [root]
+    while len(stack) > 0:
+        container = stack.pop()
+        container._pass_to_children()
+        # The raw list, so stored values aren't turned into Cells
+        for elem in list.__iter__(container):
+            if hasattr(elem, "_pass_to_children"):
+                stack.append(elem)
+
+
 def pass_attr_without_override(elem1: Any, elem2: Any, attr_name: str) -> None:
     """
     If elem1 and elem2 have attribute, `attr_name` and that attribute is not None
@@ -1,8 +1,31 @@
-from typing import Any
-from pandas import DataFrame, Series, to_datetime
+from __future__ import annotations
+import sys
+from typing import Any, TYPE_CHECKING
 
 from excelbird.core.gap import Gap
 
+if TYPE_CHECKING:
+    from pandas import DataFrame, Series
+
+
+class _NotLoaded:
+    """
+    Stands in for a type from a library that hasn't been imported yet. Nothing
+    can be an instance of it.
+    """
+
+
+def loaded_type(module: str, name: str) -> type:
+    """
+    Type `name` from `module`, only if `module` has already been imported.
+    Otherwise, no value could be an instance of it, so there's no need to import
+    it. This keeps pandas and numpy from loading unless the user uses them.
+    """
+    mod = sys.modules.get(module)
+    if mod is None:
+        return _NotLoaded
+    return getattr(mod, name, _NotLoaded)
+
 def get_dimensions(elem: Any) -> int:
     if isinstance(elem, type):
         return getattr(elem, "_dimensions", -1)
@@ -10,6 +33,7 @@ def get_dimensions(elem: Any) -> int:
 
 
 def to_date(column: Series) -> Series:
+    from pandas import to_datetime
     return to_datetime(column).dt.date
 
 
@@ -59,45 +83,48 @@ def init_from_same_dimension_type(instance, args: list) -> list:
     return args
 
 
-def fill_frames(container: list) -> None:
-    from excelbird.core.stack import _Stack
-    from excelbird.core.frame import _Frame
+def fill_frame(frame: list) -> None:
+    """
+    Pad each series in `frame` that's shorter than the longest, with empty
+    cells if ``frame.fill_empty``, or gaps otherwise.
+    """
     from excelbird.core.series import _Series
     from excelbird.core.cell import Cell
 
     def true_length(series) -> int:
         return len(series) + (0 if series.header is None else 1)
 
-    for elem in container:
-        if isinstance(elem, _Stack):
-            fill_frames(elem)
+    if len(set(
+        (true_lengths := [
+            true_length(i) for i in frame if isinstance(i, _Series)
+        ])
+    )) <= 1:
+        return
 
-        elif isinstance(elem, _Frame):
-            if len(set(
-                (true_lengths := [
-                    true_length(i) for i in elem if isinstance(i, _Series)
-                ])
-            )) == 1:
-                continue
+    max_length = max(true_lengths)
 
-            max_length = max(true_lengths)
+    if frame.fill_empty is True:
+        fill_value = lambda: Cell("")
+    else:
+        fill_value = lambda: Gap()
 
-            if elem.fill_empty is True:
-                fill_value = lambda: Cell("")
-            else:
-                fill_value = lambda: Gap()
+    for series in [e for e in frame if isinstance(e, _Series)]:
+        if (true_len := true_length(series)) < max_length:
+            for _ in range(max_length - true_len):
+                series.append(fill_value())
 
-            for series in [e for e in elem if isinstance(e, _Series)]:
-                if (true_len := true_length(series)) < max_length:
-                    for _ in range(max_length - true_len):
-                        series.append(fill_value())
 
-
-def set_duplicate_objects_to_ref(
-    container: list, memory_ids_history: list,
-) -> None:
+def prepare_layout(book: list) -> None:
     """
-    Duplicated elements need to have .ref() set.
+    Walk the whole layout tree once, before anything is placed:
+
+    - Each container's children are checked with ``_validate_child_types()``.
+    - Duplicated elements need to have .ref() set. The first one found, going
+      depth first in order, is kept and every later one is replaced with a
+      reference to it.
+    - Frames are filled with :func:`fill_frame`, once their children are done.
+
+    Iterative, so deep trees don't hit the recursion limit.
     """
     from excelbird.core.stack import _Stack
     from excelbird.core.frame import _Frame
@@ -109,14 +136,32 @@ def set_duplicate_objects_to_ref(
         _Series,
         Cell,
     )
-    for i, elem in enumerate(container):
-        if isinstance(elem, valid_types):
-            if id(elem) in memory_ids_history and hasattr(elem, "ref"):
-                container[i] = elem.ref()
-            else:
-                memory_ids_history.append(id(elem))
-                if not isinstance(elem, Cell):
-                    set_duplicate_objects_to_ref(elem, memory_ids_history)
+    seen = set()
+    book._validate_child_types()
+
+    # Containers being walked, each with the index of its next child
+    stack = [[book, 0]]
+    while len(stack) > 0:
+        entry = stack[-1]
+        container, i = entry
+        # The raw list, so stored values aren't turned into Cells
+        if i == list.__len__(container):
+            stack.pop()
+            if isinstance(container, _Frame):
+                fill_frame(container)
+            continue
+        entry[1] = i + 1
+
+        elem = list.__getitem__(container, i)
+        if not isinstance(elem, valid_types):
+            continue
+        if id(elem) in seen and hasattr(elem, "ref"):
+            container[i] = elem.ref()
+        else:
+            seen.add(id(elem))
+            if not isinstance(elem, Cell):
+                elem._validate_child_types()
+                stack.append([elem, 0])
 
 
 def is_notebook() -> bool:
@@ -34,11 +34,13 @@ def ensure_value_is_number(value: Any, message: str | None = None) -> int | floa
 
 
 def require_each_element_to_be_cls_type(container: list) -> None:
+    from excelbird._base.container import Stored
+
     cls_name = type(container).__name__
     elem_type = type(container).elem_type
     elem_type_name = elem_type.__name__
-    for i, elem in enumerate(container):
-        if not isinstance(elem, elem_type):
+    for i, elem in enumerate(list.__iter__(container)):
+        if not isinstance(elem, (elem_type, Stored)):
             raise TypeError(
                 f"Each element inside {cls_name} must be a {elem_type_name}. "
                 f"Elem at index {i} is a '{type(elem).__name__}'. Its value is: {elem}"
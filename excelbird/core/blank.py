@@ -0,0 +1,95 @@
+"""
+A rectangle of identical cells, for gaps between elements of a Stack and a
+Sheet's end gap.
+"""
+from __future__ import annotations
+from typing import Any
+
+from excelbird._base.dotdict import Style
+from excelbird._base.loc import Loc
+from excelbird._utils.cell_util import is_blank
+from excelbird.core.cell import Cell
+from excelbird.core.series import Row
+
+
+class BlankRegion:
+    """
+    Takes the place of a Frame or VFrame of Cells that would all have the same
+    value and style. Occupies `height` rows and `width` columns, but holds no
+    Cells. At write time, every cell in the range is written in bulk, and nothing
+    is written if `value` is None.
+
+    Parent containers pass styles to it like they would to the Frame.
+    If it receives a table style, the Frame is built and written instead,
+    so the result is the same.
+
+    Parameters
+    ----------
+    height : int
+    width : int
+    value : Any
+        Value of each cell. Usually `""` or None
+    frame_type : type
+        The type of Frame being stood in for
+    cell_style : dict, optional
+        Styles for each cell
+    """
+
+    def __init__(
+        self,
+        height: int,
+        width: int,
+        value: Any,
+        frame_type: type,
+        cell_style: Style | dict | None = None,
+    ) -> None:
+        if cell_style is None:
+            cell_style = dict()
+
+        self.height = height
+        self.width = width
+        self.value = value
+        self.frame_type = frame_type
+        self._loc = None
+        # Dicts that are passed down from parents
+        self.cell_style = Style(**cell_style)
+        self.header_style = Style()
+        self.table_style = Style()
+
+    def _set_loc(self, loc: Loc) -> None:
+        self._loc = loc
+
+    def _write(self) -> None:
+        if len(self.table_style) > 0:
+            frame = self._to_frame()
+            frame._set_loc(self._loc)
+            frame._write()
+            return
+
+        if is_blank(self.value):
+            return
+
+        template = Cell(self.value)
+        template._inherit_style_without_override(self.cell_style)
+        template._write_range(self._loc, self.height, self.width, self.value)
+
+    def _to_frame(self):
+        """
+        The Frame (or VFrame) of Cells this region stands in for.
+        """
+        frame_type = self.frame_type
+        series_type = frame_type.elem_type
+        if issubclass(series_type, Row):
+            count, length = self.height, self.width
+        else:
+            count, length = self.width, self.height
+
+        return frame_type(
+            *[series_type._blank(length, self.value, dict()) for _ in range(count)],
+            cell_style=self.cell_style,
+            header_style=self.header_style,
+            table_style=self.table_style,
+        )
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.height}, {self.width})"
@@ -2,16 +2,16 @@
 Detailed documentation and code examples coming soon.
 """
 # External
-from pandas import Series, DataFrame
 import openpyxl as xl
-from typing import Any
-from copy import copy
+from typing import Any, Callable
+from copy import deepcopy
 import os
+import warnings
 
 # Internal main
 from excelbird._utils.util import (
-    fill_frames,
-    set_duplicate_objects_to_ref,
+    loaded_type,
+    prepare_layout,
 )
 from excelbird._utils.argument_parsing import (
     combine_args_and_children_to_list,
@@ -20,6 +20,7 @@ from excelbird._utils.argument_parsing import (
 from excelbird._utils.pass_attributes import (
     pass_dict_to_children,
     pass_attr_to_children,
+    pass_to_descendants,
 )
 from excelbird._utils.validation import (
     require_each_element_to_be_cls_type,
@@ -27,7 +28,6 @@ from excelbird._utils.validation import (
 from excelbird.exceptions import (
     AutoOpenFileError,
     InvalidSheetName,
-    ExpressionResolutionError,
     UnsavedWorkbookError,
 )
 from excelbird._layout_references import Globals
@@ -35,6 +35,7 @@ from excelbird.styles import default_table_style
 
 from excelbird.core.expression import Expr
 from excelbird.core.function import Func
+from excelbird.core.resolver import Resolver
 from excelbird.core.item import Item
 from excelbird.core.gap import Gap
 from excelbird.core.cell import Cell
@@ -44,8 +45,13 @@ from excelbird.core.series import _Series, Col
 from excelbird.core.sheet import Sheet
 
 from excelbird._base.container import ListIndexableById
+from excelbird._base.identifier import HasId, HasHeader
 from excelbird._base.dotdict import Style
 from excelbird._base.loc import Loc
+from excelbird._base.writer import SheetWriter, StreamSheetWriter, StyleCache
+from excelbird._base.profiling import Profiler, StageProfile, WriteProfile
+from excelbird._base.parallel import can_fork, write_sheets
+from excelbird._base.incremental import write_sheets as write_changed_sheets
 
 
 class Book(ListIndexableById):
@@ -130,10 +136,8 @@ class Book(ListIndexableById):
 
         move_remaining_kwargs_to_dict(kwargs, cell_style)
 
-        original_workbook = xl.Workbook()
-
-        self.original_workbook = original_workbook
-        self.wb = copy(original_workbook)
+        # Created by each write. See `_set_loc`
+        self.wb = None
         self.path = path
         self.auto_open = auto_open
         # Attrs that must be passed to children
@@ -145,13 +149,27 @@ class Book(ListIndexableById):
         self.cell_style = Style(**cell_style)
         self.header_style = Style(**header_style)
         self.table_style = Style(**table_style)
+        # Set on write. Shares openpyxl styles between cells, and counts hits/misses.
+        # The formula cache keeps the formulas of unplaced cells, during a write
+        self.style_cache = None
+        self.formula_cache = None
+        # What was rendered for each sheet, for incremental writes
+        self._rendered = dict()
 
         self._init(children)
 
         if sep is not None:
             self._insert_separator(sep)
 
-    def write(self, path: str | None = None) -> None:
+    def write(
+        self,
+        path: str | None = None,
+        mode: str = "default",
+        formulas: str = "shared",
+        profile: bool | Callable[[StageProfile], Any] = False,
+        workers: int = 1,
+        incremental: bool = False,
+    ) -> WriteProfile | None:
         """
         Evaluates the layout tree and writes the completed layout to a ``.xlsx`` file.
 
@@ -160,13 +178,53 @@ class Book(ListIndexableById):
         path : str, optional
             Full path to the output file. Only exclude if `path` attribute
             has already been set.
+        mode : {'default', 'stream'}, default 'default'
+            With ``'stream'``, the workbook is built from write-only worksheets.
+            Each sheet's cells are placed first, then emitted row by row, so memory
+            use is bounded by the largest sheet instead of the whole workbook.
+            Output is the same as the default mode.
+        formulas : {'shared', 'array', 'cell'}, default 'shared'
+            How to write a series made by math between series, or by a
+            :class:`Func <excelbird.Func>` with a series in it, when each of its
+            formulas is the same apart from the row (or column) it's on.
+            With ``'shared'``, the first cell's formula is shared by the rest,
+            which takes much less space. With ``'array'``, it's written as a single
+            array formula over the range, with ranges in place of cell references.
+            Only math can be written this way, so a Func is shared instead.
+            With ``'cell'``, each cell gets its own formula.
+        profile : bool or callable, default False
+            Measure each stage of the write, and each sheet in stages that run
+            once per sheet: duration, size of the layout, memory blocks allocated,
+            and cells, formulas and styles written. If a callable, it's called with
+            each stage's ``StageProfile`` as soon as that stage is done.
+        workers : int, default 1
+            Number of processes to render sheets with. Once every cell is placed,
+            sheets are rendered in parallel, and their cells are written to the
+            workbook in order by this process. Worth it for books with many large
+            sheets. Needs the 'fork' start method (Linux and macOS). Elsewhere,
+            sheets are written one at a time.
+        incremental : bool, default False
+            Keep what's rendered for each sheet, and on later incremental writes
+            of this book, reuse it for each sheet whose output can't have changed:
+            its own layout, data and styles are the same, and the cells it references
+            on other sheets are in the same place. Only the other sheets are rendered
+            again. Worth it for a book written over and over, where only some of
+            its data changes each time. Keeps every sheet's cells in memory.
+
+        Returns
+        -------
+        :class:`WriteProfile` or None
+            Only if `profile` is set. Print it for a summary of where the time went.
 
         Notes
         -----
 
         **The algorithm, step by step**
 
-        * First, all references inside each :class:`Expr <excelbird.Expr>` in the layout is resolved and evaluated
+        * The layout is copied, and the copy is what gets written. The book and its
+          elements are left as they were, so the same book can be written again,
+          i.e. after updating some of its data.
+        * Then, all references inside each :class:`Expr <excelbird.Expr>` in the layout is resolved and evaluated
         * Now that the true size and shape of each layout element is known, spatial styling
           can be resolved
 
@@ -199,46 +257,164 @@ class Book(ListIndexableById):
         if self.path is None:
             raise ValueError("Workbook needs a path")
 
-        require_each_element_to_be_cls_type(self)
+        if mode not in ["default", "stream"]:
+            raise ValueError(f"Invalid write mode, '{mode}'. Use 'default' or 'stream'")
 
-        if self.auto_open == True:
-            self._save_close_currently_open_excel_file()
+        if formulas not in ["shared", "array", "cell"]:
+            raise ValueError(
+                f"Invalid formulas, '{formulas}'. Use 'shared', 'array' or 'cell'"
+            )
 
-        if self._resolve_all_references() is False:
-            raise ExpressionResolutionError()
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError(f"Invalid workers, '{workers}'. Must be an int of at least 1")
 
-        pass_attr_to_children(self, "end_gap")
+        require_each_element_to_be_cls_type(self)
 
-        self._validate_child_types()
+        if self.auto_open == True:
+            self._save_close_currently_open_excel_file()
 
-        set_duplicate_objects_to_ref(self, [])
+        profiler = None
+        if profile is not False:
+            profiler = Profiler(self, profile if callable(profile) else None)
+
+        def run(book: "Book", stages: list[tuple[str, Callable, bool]]) -> None:
+            for name, stage, per_sheet in stages:
+                if profiler is not None:
+                    profiler.run(name, stage, per_sheet)
+                elif per_sheet is True:
+                    for sheet in book:
+                        stage(sheet)
+                else:
+                    stage()
 
-        for sheet in self:
-            fill_frames(sheet)
-            sheet._resolve_padding()
-            sheet._resolve_margin()
-            sheet._resolve_background_color()
-            sheet._resolve_gaps()
+        snapshot = None
 
-        self._set_loc()
+        def take_snapshot() -> None:
+            nonlocal snapshot
+            snapshot = self._snapshot()
 
-        pass_attr_to_children(self, "tab_color")
-        pass_attr_to_children(self, "isolate")
-        pass_attr_to_children(self, "zoom")
-        pass_dict_to_children(self, "cell_style")
-        pass_dict_to_children(self, "header_style")
-        pass_dict_to_children(self, "table_style")
-
-        for sheet in self:
-            sheet._write()
+        try:
+            run(self, [("snapshot", take_snapshot, False)])
+            if profiler is not None:
+                profiler.book = snapshot
+            run(snapshot, snapshot._write_stages(mode, formulas, workers, incremental))
+        finally:
+            Globals.clear_references()
+            Globals.clear_global_references()
+
+        self.wb = snapshot.wb
+        self.style_cache = snapshot.style_cache
+        self.formula_cache = snapshot.formula_cache
 
-        self.wb.save(self.path)
         print(f"Book '{self.path}' saved")
         if self.auto_open == True:
             self._open_excel_file()
 
+        if profiler is not None:
+            return profiler.profile
+
+    def _snapshot(self) -> "Book":
+        """
+        A copy of the book for one write to resolve, lay out and write. Writing
+        changes the layout a lot, so the book itself is left as it was, and can
+        be written again, i.e. after changing some of its data.
+        """
+        memo = dict()
+        book = Book.__new__(Book)
+        book.__dict__.update(self.__dict__)
+        book.end_gap = deepcopy(self.end_gap, memo)
+        book.cell_style = Style(**self.cell_style)
+        book.header_style = Style(**self.header_style)
+        book.table_style = Style(**self.table_style)
+        list.extend(book, deepcopy(list(list.__iter__(self)), memo))
+
+        book._register_references(memo)
+        return book
+
+    def _register_references(self, memo: dict) -> None:
+        """
+        Point `Globals`' ids and headers to the elements copied into `memo`.
+        Expressions find elements by them, and each write clears them, so every
+        copy is registered again, and only what's in the book now can be found.
+        Those given a key since the last write still take priority. Elements of
+        isolated sheets keep only their global keys, as they did when created.
+        """
+        isolated = set()
+        stack = [sheet for sheet in self if getattr(sheet, "isolate", None) is True]
+        while len(stack) > 0:
+            elem = stack.pop()
+            isolated.add(id(elem))
+            if isinstance(elem, list):
+                stack.extend(list.__iter__(elem))
+
+        names = ["ids", "headers", "global_ids", "global_headers"]
+        recent = [getattr(Globals, name) for name in names]
         Globals.clear_references()
         Globals.clear_global_references()
+        for elem in list(memo.values()):
+            keys = []
+            if isinstance(elem, HasId) and elem.id is not None:
+                keys.append((elem.id, Globals.ids, Globals.global_ids))
+            if isinstance(elem, HasHeader) and elem.header is not None:
+                keys.append((elem.header, Globals.headers, Globals.global_headers))
+            for key, local, global_ in keys:
+                if id(elem) not in isolated:
+                    local[key] = elem
+                if key.startswith("G::"):
+                    global_[key] = elem
+
+        for name, keys in zip(names, recent):
+            getattr(Globals, name).update(
+                (key, memo.get(id(elem), elem)) for key, elem in keys.items()
+            )
+
+    def _write_stages(
+        self, mode: str, formulas: str, workers: int = 1, incremental: bool = False
+    ) -> list[tuple[str, Callable, bool]]:
+        """
+        Each step of :meth:`write`, in order, as ``(name, function, per_sheet)``.
+        If `per_sheet`, the function is called with each sheet in turn.
+        """
+        if workers > 1 and not can_fork():
+            warnings.warn("Sheets can't be written in parallel without 'fork'. Writing one at a time.")
+            workers = 1
+
+        def prepare() -> None:
+            pass_attr_to_children(self, "end_gap")
+            prepare_layout(self)
+
+        def write_sheet(sheet: Sheet) -> None:
+            sheet._write()
+            sheet._loc.writer.close()
+
+        if incremental is True:
+            write_stage = (
+                "write_sheets",
+                lambda: write_changed_sheets(self, self._rendered, formulas, workers),
+                False,
+            )
+        elif workers > 1 and len(self) > 1:
+            write_stage = ("write_sheets", lambda: write_sheets(self, workers), False)
+        else:
+            write_stage = ("write_sheets", write_sheet, True)
+
+        def save() -> None:
+            # Only valid while the book's elements are being written
+            self.formula_cache.clear()
+            self.wb.save(self.path)
+
+        return [
+            ("resolve_references", self._resolve_all_references, False),
+            ("prepare_layout", prepare, False),
+            ("padding", lambda sheet: sheet._resolve_padding(), True),
+            ("margin", lambda sheet: sheet._resolve_margin(), True),
+            ("background", lambda sheet: sheet._resolve_background_color(), True),
+            ("gaps", lambda sheet: sheet._resolve_gaps(), True),
+            ("set_loc", lambda: self._set_loc(stream=mode == "stream", formulas=formulas), False),
+            ("pass_attributes", lambda: pass_to_descendants(self), False),
+            write_stage,
+            ("save", save, False),
+        ]
 
     def _format_args(self, args: list) -> None:
         """
@@ -248,6 +424,7 @@ class Book(ListIndexableById):
 
         Item._resolve_all_in_container(args, Sheet)
 
+        Series, DataFrame = loaded_type("pandas", "Series"), loaded_type("pandas", "DataFrame")
         elem_type = type(self).elem_type
         for i, elem in enumerate(args):
             if isinstance(elem, elem_type):
@@ -284,20 +461,22 @@ class Book(ListIndexableById):
                     else:
                         args[i] = elem_type(Stack(*elem))
 
-    def _resolve_all_references(self) -> bool:
-        Expr._set_use_ref_for_container_recursive(self)
-
-        all_resolved = False
-        attempts = 0
-        while not all_resolved and attempts <= 5:
-            all_resolved = True
-            attempts += 1
-            if Expr._resolve_container_recursive(self) is False:
-                all_resolved = False
-            if Func._resolve_container_recursive(self) is False:
-                all_resolved = False
+    def _resolve_all_references(self) -> None:
+        """
+        Resolve every Expr and Func in the book, or raise an error explaining
+        which ones couldn't be.
+        """
+        resolver = Resolver(self)
+        if resolver.run() is False:
+            raise resolver.error()
 
-        return all_resolved
+    def _pass_to_children(self) -> None:
+        pass_attr_to_children(self, "tab_color")
+        pass_attr_to_children(self, "isolate")
+        pass_attr_to_children(self, "zoom")
+        pass_dict_to_children(self, "cell_style")
+        pass_dict_to_children(self, "header_style")
+        pass_dict_to_children(self, "table_style")
 
     def _validate_child_types(self) -> None:
         valid_types = (
@@ -313,12 +492,21 @@ class Book(ListIndexableById):
                 raise TypeError(
                     f"At write time, a Book can only hold the following types:\n{type_names}"
                 )
-            if hasattr(elem, "_validate_child_types"):
-                elem._validate_child_types()
 
-    def _set_loc(self):
+    def _set_loc(self, stream: bool = False, formulas: str = "shared"):
+        # A new workbook each time, so the same book can be written again
+        if stream is True:
+            self.wb = xl.Workbook(write_only=True)
+            writer_type = StreamSheetWriter
+        else:
+            self.wb = xl.Workbook()
+            writer_type = SheetWriter
+
+        self.style_cache = StyleCache()
+        self.formula_cache = dict()
+
         for i, sheet in enumerate(self):
-            if i == 0:
+            if i == 0 and stream is False:
                 ws = self.wb.active
             else:
                 ws = self.wb.create_sheet(f"Sheet{i+1}")
@@ -333,7 +521,8 @@ class Book(ListIndexableById):
                 )
 
             ws.title = sheet.title
-            sheet._set_loc(Loc((0, 0), ws))
+            writer = writer_type(ws, self.style_cache, self.formula_cache, formulas)
+            sheet._set_loc(Loc((0, 0), writer))
 
     def __repr__(self):
         return ""
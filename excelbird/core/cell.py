@@ -4,17 +4,16 @@ Detailed documentation and code examples coming soon.
 from __future__ import annotations
 # External
 import re
-import pandas as pd
-from typing import Any, overload
+import datetime as dt
+from typing import Any, Iterable, overload
 from copy import deepcopy
-from openpyxl.worksheet.datavalidation import DataValidation
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.styles.colors import Color
 
 # Internal main
 from excelbird._layout_references import Globals
 from excelbird._base.identifier import HasId
-from excelbird._base.styling import HasBorder
+from excelbird._base.styling import HasBorder, CellStyle
 from excelbird._base.dotdict import Style
 from excelbird._base.loc import Loc
 
@@ -25,9 +24,9 @@ from excelbird._utils.util import (
 )
 from excelbird._utils.cell_util import (
     autofit_algorithm,
+    is_blank,
     remove_paren_enclosure,
-    prefix_formulae_funcs,
-    format_formula,
+    finalize_formula,
 )
 from excelbird._utils.color_algorithms import (
     color_is_light,
@@ -40,6 +39,50 @@ from excelbird.core.function import Func
 
 cell_reference_warning_issued = False
 
+_NO_BORDER = [None, None, None, None]
+# Types of values a copied Cell can share with the original
+_IMMUTABLE = frozenset((type(None), bool, int, float, str, dt.date, dt.datetime, dt.time))
+# Key in a deepcopy memo, of Cells whose slots are still to be copied
+_COPY_QUEUE = "excelbird.Cell"
+# Keys that only change a Cell's `_style` record
+_STYLE_KEYS = frozenset(CellStyle.fields) | {"border"}
+
+
+def inheritable_items(style: dict | Style) -> tuple[tuple[str, Any, bool], ...]:
+    """
+    The items of `style` a Cell can inherit, as ``(key, value, is_border)``.
+    Cells are slotted, so there's nowhere to keep an unknown key. Nothing reads them.
+    """
+    return tuple(
+        (key, val, key == "border") for key, val in style.items() if hasattr(Cell, key)
+    )
+
+
+def inherit_style(cells: Iterable[Cell], style: dict | Style) -> None:
+    """
+    Same as ``cell._inherit_style_without_override(style)`` for each of `cells`.
+    Cells mostly share a few style records, so what each record becomes is
+    worked out once, and reused for every other cell that has it.
+    """
+    items = inheritable_items(style)
+    if len(items) == 0:
+        return
+    styled = tuple(i for i in items if i[0] in _STYLE_KEYS)
+    other = tuple(i for i in items if i[0] not in _STYLE_KEYS)
+
+    # id of a record: (the record, so the id stays valid, and what it becomes)
+    results = dict()
+    for cell in cells:
+        before = cell._style
+        result = results.get(id(before))
+        if result is None:
+            cell._inherit_items(styled)
+            results[id(before)] = (before, cell._style)
+        else:
+            cell._style = result[1]
+        if len(other) > 0:
+            cell._inherit_items(other)
+
 
 class Cell(HasId, HasBorder, CanDoMath):
     """
@@ -154,6 +197,36 @@ class Cell(HasId, HasBorder, CanDoMath):
     _dimensions = 0
     elem_type = None
 
+    # Style attributes live in a shared `CellStyle` record, not on the instance.
+    # `_key_indexes` are those of the containers it's in. See `ListIndexableById`
+    __slots__ = (
+        "_written", "_loc", "value", "dropdown", "_id", "_style", "_expr", "_func", "_key_indexes"
+    )
+
+    align_x = CellStyle.attribute("align_x")
+    align_y = CellStyle.attribute("align_y")
+    indent = CellStyle.attribute("indent")
+    center = CellStyle.attribute("center")
+    wrap = CellStyle.attribute("wrap")
+    size = CellStyle.attribute("size")
+    bold = CellStyle.attribute("bold")
+    italic = CellStyle.attribute("italic")
+    color = CellStyle.attribute("color")
+    num_fmt = CellStyle.attribute("num_fmt")
+    currency = CellStyle.attribute("currency")
+    ignore_format = CellStyle.attribute("ignore_format")
+    fill_color = CellStyle.attribute("fill_color")
+    auto_color_font = CellStyle.attribute("auto_color_font")
+    auto_shade_font = CellStyle.attribute("auto_shade_font")
+    border_top = CellStyle.attribute("border_top")
+    border_right = CellStyle.attribute("border_right")
+    border_bottom = CellStyle.attribute("border_bottom")
+    border_left = CellStyle.attribute("border_left")
+    col_width = CellStyle.attribute("col_width")
+    row_height = CellStyle.attribute("row_height")
+    merge = CellStyle.attribute("merge")
+    autofit = CellStyle.attribute("autofit")
+
     @overload
     def __new__(cls, fn: str | set, **kwargs) -> Func:
         ...
@@ -251,42 +324,52 @@ class Cell(HasId, HasBorder, CanDoMath):
         self.value = value
         self.dropdown = dropdown
         self.id = id
-        self.align_x = align_x
-        self.align_y = align_y
-        self.indent = indent
-        self.wrap = wrap
-        self.size = size
-        self.bold = bold
-        self.italic = italic
-        self.color = color
-        self.num_fmt = num_fmt
-        self.currency = currency
-        self.ignore_format = ignore_format
-        self.fill_color = fill_color
-        self.auto_color_font = auto_color_font
-        self.auto_shade_font = auto_shade_font
-        self.col_width = col_width
-        self.row_height = row_height
-        self.merge = merge
         self._expr = _expr
         self._func = _func
-        self.autofit = autofit
-        self.center = center
-
-        self._init_border(
-            border,
-            border_top,
-            border_right,
-            border_bottom,
-            border_left,
-        )
+
+        cls = type(self)
+        top, right, bottom, left = cls._parse_arg(border)
+        if border_top is not None:
+            top = cls._interpret_single_value(border_top)
+        if border_right is not None:
+            right = cls._interpret_single_value(border_right)
+        if border_bottom is not None:
+            bottom = cls._interpret_single_value(border_bottom)
+        if border_left is not None:
+            left = cls._interpret_single_value(border_left)
+
+        self._style = CellStyle.get((
+            align_x,
+            align_y,
+            indent,
+            center,
+            wrap,
+            size,
+            bold,
+            italic,
+            color,
+            num_fmt,
+            currency,
+            ignore_format,
+            fill_color,
+            auto_color_font,
+            auto_shade_font,
+            top,
+            right,
+            bottom,
+            left,
+            col_width,
+            row_height,
+            merge,
+            autofit,
+        ))
         self._inherit_style_without_override(cell_style)
 
         if isinstance(self.value, Cell):
             cell = self.value
             self.value = None
             new_dict = {
-                k: v for k, v in cell.__dict__.items() if k not in ["_id", "_loc"]
+                k: v for k, v in cell._attrs().items() if k not in ["_id", "_loc"]
             }
             for key, val in new_dict.items():
                 if getattr(self, key) is None:
@@ -341,18 +424,48 @@ class Cell(HasId, HasBorder, CanDoMath):
 
         """
         if inherit_style is True:
-            self_dict = deepcopy(self.__dict__)
+            self_dict = deepcopy(self._attrs())
             for key, val in self_dict.items():
                 if key not in kwargs and key not in ["_id", "_loc", "_expr", "_func"]:
                     kwargs[key] = val
         return Cell(_expr=[self], **kwargs)
 
+    def _attrs(self) -> dict[str, Any]:
+        """
+        Every attribute, including style, by name. Stands in for ``__dict__``,
+        which slotted Cells don't have.
+        """
+        attrs = {
+            "_written": self._written,
+            "_loc": self._loc,
+            "value": self.value,
+            "dropdown": self.dropdown,
+            "_id": self.id,
+            "_expr": self._expr,
+            "_func": self._func,
+        }
+        attrs.update(zip(CellStyle.fields, self._style))
+        return attrs
+
     def _expr_value(self) -> str | None:
         if self._expr is None:
             return None
         expr = str(self._eval_expr(self._expr))
         return remove_paren_enclosure(expr)
 
+    def _formula(self, kind: str, parts: list, loc: Loc) -> str:
+        """
+        Value to write at `loc` for the parts of an `_expr` ("expr") or `_func`
+        ("func"). A formula, unless a reference in an expr couldn't be found.
+        """
+        if kind == "func":
+            return finalize_formula("=" + self._render("func", parts, loc), loc.title_str)
+
+        value = remove_paren_enclosure(str(self._render("expr", parts, loc)))
+        if "UNKNOWN" not in value:
+            value = "=" + value
+        return finalize_formula(value, loc.title_str, functions=False)
+
     def _func_value(self) -> str | None:
         if self._func is None:
             return None
@@ -367,45 +480,38 @@ class Cell(HasId, HasBorder, CanDoMath):
 
         if self._written is True:
             raise AlreadyWrittenError(
-                "Excelbird objects can only be written to a workbook once. This is "
-                "because when `.write()` is called on a `Book`, the state of each of its elements "
-                "changes: expressions are evaluated, series headers are inserted as actual cells, "
-                "and cells with references are filled with the string locations of their references. "
-                "\nSupport for repeated writes is possible, but hasn't been implemented yet."
+                "A Cell can only be written once in each write. This one was found in "
+                "more than one place in the layout. A Book can be written again, but "
+                "each Cell must have only one location in it. To show the same cell "
+                "in more than one place, use `.ref()` to reference it instead."
             )
 
         if self._func is not None:
-            self.value = "=" + self._func_value()
-            self.value = self.value.replace(self._loc.title_str, "")
-            self.value = prefix_formulae_funcs(self.value)
-            self.value = format_formula(self.value)
+            self.value = self._formula("func", self._func, self._loc)
 
         if self._expr is not None:
-            self.value = self._expr_value()
-            if self.value is None:
-                return
-            if "UNKNOWN" not in str(self.value):
-                self.value = "=" + str(self.value)
-            self.value = self.value.replace(self._loc.title_str, "")
+            self.value = self._formula("expr", self._expr, self._loc)
 
-        if self.value is None:
+        if is_blank(self.value):
             return
 
-        try:
-            if pd.isnull(self.value):
-                return
-        except Exception:
-            # Just making sure pd.isnull doesn't throw, if given a data type it doesn't like
-            pass
+        self._write_value(self._loc, self.value)
 
-        y, x = self._loc.y, self._loc.x
-        cell = self._loc.cell
-        cell.value = self.value
+        self._written = True
+
+    def _write_value(self, loc: Loc, value: Any) -> None:
+        """
+        Write `value` at `loc`, styled with self's attributes. Lets a series
+        write values from its column store without a Cell for each of them.
+        """
+        y, x = loc.y, loc.x
+        cell = loc.cell
+        cell.value = value
 
         # if ":" in str(self.value):
         #     self._loc.ws.formula_attributes['A5'] = {'t': 'array', 'ref': "A5:A5"}
 
-        def get_dropdown() -> DataValidation | None:
+        def get_dropdown() -> str | None:
             value = self.dropdown
             if value is None:
                 return
@@ -422,8 +528,8 @@ class Cell(HasId, HasBorder, CanDoMath):
 
                 formula = None
                 if isinstance(value, (Col, Row)):
-                    formula = self._eval_expr(value.range()._expr).replace(
-                        self._loc.title_str, ""
+                    formula = finalize_formula(
+                        self._eval_expr(value.range()._expr), loc.title_str, functions=False
                     )
                 else:
                     if value._loc is None:
@@ -431,43 +537,169 @@ class Cell(HasId, HasBorder, CanDoMath):
                             "Cell reference in dropdown must be a valid Cell in workbook"
                         )
 
-                    formula = self._eval_expr([value]).replace(self._loc.title_str, "")
+                    formula = finalize_formula(
+                        self._eval_expr([value]), loc.title_str, functions=False
+                    )
 
-            if formula is None:
-                return None
+            return formula
 
-            dv = DataValidation(type="list", formula1=formula, allow_blank=True)
-            dv.add(cell)
-            return dv
+        dropdown = get_dropdown()
+        if dropdown is not None:
+            # Grouped with every other cell on the sheet that has the same list
+            loc.writer.add_dropdown(dropdown, cell.row, cell.column)
 
-        validation = get_dropdown()
-        if validation is not None:
-            self._loc.ws.add_data_validation(validation)
+        number_format = self._number_format(value)
 
-        def get_number_format():
-            if self.ignore_format is True:
-                return
+        # Cells with the same style share their openpyxl styles
+        key = (self._style, number_format)
+        styles = loc.writer.styles
+        if not styles.apply(cell, key):
+            styles.add(cell, key, self._xl_style(number_format))
 
-            if isinstance(self.num_fmt, str):
-                return self.num_fmt
+        if self.merge is not None:
+            end_row = 1 + y + self.merge[0]
+            end_column = 1 + x + self.merge[1]
+            loc.writer.merge_cells(
+                start_row=y + 1,
+                start_column=x + 1,
+                end_row=end_row,
+                end_column=end_column,
+            )
 
-            if isinstance(self.value, str):
-                return
+        if self.col_width is not None:
+            loc.column_dimensions.width = self.col_width
 
-            if isinstance(self.value, float):
-                if self.currency is True:
-                    return num_formats.accounting_float
-                return num_formats.comma_float
+        if self.autofit is True and self.col_width is None:
+            curr = loc.column_dimensions.width
+            new = autofit_algorithm(value)
+            if new > curr:
+                loc.column_dimensions.width = new
 
-            if isinstance(self.value, int):
-                if self.currency is True:
-                    return num_formats.accounting_int
-                return num_formats.comma_int
+        if self.row_height is not None:
+            loc.row_dimensions.height = self.row_height
 
-        number_format = get_number_format()
-        if number_format is not None:
-            cell.number_format = number_format
+    def _number_format(self, value: Any) -> str | None:
+        if self.ignore_format is True:
+            return
+
+        if isinstance(self.num_fmt, str):
+            return self.num_fmt
+
+        if isinstance(value, str):
+            return
+
+        if isinstance(value, float):
+            if self.currency is True:
+                return num_formats.accounting_float
+            return num_formats.comma_float
+
+        if isinstance(value, int):
+            if self.currency is True:
+                return num_formats.accounting_int
+            return num_formats.comma_int
+
+    def _write_range(self, loc: Loc, height: int, width: int, value: Any) -> None:
+        """
+        Write `value` to each cell of the `height` by `width` range starting
+        at `loc`. Same as calling `_write_value` for each of them, but the style
+        is only resolved once, and sizes are set once per row and column.
+        """
+        if height <= 0 or width <= 0:
+            return
 
+        if self.dropdown is not None or self.merge is not None:
+            # These apply to each cell's own location
+            for i in range(height):
+                for j in range(width):
+                    self._write_value(loc.shift(i, j), value)
+            return
+
+        number_format = self._number_format(value)
+        key = (self._style, number_format)
+        writer = loc.writer
+        styles = writer.styles
+        for i in range(height):
+            for j in range(width):
+                cell = writer.cell(loc.y + i + 1, loc.x + j + 1)
+                cell.value = value
+                if not styles.apply(cell, key):
+                    styles.add(cell, key, self._xl_style(number_format))
+
+        if self.col_width is not None:
+            for j in range(width):
+                loc.shift(x=j).column_dimensions.width = self.col_width
+        elif self.autofit is True:
+            new = autofit_algorithm(value)
+            for j in range(width):
+                column_dimensions = loc.shift(x=j).column_dimensions
+                if new > column_dimensions.width:
+                    column_dimensions.width = new
+
+        if self.row_height is not None:
+            for i in range(height):
+                loc.shift(y=i).row_dimensions.height = self.row_height
+
+    def _write_values(self, loc: Loc, values: list, vertical: bool) -> None:
+        """
+        Write each of `values` to its own cell, starting at `loc` and going down
+        if `vertical`, or right. Same as calling `_write_value` for each of them,
+        but the style is only resolved once for each type of value, and sizes
+        are set once per row and column.
+        """
+        if len(values) == 0:
+            return
+
+        if self.dropdown is not None or self.merge is not None:
+            # These apply to each cell's own location
+            for i, value in enumerate(values):
+                self._write_value(loc.shift(i, 0) if vertical else loc.shift(0, i), value)
+            return
+
+        writer = loc.writer
+        # Cells by value type, since number formats only depend on it
+        cells_by_type, number_formats = {}, []
+        dy, dx = (1, 0) if vertical else (0, 1)
+        row, column = loc.y + 1, loc.x + 1
+        for value in values:
+            cell = writer.cell(row, column)
+            cell.value = value
+            cells = cells_by_type.get(type(value))
+            if cells is None:
+                cells = cells_by_type[type(value)] = []
+                number_formats.append(self._number_format(value))
+            cells.append(cell)
+            row += dy
+            column += dx
+
+        styles = writer.styles
+        for cells, number_format in zip(cells_by_type.values(), number_formats):
+            key = (self._style, number_format)
+            if not styles.apply_all(cells, key):
+                styles.add(cells[0], key, self._xl_style(number_format))
+                if len(cells) > 1:
+                    styles.apply_all(cells[1:], key)
+
+        height, width = (len(values), 1) if vertical else (1, len(values))
+        if self.col_width is not None:
+            for j in range(width):
+                loc.shift(x=j).column_dimensions.width = self.col_width
+        elif self.autofit is True:
+            widths = [autofit_algorithm(value) for value in values]
+            if vertical:
+                widths = [max(widths)]
+            for j, new in enumerate(widths):
+                column_dimensions = loc.shift(x=j).column_dimensions
+                if new > column_dimensions.width:
+                    column_dimensions.width = new
+
+        if self.row_height is not None:
+            for i in range(height):
+                loc.shift(y=i).row_dimensions.height = self.row_height
+
+    def _xl_style(self, number_format: str | None) -> dict:
+        """
+        The openpyxl style objects to set on a written cell, by attribute name.
+        """
         align, font, fill, border = {}, {}, {}, {}
 
         if self.center is True:
@@ -540,42 +772,58 @@ class Cell(HasId, HasBorder, CanDoMath):
 
         border = get_border(self.border)
 
+        res = {}
+        if number_format is not None:
+            res["number_format"] = number_format
         if len(font) > 0:
-            cell.font = Font(**font)
+            res["font"] = Font(**font)
         if len(fill) > 0:
-            cell.fill = PatternFill(**fill)
+            res["fill"] = PatternFill(**fill)
         if len(border) > 0:
-            cell.border = Border(**border)
+            res["border"] = Border(**border)
         if len(align) > 0:
-            cell.alignment = Alignment(**align)
-
-        if self.merge is not None:
-            end_row = 1 + y + self.merge[0]
-            end_column = 1 + x + self.merge[1]
-            self._loc.ws.merge_cells(
-                start_row=y + 1,
-                start_column=x + 1,
-                end_row=end_row,
-                end_column=end_column,
-            )
-
-        if self.col_width is not None:
-            self._loc.column_dimensions.width = self.col_width
-
-        if self.autofit is True and self.col_width is None:
-            curr = self._loc.column_dimensions.width
-            new = autofit_algorithm(self.value)
-            if new > curr:
-                self._loc.column_dimensions.width = new
-
-        if self.row_height is not None:
-            self._loc.row_dimensions.height = self.row_height
-
-        self._written = True
+            res["alignment"] = Alignment(**align)
+        return res
 
     def _set_loc(self, loc: Loc) -> None:
         self._loc = loc
 
+    def __deepcopy__(self, memo: dict) -> Cell:
+        """
+        Only slots that can hold other elements need a deep copy. Those are
+        copied by the outermost Cell being copied, with a queue instead of
+        recursion, since a chain of expressions can be thousands of cells long.
+        """
+        new = object.__new__(type(self))
+        memo[id(self)] = new
+        new._written = self._written
+        new._loc = self._loc
+        new._id = self._id
+        new._style = self._style
+        new.value = self.value
+        new.dropdown = self.dropdown
+        new._expr = self._expr
+        new._func = self._func
+
+        queue = memo.get(_COPY_QUEUE)
+        if queue is not None:
+            queue.append(new)
+            return new
+
+        queue = memo[_COPY_QUEUE] = [new]
+        try:
+            while len(queue) > 0:
+                cell = queue.pop()
+                if type(cell.value) not in _IMMUTABLE:
+                    cell.value = deepcopy(cell.value, memo)
+                for name in ("dropdown", "_expr", "_func"):
+                    value = getattr(cell, name)
+                    if value is not None:
+                        setattr(cell, name, deepcopy(value, memo))
+        finally:
+            del memo[_COPY_QUEUE]
+        return new
+
     def __repr__(self):
         if self._expr is not None:
             return type(self).__name__ + "({...})"
@@ -584,86 +832,146 @@ class Cell(HasId, HasBorder, CanDoMath):
         return f"{type(self).__name__}({self.value})"
 
     def _eval_func(self, func: list) -> str:
-        def format_element(elem) -> str:
-            if isinstance(elem, str):
-                return elem
-
-            if isinstance(elem, (int, float)):
-                return str(elem)
+        return self._render("func", func)
 
-            if get_dimensions(elem) > 0:
-                cell_range = elem.range()._expr
-                evaluated = self._eval_expr(cell_range)
-                return remove_paren_enclosure(evaluated)
+    def _eval_expr(self, expr: list) -> str:
+        return self._render("expr", expr)
 
-            if elem._loc is not None:
-                return elem._loc.full_str
+    def _render(self, kind: str, parts: list, loc: Loc | None = None) -> str:
+        """
+        Formula string for the `parts` of an `_expr` ("expr") or `_func` ("func").
 
-            if elem._expr is not None:
-                evaluated = self._eval_expr(elem._expr)
-                return remove_paren_enclosure(evaluated)
+        Referenced cells that aren't placed in the book are expanded in place.
+        They can be shared by many formulas, like a running total, so each one's
+        string is kept for the rest of the write. Nested parts are expanded with
+        a stack instead of recursion, so long chains can't exceed the
+        recursion limit. `loc` is where it's written, if not at self's location.
+        """
+        if loc is None:
+            loc = self._loc
+        if loc is not None:
+            memo = loc.writer.formulas
+        else:
+            memo = dict()
+
+        # Each entry: kind, parts, remaining parts, rendered parts, and for
+        # nested parts, their memo key and whether to remove enclosing parens
+        stack = [(kind, parts, iter(parts), [], None, False)]
+        while True:
+            kind, parts, remaining, rendered, key, strip = stack[-1]
+            for elem in remaining:
+                if kind == "func":
+                    nested = self._render_func_part(elem)
+                else:
+                    nested = self._render_expr_part(elem)
+
+                if not isinstance(nested, tuple):
+                    rendered.append(nested)
+                    continue
+
+                nested_kind, nested_parts, nested_key, nested_strip = nested
+                if nested_key in memo:
+                    text = memo[nested_key][1]
+                    rendered.append(remove_paren_enclosure(text) if nested_strip else text)
+                    continue
+
+                stack.append(
+                    (nested_kind, nested_parts, iter(nested_parts), [], nested_key, nested_strip)
+                )
+                break
+            else:
+                if kind == "expr" and len(rendered) > 2:
+                    rendered = ["("] + rendered + [")"]
+                text = "".join(rendered)
+
+                stack.pop()
+                if key is not None:
+                    # Keep the parts alive, so their id isn't reused
+                    memo[key] = (parts, text)
+                if len(stack) == 0:
+                    return text
+                stack[-1][3].append(remove_paren_enclosure(text) if strip else text)
+
+    @staticmethod
+    def _render_func_part(elem: Any) -> str | tuple | None:
+        """
+        String for an element of a `_func`, or if it must be expanded, a tuple of
+        (kind, parts, memo key, whether to remove enclosing parens).
+        """
+        if isinstance(elem, str):
+            return elem
 
-            if elem.value is not None:
-                return str(elem.value)  # Don't put quotes around strings here
+        if isinstance(elem, (int, float)):
+            return str(elem)
 
-        res = "".join([format_element(e) for e in func])
-        return res
+        if get_dimensions(elem) > 0:
+            return ("expr", elem.range()._expr, None, True)
 
-    def _eval_expr(self, expr: list) -> str:
-        def format_element(elem) -> str:
-            if not isinstance(elem, Cell):
-                return str(elem)
+        if elem._loc is not None:
+            return elem._loc.full_str
 
-            if elem._loc is not None:
-                return elem._loc.full_str
+        if elem._expr is not None:
+            return ("expr", elem._expr, id(elem._expr), True)
 
-            if elem._expr is not None:
-                return self._eval_expr(elem._expr)
+        if elem.value is not None:
+            return str(elem.value)  # Don't put quotes around strings here
 
-            if elem._func is not None:
-                return self._eval_func(elem._func)
-            else:
-                global cell_reference_warning_issued
-
-                if elem.value is not None:
-                    # if cell_reference_warning_issued is False:
-                    #     print(
-                    #         "Warning: A cell in your book is trying to reference a cell which "
-                    #         "won't be placed in the book. The missing cell's value has been applied "
-                    #         "as a hardcoded value in the valid cell's expression."
-                    #     )
-                    #     cell_reference_warning_issued = True
-
-                    if isinstance(elem.value, str):
-                        quote_stripped_val = elem.value.strip('"')
-                        return f'"{quote_stripped_val}"'
-                    else:
-                        return str(elem.value)
+    @staticmethod
+    def _render_expr_part(elem: Any) -> str | tuple:
+        """
+        String for an element of an `_expr`, or if it must be expanded, a tuple
+        like `_render_func_part`.
+        """
+        if not isinstance(elem, Cell):
+            return str(elem)
 
-                if (
-                    cell_reference_warning_issued is False
-                    and Globals.force_valid_references is False
-                ):
-                    CellReferenceError.issue_warning()
-                    cell_reference_warning_issued = True
-                else:
-                    raise CellReferenceError()
+        if elem._loc is not None:
+            return elem._loc.full_str
 
-                return "UNKNOWN"
+        if elem._expr is not None:
+            return ("expr", elem._expr, id(elem._expr), False)
 
-        res = [format_element(e) for e in expr]
+        if elem._func is not None:
+            return ("func", elem._func, id(elem._func), False)
+        else:
+            global cell_reference_warning_issued
 
-        if len(res) > 2:
-            res = ["("] + res + [")"]
+            if elem.value is not None:
+                # if cell_reference_warning_issued is False:
+                #     print(
+                #         "Warning: A cell in your book is trying to reference a cell which "
+                #         "won't be placed in the book. The missing cell's value has been applied "
+                #         "as a hardcoded value in the valid cell's expression."
+                #     )
+                #     cell_reference_warning_issued = True
+
+                if isinstance(elem.value, str):
+                    quote_stripped_val = elem.value.strip('"')
+                    return f'"{quote_stripped_val}"'
+                else:
+                    return str(elem.value)
+
+            if (
+                cell_reference_warning_issued is False
+                and Globals.force_valid_references is False
+            ):
+                CellReferenceError.issue_warning()
+                cell_reference_warning_issued = True
+            else:
+                raise CellReferenceError()
 
-        return "".join(res)
+            return "UNKNOWN"
 
     def _inherit_style_without_override(self, new_style: dict | Style | None) -> None:
         if new_style is not None:
-            for key, val in new_style.items():
-                check_unset = lambda x: x is None
-                if key == "border":
-                    check_unset = lambda x: x == [None, None, None, None]
+            self._inherit_items(inheritable_items(new_style))
 
-                if check_unset(getattr(self, key, None)):
-                    setattr(self, key, val)
+    def _inherit_items(self, items: tuple[tuple[str, Any, bool], ...]) -> None:
+        """
+        Like `_inherit_style_without_override`, from the output of `inheritable_items`,
+        so a style given to many cells is only looked over once.
+        """
+        for key, val, is_border in items:
+            current = getattr(self, key, None)
+            if current == _NO_BORDER if is_border else current is None:
+                setattr(self, key, val)
@@ -4,7 +4,9 @@ reference page below:
 """
 from __future__ import annotations
 import re
-from typing import TypeVar
+from functools import lru_cache
+from types import CodeType
+from typing import NamedTuple, TypeVar
 
 from excelbird._layout_references import Globals
 from excelbird.styles import default_table_style
@@ -19,6 +21,106 @@ from excelbird._utils.pass_attributes import (
 
 TExpr = TypeVar("TExpr", bound="Expr")
 
+
+class _ParsedExpr(NamedTuple):
+    expr_str: str
+    keys: tuple
+    expr: str
+    is_ref: bool
+    code: CodeType | None
+
+
+# Number of distinct expression strings whose parsed form is kept
+EXPR_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=EXPR_CACHE_SIZE)
+def _parse(expr_str: str) -> _ParsedExpr:
+    """
+    Parse an expression string. The same text is often used for many Exprs,
+    so results are cached and shared between them. See `Expr.cache_info()`
+    """
+    expr_str = expr_str.strip()
+
+    if "[" not in expr_str and "]" not in expr_str:
+        expr_str = "[" + expr_str + "]"
+
+
+    # Match group for the inner contents of a square bracket enclosure
+    # that has at least one character and no brackets inside, and is NOT
+    # not ONLY digits
+    r_elem = r"\[([^\[\]]+?)\]"
+
+    match_start: list = re.findall(r"^" + r_elem, expr_str)
+
+    not_prefixed = r"[^\]\)\[\(]"
+    # For all other matches, make sure the enclosure isn't immediately
+    # preceded by a bracket or parenthese. Those should
+    # be left alone and treated as regular __getitem__ calls in python
+    match_others: list = re.findall(not_prefixed + r_elem, expr_str)
+
+    matches = match_start + match_others
+
+    for i, match in enumerate(matches):
+        match = match.strip()
+        try:
+            matches[i] = int(match)
+        except Exception:
+            try:
+                matches[i] = float(match)
+            except Exception:
+                # If match starts AND ends with double quotes, remove them.
+                # Do the same for single quotes
+                matches[i] = re.sub(r'^"(.*?)"$', r"\1", match)
+                matches[i] = re.sub(r"^'(.*?)'$", r"\1", matches[i])
+
+    refs = {match: None for match in matches}
+
+    # Now, our ref names have surrounding quotes removed, so we need
+    # to update expr_str to reflect these changes so they match
+
+    r_elem_dub_q = r'\["([^\[\]]+?)"\]'
+    r_elem_sing_q = r"\['([^\[\]]+?)'\]"
+    cap_not_prefixed = r"(" + not_prefixed + r")"
+
+    new_expr_str = re.sub(r"^" + r_elem_dub_q, r"[\1]", expr_str)
+    new_expr_str = re.sub(r"^" + r_elem_sing_q, r"[\1]", new_expr_str)
+    new_expr_str = re.sub(cap_not_prefixed + r_elem_dub_q, r"\1[\2]", new_expr_str)
+    new_expr_str = re.sub(cap_not_prefixed + r_elem_sing_q, r"\1[\2]", new_expr_str)
+
+    # Prepare expr_str to be evaluated with eval()
+    # - Replace [ref] with self.refs["""ref"""]
+    # - Triple quotes must be used since we don't know what kind of quotes, if any,
+    #   are already present in the true content of the ref name. It might have both!
+    for str_ref in [k for k in refs.keys() if not isinstance(k, (int, float))]:
+        new_expr_str = new_expr_str.replace(f"[{str_ref}]", f'self.refs["""{str_ref}"""]')
+
+    expr = new_expr_str
+
+    # Check to see if they're just referencing an object without doing
+    # calculations on it. If so, we MIGHT want to return that element's
+    # .ref() expression, instead of the element itself. Like if they just
+    # list this expression as a cell or a column, we'll want to make a cell
+    # reference to that element instead of copying it over. However, if
+    # they are referencing an element from inside a function, we want to
+    # return the referenced object itself. We'll have to let the parent
+    # container determine what to do. If it's a single element reference,
+    # we'll set `is_ref` to True right here. The parent container can then
+    # set `use_ref` to True for any standalone expressions, not inside functions.
+    is_ref = False
+    if len(refs) == 1:
+        if expr.startswith("self") and expr.endswith('"]'):
+            is_ref = True
+
+    try:
+        code = compile(expr, "<Expr>", "eval")
+    except SyntaxError:
+        # Raised with the expression string when evaluated
+        code = None
+
+    return _ParsedExpr(expr_str, tuple(refs), expr, is_ref, code)
+
+
 class Expr(CanDoMath):
     """
     Reference elements in parent container by name or index in a string
@@ -92,91 +194,22 @@ class Expr(CanDoMath):
     ) -> None:
         if isinstance(expr_str, set):
             expr_str = str(expr_str.pop())
-        
-        expr_str = expr_str.strip()
-
-        if "[" not in expr_str and "]" not in expr_str:
-            expr_str = "[" + expr_str + "]"
-
-
-        # Match group for the inner contents of a square bracket enclosure
-        # that has at least one character and no brackets inside, and is NOT
-        # not ONLY digits
-        r_elem = r"\[([^\[\]]+?)\]"
-
-        match_start: list = re.findall(r"^" + r_elem, expr_str)
 
-        not_prefixed = r"[^\]\)\[\(]"
-        # For all other matches, make sure the enclosure isn't immediately
-        # preceded by a bracket or parenthese. Those should
-        # be left alone and treated as regular __getitem__ calls in python
-        match_others: list = re.findall(not_prefixed + r_elem, expr_str)
-
-        matches = match_start + match_others
-
-        for i, match in enumerate(matches):
-            match = match.strip()
-            try:
-                matches[i] = int(match)
-            except Exception:
-                try:
-                    matches[i] = float(match)
-                except Exception:
-                    # If match starts AND ends with double quotes, remove them.
-                    # Do the same for single quotes
-                    matches[i] = re.sub(r'^"(.*?)"$', r"\1", match)
-                    matches[i] = re.sub(r"^'(.*?)'$", r"\1", matches[i])
-
-        refs = {match: None for match in matches}
-
-        # Now, our ref names have surrounding quotes removed, so we need
-        # to update expr_str to reflect these changes so they match
-
-        r_elem_dub_q = r'\["([^\[\]]+?)"\]'
-        r_elem_sing_q = r"\['([^\[\]]+?)'\]"
-        cap_not_prefixed = r"(" + not_prefixed + r")"
-
-        new_expr_str = re.sub(r"^" + r_elem_dub_q, r"[\1]", expr_str)
-        new_expr_str = re.sub(r"^" + r_elem_sing_q, r"[\1]", new_expr_str)
-        new_expr_str = re.sub(cap_not_prefixed + r_elem_dub_q, r"\1[\2]", new_expr_str)
-        new_expr_str = re.sub(cap_not_prefixed + r_elem_sing_q, r"\1[\2]", new_expr_str)
-
-        # Prepare expr_str to be evaluated with eval()
-        # - Replace [ref] with self.refs["""ref"""]
-        # - Triple quotes must be used since we don't know what kind of quotes, if any,
-        #   are already present in the true content of the ref name. It might have both!
-        for str_ref in [k for k in refs.keys() if not isinstance(k, (int, float))]:
-            new_expr_str = new_expr_str.replace(f"[{str_ref}]", f'self.refs["""{str_ref}"""]')
-
-        expr = new_expr_str
-
-        # Check to see if they're just referencing an object without doing
-        # calculations on it. If so, we MIGHT want to return that element's
-        # .ref() expression, instead of the element itself. Like if they just
-        # list this expression as a cell or a column, we'll want to make a cell
-        # reference to that element instead of copying it over. However, if
-        # they are referencing an element from inside a function, we want to
-        # return the referenced object itself. We'll have to let the parent
-        # container determine what to do. If it's a single element reference,
-        # we'll set `is_ref` to True right here. The parent container can then
-        # set `use_ref` to True for any standalone expressions, not inside functions.
+        parsed = _parse(expr_str)
         use_ref = False
-        is_ref = False
-        if len(refs) == 1:
-            if expr.startswith("self") and expr.endswith('"]'):
-                is_ref = True
 
         if cell_style is None: cell_style = dict()
         if header_style is None: header_style = dict()
         if table_style is None or table_style is False: table_style = dict()
         elif table_style is True: table_style = default_table_style
 
-        self.refs = refs
-        self._is_ref = is_ref
+        self.refs = {key: None for key in parsed.keys}
+        self._is_ref = parsed.is_ref
         self._use_ref = use_ref
 
-        self.expr = expr
-        self.expr_str = expr_str
+        self.expr = parsed.expr
+        self.expr_str = parsed.expr_str
+        self._code = parsed.code
         self.id = id
 
         self.header = header
@@ -195,6 +228,26 @@ class Expr(CanDoMath):
                 self.kwargs[k] = v
         return self
 
+    @staticmethod
+    def cache_info():
+        """
+        Statistics for the cache of parsed expression strings, shared by
+        every Expr in the process.
+
+        Returns
+        -------
+        namedtuple
+            ``hits``, ``misses``, ``maxsize`` and ``currsize``
+        """
+        return _parse.cache_info()
+
+    @staticmethod
+    def cache_clear() -> None:
+        """
+        Empty the cache of parsed expression strings.
+        """
+        _parse.cache_clear()
+
     def _refs_resolved(self) -> bool:
         """
         Whether all references are resolved
@@ -213,7 +266,7 @@ class Expr(CanDoMath):
             raise ValueError("All references must be resolved before calling .eval()")
 
         try:
-            res = eval(self.expr)
+            res = eval(self.expr if self._code is None else self._code)
         except Exception as e:
             raise ExpressionExecutionError(e, self.expr)
 
@@ -282,45 +335,6 @@ class Expr(CanDoMath):
         
         return self._refs_resolved()
     
-    @classmethod
-    def _resolve_container_recursive(cls, container: list) -> bool:
-        """
-        For each Expr element, try to resolve its references. If all references
-        were resolved, it's replaced with its evaluated form.
-
-        Returns True if all expressions in the container were resolved
-
-        Mutates inplace: `container`
-        """
-        all_expressions_resolved = True
-
-        for i, elem in enumerate(container):
-            if isinstance(elem, cls):
-
-                if elem._attempt_to_resolve(container) is True:
-                    container[i] = elem._eval()
-                else:
-                    all_expressions_resolved = False
-
-            elif isinstance(elem, list):
-                if cls._resolve_container_recursive(elem) is False:
-                    all_expressions_resolved = False
-
-        return all_expressions_resolved
-    
-    @classmethod
-    def _set_use_ref_for_container_recursive(cls, container: list) -> None:
-        """
-        Tells all expressions in a container to use references.
-        Mutates inplace: `container`
-        """
-        for elem in container:
-            if isinstance(elem, cls):
-                if elem._is_ref is True:
-                    elem._use_ref = True
-            elif isinstance(elem, list):
-                cls._set_use_ref_for_container_recursive(elem)
-    
     def __repr__(self):
         return f"{type(self).__name__}(...)"
 
@@ -3,8 +3,6 @@ Detailed documentation and code examples coming soon.
 """
 from __future__ import annotations
 # External
-from pandas import Series, DataFrame, concat
-from numpy import ndarray
 from typing import Any, Iterable, overload
 from copy import deepcopy
 import re
@@ -16,11 +14,13 @@ from excelbird._base.styling import HasBorder
 from excelbird.core.item import Item
 from excelbird._base.dotdict import Style
 from excelbird._base.loc import Loc
+from excelbird._base.writer import next_table_name
 from excelbird._base.math import CanDoMath, elem_math
 
 from excelbird._utils.util import (
     get_dimensions,
     init_from_same_dimension_type,
+    loaded_type,
 )
 from excelbird._utils.argument_parsing import (
     combine_args_and_children_to_list,
@@ -32,6 +32,7 @@ from excelbird._utils.argument_parsing import (
 from excelbird._utils.pass_attributes import (
     pass_dict_to_children,
 )
+from excelbird._utils.cell_util import finalize_formula
 from excelbird._utils.validation import (
     require_each_element_to_be_cls_type,
     ensure_value_is_not_number,
@@ -335,6 +336,134 @@ class _Frame(CanDoMath, ListIndexableById, HasId, HasBorder):
                 new.cell_style[key] = val
         return new
 
+    @classmethod
+    def from_iter(cls, chunks: Iterable, headers: list | None = None, **kwargs):
+        """
+        Build a frame from data read one chunk at a time, like from a file too
+        large to load at once. Each chunk's values go straight to the children's
+        column stores, so only one chunk is ever held in another form.
+
+        Parameters
+        ----------
+        chunks : Iterable
+            Each a :class:`pd.DataFrame <pandas.DataFrame>` with the same columns,
+            or a list of rows (each a list or tuple) of the same length. Columns
+            of later DataFrames are cast to the dtypes of the first, where
+            possible.
+        headers : list, optional
+            A header for each child. Defaults to the columns of the first
+            DataFrame chunk.
+        **kwargs : Any
+            Passed to the constructor, like ``schema``, ``border`` or ``cell_style``.
+
+        Returns
+        -------
+        :class:`Self`
+
+        Notes
+        -----
+        Use :meth:`from_csv` and :meth:`from_parquet` to read files in chunks.
+
+        .. code-block::
+
+            chunks = pd.read_sql(query, conn, chunksize=50_000)
+            frame = Frame.from_iter(chunks, schema=schema, border=True)
+
+        """
+        DataFrame = loaded_type("pandas", "DataFrame")
+        children, dtypes = None, None
+        for chunk in chunks:
+            if isinstance(chunk, DataFrame):
+                if headers is None:
+                    headers = list(chunk.columns)
+                columns = [chunk.iloc[:, i] for i in range(chunk.shape[1])]
+            else:
+                columns = list(zip(*chunk))
+                if len(columns) == 0:
+                    continue
+
+            if children is None:
+                if headers is None:
+                    headers = [None] * len(columns)
+                children = [cls.elem_type(header=header) for header in headers]
+            if len(columns) != len(children):
+                raise ValueError(
+                    f"Each chunk must have {len(children)} columns. Got one with {len(columns)}"
+                )
+
+            if not isinstance(chunk, DataFrame):
+                for child, values in zip(children, columns):
+                    child._extend_values(values)
+                continue
+
+            if dtypes is None:
+                # Every chunk is given these, where its values allow it, so a
+                # column's number format doesn't change with the chunk size
+                dtypes = [sr.dtype for sr in columns]
+            for child, sr, dtype in zip(children, columns, dtypes):
+                if sr.dtype != dtype:
+                    try:
+                        sr = sr.astype(dtype)
+                    except (TypeError, ValueError):
+                        pass
+                child._extend_values(sr.array, sr.dtype)
+
+        return cls(*(children or []), **kwargs)
+
+    @classmethod
+    def from_csv(cls, path: str, chunksize: int = 100_000, read_kwargs: dict | None = None, **kwargs):
+        """
+        Build a frame from a csv file, read `chunksize` rows at a time with
+        :func:`pandas.read_csv`. Uses less memory than reading the whole file
+        into a DataFrame first. See :meth:`from_iter`.
+
+        Parameters
+        ----------
+        path : str
+            Path or buffer of the csv file.
+        chunksize : int, default 100_000
+            Rows to read at once.
+        read_kwargs : dict, optional
+            Passed to :func:`pandas.read_csv`, like ``usecols`` or ``dtype``.
+        **kwargs : Any
+            Passed to the constructor, like ``schema``, ``border`` or ``cell_style``.
+
+        Returns
+        -------
+        :class:`Self`
+        """
+        from pandas import read_csv
+
+        with read_csv(path, chunksize=chunksize, **(read_kwargs or {})) as chunks:
+            return cls.from_iter(chunks, **kwargs)
+
+    @classmethod
+    def from_parquet(cls, path: str, chunksize: int = 100_000, columns: list[str] | None = None, **kwargs):
+        """
+        Build a frame from a parquet file, read `chunksize` rows at a time.
+        Requires ``pyarrow``. See :meth:`from_iter`.
+
+        Parameters
+        ----------
+        path : str
+            Path or buffer of the parquet file.
+        chunksize : int, default 100_000
+            Rows to read at once.
+        columns : list of str, optional
+            Only read these columns. Defaults to all of them.
+        **kwargs : Any
+            Passed to the constructor, like ``schema``, ``border`` or ``cell_style``.
+
+        Returns
+        -------
+        :class:`Self`
+        """
+        from pyarrow.parquet import ParquetFile
+
+        file = ParquetFile(path)
+        batches = file.iter_batches(batch_size=chunksize, columns=columns)
+        return cls.from_iter((batch.to_pandas() for batch in batches), **kwargs)
+
     def range(self, include_headers: bool = False):
         """
         Get a reference to the entire range of the frame, instead of a vector of
@@ -360,6 +489,7 @@ class _Frame(CanDoMath, ListIndexableById, HasId, HasBorder):
 
     def _format_args(self, args: list) -> None:
         self._explode_all_2d_iterables(args)
+        Series, ndarray = loaded_type("pandas", "Series"), loaded_type("numpy", "ndarray")
         convert_all_to_type(args, (Series, tuple, ndarray), type(self).elem_type)
         convert_all_to_type(args, list, type(self).elem_type, strict=True)
         convert_all_to_type(args, set, Expr)
@@ -370,6 +500,8 @@ class _Frame(CanDoMath, ListIndexableById, HasId, HasBorder):
                 args[i] = type(self).elem_type(elem)
 
     def _explode_all_2d_iterables(self, args: list) -> None:
+        Series, DataFrame = loaded_type("pandas", "Series"), loaded_type("pandas", "DataFrame")
+        ndarray = loaded_type("numpy", "ndarray")
         for i, elem in enumerate(args):
             if isinstance(elem, DataFrame):
                 df = args.pop(i)
@@ -410,15 +542,6 @@ class _Frame(CanDoMath, ListIndexableById, HasId, HasBorder):
                         elem.fill = True
                         elem.kwargs["fill_color"] = self.background_color
 
-    def _key_to_idx(self, key: str | int) -> int:
-        try:
-            return super()._key_to_idx(key)
-        except (KeyError, IndexError):
-            if key in self.headers:
-                return self.headers.index(key)
-
-            raise KeyError(f"Invalid key, {key}")
-
     def __getitem__(self, key):
         if isinstance(key, (int, str, slice)):
             return super().__getitem__(key)
@@ -435,7 +558,7 @@ class _Frame(CanDoMath, ListIndexableById, HasId, HasBorder):
         return type(self)(*new_elements, **new_dict)
 
     def __setitem__(self, key, val) -> None:
-        if isinstance(key, int):
+        if isinstance(key, (int, slice)):
             return super().__setitem__(key, val)
         if isinstance(val, Func):
             val.kwargs['header'] = key
@@ -453,7 +576,7 @@ class _Frame(CanDoMath, ListIndexableById, HasId, HasBorder):
         offset = self._starting_offset()
         for elem in self:
             elem._set_loc(
-                Loc((self._loc.y + offset.y, self._loc.x + offset.x), self._loc.ws)
+                self._loc.shift(offset.y, offset.x)
             )
             offset = self._inc_offset(offset, elem)
 
@@ -490,18 +613,16 @@ class _Frame(CanDoMath, ListIndexableById, HasId, HasBorder):
                     f"At write time, a {cls_name} can only hold {elem_type_name}s or Gaps. "
                     "To arrange mixed types, place them in a Stack or VStack"
                 )
-            if hasattr(elem, "_validate_child_types"):
-                elem._validate_child_types()
-
-    def _write(self) -> None:
-        require_each_element_to_be_cls_type(self)
-        self._apply_border()
 
+    def _pass_to_children(self) -> None:
         # Safely set each style to the element's header style, if it hasn't already
         # been set.
         pass_dict_to_children(self, "header_style")
         pass_dict_to_children(self, "cell_style")
 
+    def _write(self) -> None:
+        require_each_element_to_be_cls_type(self)
+        self._apply_border()
         self._apply_sizes()
 
         for elem in self:
@@ -619,10 +740,10 @@ class Frame(_Frame):
         import openpyxl.worksheet.table as xl_tbl
 
         style = self.table_style
-        cell_range = (
-            self.range(include_headers=True)
-            ._expr_value()
-            .replace(self._loc.title_str, "")
+        cell_range = finalize_formula(
+            self.range(include_headers=True)._expr_value(),
+            self._loc.title_str,
+            functions=False,
         )
         ws = self._loc.ws
 
@@ -643,16 +764,11 @@ class Frame(_Frame):
             try:
                 table = xl_tbl.Table(displayName=name, ref=cell_range)
                 table.tableStyleInfo = xl_tbl.TableStyleInfo(**style)
-                ws.add_table(table)
+                self._loc.writer.add_table(table)
                 valid_table_name = True
             except Exception as e:
                 err_msg = e
-                name_and_num = re.search(r"(.+)(\d+)", name)
-                if name_and_num is None:
-                    name += "1"
-                else:
-                    label, num = name_and_num.groups()
-                    name = f"{label}{int(num)+1}"
+                name = next_table_name(name)
 
         if valid_table_name is False:
             raise ValueError(
@@ -666,6 +782,8 @@ class Frame(_Frame):
         return self.height
 
     def _repr_html_(self):
+        from pandas import Series, concat
+
         elements = [
             Series(
                 list(e) if isinstance(e, list) else [e] + [""],
@@ -687,13 +805,12 @@ class Frame(_Frame):
 
     @staticmethod
     def _inc_offset(offset: Loc, elem: Any) -> Loc:
-        offset.x += elem.width
-        return offset
+        return offset.shift(x=elem.width)
 
     def _starting_offset(self) -> Loc:
-        offset = Loc((0, 0), self._loc.ws)
+        offset = Loc((0, 0), self._loc.writer)
         if getattr(self, "_header", None) is not None:
-            offset.x += 1
+            offset = offset.shift(x=1)
         return offset
 
 
@@ -727,6 +844,8 @@ class VFrame(_Frame):
         return self.width
 
     def _repr_html_(self):
+        from pandas import Series, DataFrame
+
         max_len = max([len(e) if isinstance(e, _Series) else 1 for e in self] + [0])
         elements = [
             Series(
@@ -752,13 +871,12 @@ class VFrame(_Frame):
 
     @staticmethod
     def _inc_offset(offset: Loc, elem: Any) -> Loc:
-        offset.y += elem.height
-        return offset
+        return offset.shift(y=elem.height)
 
     def _starting_offset(self) -> Loc:
-        offset = Loc((0, 0), self._loc.ws)
+        offset = Loc((0, 0), self._loc.writer)
         if getattr(self, "_header", None) is not None:
-            offset.y += 1
+            offset = offset.shift(y=1)
         return offset
 
 
@@ -311,6 +311,15 @@ class Func(CanDoMath):
                     self.inner[i] = self.res_type(
                         *[ frame[0][k] >> frame[-1][k] for k in range(res_length) ]
                     )
+            from excelbird.core.series import _Series
+            # One formula for every row, instead of a Cell for each
+            if "sep" not in self.kwargs and all(
+                isinstance(item, _Series) for item in self.inner
+                if get_dimensions(item) == 1
+            ):
+                res = self.res_type._derived("func", self.inner, **self.kwargs)
+                if res is not None:
+                    return res
             return self.res_type(
                 *[
                     elem_type(_func=[item[i] if get_dimensions(item) == 1 else item for item in self.inner])
@@ -347,32 +356,6 @@ class Func(CanDoMath):
 
         return self._all_resolved()
 
-    @classmethod
-    def _resolve_container_recursive(cls, container: list) -> bool:
-        """
-        For each _DelayedFunc in a container, attempt to resolve each of
-        its expressions.
-
-        Returns True if all were resolved
-
-        Mutates inplace: `container`
-        """
-        all_dfuncs_resolved = True
-
-        for i, elem in enumerate(container):
-            if isinstance(elem, cls):
-
-                if elem._attempt_to_resolve(container) is True:
-                    container[i] = elem._get_function(type(container))
-                else:
-                    all_dfuncs_resolved = False
-
-            elif isinstance(elem, list):
-                if cls._resolve_container_recursive(elem) is False:
-                    all_dfuncs_resolved = False
-
-        return all_dfuncs_resolved
-
     def __repr__(self):
         if self.res_type is not None:
             return f"{type(self).__name__}({self.res_type.__name__}...)"
@@ -4,6 +4,7 @@ reference page below:
 """
 from __future__ import annotations
 from copy import deepcopy
+from inspect import signature
 
 class Gap(int):
     """
@@ -95,11 +96,19 @@ class Gap(int):
 
         Mutates inplace: `container`
         """
-        for i, elem in enumerate(container):
+        if not any(isinstance(elem, cls) for elem in list.__iter__(container)):
+            return
+
+        new_elements = []
+        for elem in list.__iter__(container):
             if isinstance(elem, cls):
-                gap = container.pop(i)
-                for _ in range(gap):
-                    container.insert(i, val_type(gap.fill_val, **gap.kwargs))
+                new_elements.extend(
+                    val_type(elem.fill_val, **elem.kwargs) for _ in range(elem)
+                )
+            else:
+                new_elements.append(elem)
+
+        container[:] = new_elements
 
     @classmethod
     def _explode_all_to_series(
@@ -111,18 +120,24 @@ class Gap(int):
 
         Mutates inplace: `container`
         """
+        if not any(isinstance(elem, cls) for elem in container):
+            return
+
         val_type = series_type.elem_type
-        for i, elem in enumerate(container):
+        new_elements = []
+        for elem in container:
             if isinstance(elem, cls):
-                gap = container.pop(i)
-                for _ in range(gap):
-                    container.insert(
-                        i,
-                        series_type(
-                            *[val_type(gap.fill_val) for _ in range(series_length)],
-                            **gap.kwargs,
-                        ),
+                new_elements.extend(
+                    series_type(
+                        *[val_type(elem.fill_val) for _ in range(series_length)],
+                        **elem.kwargs,
                     )
+                    for _ in range(elem)
+                )
+            else:
+                new_elements.append(elem)
+
+        container[:] = new_elements
 
     @classmethod
     def _convert_all_to_frames(
@@ -134,10 +149,24 @@ class Gap(int):
 
         Mutates inplace: `container`
         """
+        from excelbird.core.blank import BlankRegion
+        from excelbird.core.series import Row
+
         series_type = frame_type.elem_type
         val_type = series_type.elem_type
+        frame_params = signature(frame_type.__init__).parameters
         for i, elem in enumerate(container):
             if isinstance(elem, cls):
+                if not any(k in frame_params for k in elem.kwargs):
+                    # Every kwarg would go to the frame's cell_style, so each
+                    # cell would be the same
+                    size = (series_length, int(elem))
+                    if issubclass(series_type, Row):
+                        size = (int(elem), series_length)
+                    container[i] = BlankRegion(
+                        *size, elem.fill_val, frame_type, cell_style=elem.kwargs
+                    )
+                    continue
                 container[i] = frame_type(
                     *[
                         series_type(*[val_type(elem.fill_val) for _ in range(series_length)])
@@ -0,0 +1,272 @@
+"""
+Resolves the references of each :class:`Expr` and :class:`Func` in a layout.
+
+Every Expr and Func is collected once. When one can't be resolved yet, it waits
+on the keys it's missing, and is only attempted again once an element that
+could provide one of them has been evaluated. So each is evaluated right after
+whatever it depends on, and the work stays linear in the size of the layout.
+"""
+from __future__ import annotations
+from collections import deque
+from typing import Any
+
+from excelbird._layout_references import Globals
+from excelbird._base.container import _elem_id, _elem_header
+from excelbird.exceptions import ExpressionResolutionError, CircularReferenceError
+from excelbird.core.expression import Expr
+from excelbird.core.function import Func
+
+
+class _Pending:
+    """
+    An Expr or Func waiting to be resolved, and where it's placed.
+    """
+
+    __slots__ = ("node", "container", "index", "missing", "generation", "queued")
+
+    def __init__(self, node: Expr | Func, container: list, index: int) -> None:
+        self.node = node
+        self.container = container
+        self.index = index
+        self.missing = []
+        self.generation = None
+        self.queued = True
+
+    def exprs(self) -> list[Expr]:
+        if isinstance(self.node, Expr):
+            return [self.node]
+        return self.node._exprs()
+
+    def provides(self) -> list:
+        """
+        The keys the evaluated element will be found by.
+        """
+        node = self.node
+        if isinstance(node, Expr):
+            keys = [node.id, node.header]
+        else:
+            keys = [node.kwargs.get("id"), node.kwargs.get("header")]
+        return [k for k in keys if k is not None]
+
+    def describe(self) -> str:
+        node = self.node
+        if isinstance(node, Expr):
+            text = f"Expr('{node.expr_str}')"
+        else:
+            inner = "".join(
+                elem if isinstance(elem, str)
+                else "{" + elem.expr_str + "}" if isinstance(elem, Expr)
+                else f"<{type(elem).__name__}>"
+                for elem in node.inner
+            )
+            text = f"Func('{inner}')"
+
+        keys = self.provides()
+        if len(keys) > 0:
+            text += " (" + ", ".join(f"'{key}'" for key in keys) + ")"
+
+        parent = type(self.container).__name__
+        key = _elem_id(self.container) or _elem_header(self.container)
+        if key is not None:
+            parent += f" '{key}'"
+        return f"{text} at index {self.index} of {parent}"
+
+
+class Resolver:
+    """
+    Resolves each Expr and Func in `container` and replaces it with the element it
+    evaluates to.
+
+    Parameters
+    ----------
+    container : list
+        The root container
+    nested : bool, default True
+        Whether to include those inside child containers, instead of only
+        `container`'s direct children
+
+    Mutates inplace: `container`
+    """
+
+    def __init__(self, container: list, nested: bool = True) -> None:
+        self.container = container
+        self.nested = nested
+        self.pending = []
+        self._waiting = dict()
+
+        exprs, funcs = self._collect(container)
+        # Same order as before: every Expr, then every Func
+        self._queue = deque(exprs + funcs)
+        self.pending = list(self._queue)
+
+    def _collect(self, container: list) -> tuple[list, list]:
+        """
+        Every Expr and Func in `container`, in layout order. Standalone
+        expressions that only reference an element will use a reference to it.
+        """
+        exprs, funcs = [], []
+        # Iterate the raw lists, so stored values aren't turned into Cells
+        stack = [(container, enumerate(list.__iter__(container)))]
+        while len(stack) > 0:
+            parent, elems = stack[-1]
+            for i, elem in elems:
+                if isinstance(elem, Expr):
+                    if elem._is_ref is True:
+                        elem._use_ref = True
+                    exprs.append(_Pending(elem, parent, i))
+                elif isinstance(elem, Func):
+                    funcs.append(_Pending(elem, parent, i))
+                elif self.nested and isinstance(elem, list):
+                    stack.append((elem, enumerate(list.__iter__(elem))))
+                    break
+            else:
+                stack.pop()
+
+        return exprs, funcs
+
+    def run(self) -> bool:
+        """
+        Returns True if everything was resolved. Otherwise, `pending` holds
+        what couldn't be, and `error()` explains why.
+        """
+        while True:
+            while len(self._queue) > 0:
+                self._attempt(self._queue.popleft())
+
+            self.pending = [p for p in self.pending if p.node is not None]
+            if len(self.pending) == 0:
+                return True
+
+            # An element can also be found by a key that was set some other
+            # way, like on a child of an evaluated element. If any were
+            # set since an attempt, try that one again.
+            for p in self.pending:
+                if p.generation != Globals.key_generation:
+                    p.queued = True
+                    self._queue.append(p)
+
+            if len(self._queue) == 0:
+                return False
+
+    def _attempt(self, p: _Pending) -> None:
+        p.queued = False
+        if p.node is None:
+            return
+
+        index = self._locate(p)
+        if index is None:
+            # No longer in the layout
+            p.node = None
+            return
+
+        p.generation = Globals.key_generation
+        node = p.node
+        if node._attempt_to_resolve(p.container) is False:
+            p.missing = [
+                key for expr in p.exprs() for key, ref in expr.refs.items() if ref is None
+            ]
+            for key in p.missing:
+                self._waiting.setdefault(self._wait_key(p, key), []).append(p)
+            return
+
+        if isinstance(node, Expr):
+            res = node._eval()
+        else:
+            res = node._get_function(type(p.container))
+
+        keys = p.provides() + [_elem_id(res), _elem_header(res)]
+        p.container[index] = res
+        p.node = None
+
+        if self.nested and isinstance(res, list):
+            exprs, funcs = self._collect(res)
+            for new in exprs + funcs:
+                self.pending.append(new)
+                self._queue.append(new)
+
+        wake = [("slot", id(p.container), index)]
+        wake.extend(("key", key) for key in keys if key is not None)
+        for wait_key in wake:
+            for waiting in self._waiting.pop(wait_key, []):
+                if waiting.node is not None and waiting.queued is False:
+                    waiting.queued = True
+                    self._queue.append(waiting)
+
+    @staticmethod
+    def _locate(p: _Pending) -> int | None:
+        """
+        Index of the node in its container. Other elements could have been
+        added or removed since it was collected.
+        """
+        container = p.container
+        if p.index < len(container) and list.__getitem__(container, p.index) is p.node:
+            return p.index
+        for i, elem in enumerate(list.__iter__(container)):
+            if elem is p.node:
+                p.index = i
+                return i
+        return None
+
+    @staticmethod
+    def _wait_key(p: _Pending, key: Any) -> tuple:
+        if isinstance(key, int):
+            index = key if key >= 0 else key + len(p.container)
+            return ("slot", id(p.container), index)
+        return ("key", key)
+
+    def error(self) -> ExpressionResolutionError:
+        """
+        An error describing each expression that couldn't be resolved, and which
+        of its references are missing or circular.
+        """
+        providers = dict()
+        for p in self.pending:
+            providers[("slot", id(p.container), p.index)] = p
+            for key in p.provides():
+                providers.setdefault(("key", key), p)
+
+        def depends_on(p: _Pending) -> list[_Pending]:
+            deps = [providers.get(self._wait_key(p, key)) for key in p.missing]
+            return [d for d in deps if d is not None]
+
+        cycles = []
+        state = dict()  # id(pending) -> 1 while visiting, 2 when done
+        for start in self.pending:
+            if id(start) in state:
+                continue
+            path = [start]
+            state[id(start)] = 1
+            branches = [iter(depends_on(start))]
+            while len(branches) > 0:
+                nxt = next(branches[-1], None)
+                if nxt is None:
+                    state[id(path.pop())] = 2
+                    branches.pop()
+                elif state.get(id(nxt)) == 1:
+                    cycles.append(path[path.index(nxt):] + [nxt])
+                elif id(nxt) not in state:
+                    state[id(nxt)] = 1
+                    path.append(nxt)
+                    branches.append(iter(depends_on(nxt)))
+
+        lines = []
+        if len(cycles) > 0:
+            lines.append("Circular references between expressions:")
+            for cycle in cycles:
+                lines.append("    " + "\n    -> ".join(p.describe() for p in cycle))
+
+        lines.append("The following expressions could not be resolved:")
+        for p in self.pending:
+            reasons = []
+            for key in p.missing:
+                if self._wait_key(p, key) in providers:
+                    reasons.append(f"'{key}' (belongs to another unresolved expression)")
+                else:
+                    reasons.append(f"'{key}' (not found)")
+            lines.append(f"    {p.describe()}: missing {', '.join(reasons)}")
+
+        if len(cycles) > 0:
+            return CircularReferenceError("\n".join(lines))
+        return ExpressionResolutionError(
+            "\n".join(lines) + "\n" + ExpressionResolutionError.default_msg
+        )
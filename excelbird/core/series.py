@@ -17,41 +17,129 @@ A Series' :attr:`header <excelbird._Series.header>` attribute is a string which
 """
 # External
 from __future__ import annotations
-from pandas import Series
-from numpy import ndarray
 from typing import Iterable, Any, overload
 from copy import copy, deepcopy
+from itertools import islice
+from operator import is_
+from openpyxl.formula.tokenizer import TokenizerError
+from openpyxl.formula.translate import Translator
+from openpyxl.worksheet.formula import ArrayFormula
 
-from excelbird._base.container import ListIndexableById
+from excelbird._base.container import ListIndexableById, Stored, Derived, ColumnStore, _index_keys
 from excelbird._base.identifier import HasId
 from excelbird._base.identifier import HasHeader
 from excelbird._base.styling import HasBorder
 from excelbird._base.dotdict import Style
 from excelbird._base.loc import Loc
+from excelbird._base.writer import SharedFormula
 from excelbird._base.math import CanDoMath, elem_math
 
 from excelbird._utils.util import (
     get_dimensions,
     get_idx,
     init_from_same_dimension_type,
+    loaded_type,
 )
 from excelbird._utils.validation import (
     require_each_element_to_be_cls_type,
     ensure_value_is_not_number,
 )
+from excelbird._utils.cell_util import is_blank, autofit_algorithm
 from excelbird._utils.argument_parsing import (
     combine_args_and_children_to_list,
     convert_all_to_type,
     move_remaining_kwargs_to_dict,
 )
 
-from excelbird.core.cell import Cell
+from excelbird.core.cell import Cell, inherit_style
 from excelbird.core.expression import Expr
 from excelbird.core.function import Func
 from excelbird.core.gap import Gap
 from excelbird.core.item import Item
 
 
+# `Derived` placeholders are immutable, so one is made for each row, and
+# shared by every series made by elementwise math.
+_derived_rows: list[Derived] = []
+
+
+def _get_derived_rows(count: int) -> list[Derived]:
+    if len(_derived_rows) < count:
+        _derived_rows.extend(map(Derived, range(len(_derived_rows), count)))
+    return _derived_rows[:count]
+
+
+def _empty_formula(cell: Cell, series: _Series) -> list:
+    """
+    Give `cell` an empty `_expr` or `_func`, like the formula of `series`'
+    `Derived` rows, and return it.
+    """
+    parts = []
+    if series._store.formula[0] == "func":
+        cell._func = parts
+    else:
+        cell._expr = parts
+    return parts
+
+
+class _Operand(list):
+    """
+    The elements of a series that elementwise math was done with, as they were
+    at the time. A `Derived` element of the result refers to them by row.
+    """
+
+    __slots__ = ("series", "mutations", "header_written", "_positions")
+
+    def __init__(self, series: _Series) -> None:
+        # The raw list, so stored values aren't turned into Cells
+        super().__init__(list.__iter__(series))
+        self.series = series
+        self.mutations = getattr(series, "_mutations", 0)
+        self.header_written = series.header_written
+        # (series mutations, {id(element): index}), once rearranged
+        self._positions = None
+
+    def __deepcopy__(self, memo: dict) -> _Operand:
+        new = list.__new__(_Operand)
+        memo[id(self)] = new
+        list.extend(new, [deepcopy(e, memo) for e in list.__iter__(self)])
+        new.series = deepcopy(self.series, memo)
+        new.mutations = self.mutations
+        new.header_written = self.header_written
+        # Ids of the original elements
+        new._positions = None
+        return new
+
+    def position(self, row: int) -> int | None:
+        """
+        Current index in the series of the element at `row`, or None if it
+        can't be found.
+        """
+        series = self.series
+        if self.is_aligned():
+            # Stored values could have been turned into Cells, but
+            # they keep their index.
+            return row + (1 if series.header_written is True else 0)
+
+        mutations = getattr(series, "_mutations", 0)
+        if self._positions is None or self._positions[0] != mutations:
+            positions = {}
+            for i, e in enumerate(list.__iter__(series)):
+                positions.setdefault(id(e), i)
+            self._positions = (mutations, positions)
+        return self._positions[1].get(id(list.__getitem__(self, row)))
+
+    def is_aligned(self) -> bool:
+        """
+        Whether every element is still at the index of its row. Only true if
+        the series hasn't been changed since, other than writing its header.
+        """
+        series = self.series
+        mutations = self.mutations
+        if self.header_written is not True and series.header_written is True:
+            mutations += 1
+        return getattr(series, "_mutations", 0) == mutations
+
 
 class _Series(CanDoMath, ListIndexableById, HasId, HasHeader, HasBorder):
     _doc_primary_summary = """
@@ -112,6 +200,13 @@ class _Series(CanDoMath, ListIndexableById, HasId, HasHeader, HasBorder):
     _dimensions = 1
     elem_type = Cell
 
+    # Column store: values from pandas/numpy input are kept here, and the series
+    # holds a `Stored` index in their place. A Cell is only created for a value
+    # when it's accessed (referenced, styled individually, etc.). Otherwise,
+    # the value is written straight from the store, using one template Cell
+    # for the series' style. The store is append-only.
+    _store: ColumnStore | None = None
+
     @overload
     def __new__(cls, fn: str | set, **kwargs) -> Func:
         ...
@@ -181,10 +276,11 @@ class _Series(CanDoMath, ListIndexableById, HasId, HasHeader, HasBorder):
         if header_style is None:
             header_style = dict()
 
-        if len(children) == 1 and isinstance(get_idx(children, 0), Series):
+        if len(children) == 1 and isinstance(get_idx(children, 0), loaded_type("pandas", "Series")):
             if children[0].name is not None and header is None:
                 header = children[0].name
 
+        self._store = None
         self._format_args(children)
 
         move_remaining_kwargs_to_dict(kwargs, cell_style)
@@ -297,7 +393,9 @@ class _Series(CanDoMath, ListIndexableById, HasId, HasHeader, HasBorder):
         ]
         new_dict = kwargs
         if inherit_style is True:
-            self_dict = deepcopy(self.__dict__)
+            self_dict = deepcopy(
+                {k: v for k, v in self.__dict__.items() if k != "_store"}
+            )
             for key, val in self_dict.items():
                 if key == "_header":
                     key = "header"
@@ -346,6 +444,8 @@ class _Series(CanDoMath, ListIndexableById, HasId, HasHeader, HasBorder):
                 key = "header"
             if key == "_id":
                 key = "id"
+            if key == "_store":
+                continue
             setattr(new, key, val)
 
         for key, val in kwargs.items():
@@ -378,7 +478,7 @@ class _Series(CanDoMath, ListIndexableById, HasId, HasHeader, HasBorder):
 
     @property
     def shape(self) -> tuple[int]:
-        length = sum([1 if not isinstance(i, Gap) else i for i in self])
+        length = sum([1 if not isinstance(i, Gap) else i for i in list.__iter__(self)])
         if self.header is not None:
             length += 1
         return (length,)
@@ -390,24 +490,411 @@ class _Series(CanDoMath, ListIndexableById, HasId, HasHeader, HasBorder):
         convert_all_to_type(args, (str, float), Cell)
         Item._resolve_all_in_container(args, type(self).elem_type)
         for i, elem in enumerate(args):
-            if not isinstance(elem, (Cell, Iterable, Gap, Expr, Func)):
+            if not isinstance(elem, (Cell, Iterable, Gap, Expr, Func, Stored)):
                 args[i] = Cell(elem)
 
     def _explode_all_1d_iterables(self, args: list) -> None:
-
+        Series, ndarray = loaded_type("pandas", "Series"), loaded_type("numpy", "ndarray")
         for i, elem in enumerate(args):
             if isinstance(elem, Series):
                 sr = args.pop(i)
-                for cell in reversed(sr.reset_index(drop=True)):
-                    args.insert(i, cell)
+                args[i:i] = self._add_to_store(sr.array, sr.dtype)
 
-            elif isinstance(elem, (list, tuple, ndarray)):
+            elif isinstance(elem, ndarray):
+                arr = args.pop(i)
+                args[i:i] = self._add_to_store(arr, arr.dtype)
+
+            elif isinstance(elem, (list, tuple)):
                 sr = args.pop(i)
                 for value in reversed(sr):
                     args.insert(i, value)
 
+    @classmethod
+    def _blank(cls, length: int, value: Any, cell_style: dict) -> _Series:
+        """
+        A series of `length` Cells with the same value and style, held in the
+        column store. For filler regions, like a BlankRegion written as a table.
+        """
+        new = cls(cell_style=cell_style)
+        # Every position shares a single stored value
+        new.extend(new._add_to_store([value], type(value)) * length)
+        return new
+
+    def _add_to_store(self, values: Iterable, dtype: Any) -> list:
+        """
+        Appends to the column store each value that would otherwise become a
+        plain `Cell(value)`. Returns the values, with stored ones replaced by their
+        `Stored` index.
+
+        Mutates inplace: `self._store`
+        """
+        if self._store is None:
+            self._store = ColumnStore()
+
+        values = list(values)
+        start = len(self._store)
+
+        if dtype != object:
+            self._store.extend(values)
+            return list(map(Stored, range(start, start + len(values))))
+
+        res = []
+        for value in values:
+            if isinstance(value, str) or not isinstance(
+                value, (Iterable, Cell, Gap, Expr, Func, Item)
+            ):
+                res.append(Stored(len(self._store)))
+                self._store.append(value)
+            else:
+                res.append(value)
+        return res
+
+    def _extend_values(self, values: Iterable, dtype: Any = object) -> None:
+        """
+        Append `values`, converted the same way as values given at construction.
+        Scalars go to the column store, so a series can be filled chunk by chunk
+        without a Cell for each value.
+
+        Mutates inplace: `self`, `self._store`
+        """
+        args = self._add_to_store(values, dtype)
+        if dtype == object and not all(isinstance(x, Stored) for x in args):
+            self._format_args(args)
+        self.extend(args)
+
+    def _materialize(self, index: int) -> Any:
+        """
+        Get the element at `index`, first replacing it with a Cell if it's a
+        stored value. The Cell gets the location and style it would've
+        had if it were created at construction.
+
+        Mutates inplace: `self`
+        """
+        elem = list.__getitem__(self, index)
+        if not isinstance(elem, Stored):
+            return elem
+
+        if isinstance(elem, Derived):
+            cell = self._new_cell(index)
+            _empty_formula(cell, self).extend(self._derived_parts(elem, cells=True))
+            return cell
+
+        value = self._store[elem]
+        cell = self._new_cell(index)
+        if self._store.template is not None:
+            value = value if value is not None else self._store.empty_value
+        cell.value = value
+        return cell
+
+    def _new_cell(self, index: int) -> Cell:
+        """
+        An empty Cell, styled like the stored values, that replaces the element
+        at `index`.
+
+        Mutates inplace: `self`
+        """
+        template = self._store.template
+        cell = Cell() if template is None else copy(template)
+
+        if self._loc is not None:
+            if index < 0:
+                index += len(self)
+            offset = (
+                Loc((0, 0), self._loc.writer)
+                if self.header_written is True
+                else self._starting_offset()
+            )
+            for e in islice(list.__iter__(self), index):
+                offset = self._inc_offset(offset, e)
+            cell._set_loc(
+                self._loc.shift(offset.y, offset.x)
+            )
+
+        list.__setitem__(self, index, cell)
+        key_index = getattr(self, "_key_index", None)
+        if key_index is not None:
+            # It has no keys yet, but could be given one
+            _index_keys(key_index, index % len(self), cell)
+        return cell
+
+    @staticmethod
+    def _elementwise(a: Any, b: Any, sign: str) -> _Series | None:
+        """
+        Result of elementwise math between a series and another series, a Cell,
+        or a number or string. See `_derived()`. Returns None if either is
+        something else.
+        """
+        series = [x for x in (a, b) if isinstance(x, _Series)]
+        if len(series) == 0:
+            return None
+
+        for x in (a, b):
+            if not isinstance(x, (_Series, Cell)) and type(x) not in [int, float, str]:
+                return None
+
+        return type(series[0])._derived("expr", [a, sign, b])
+
+    @classmethod
+    def _derived(cls, kind: str, parts: list, **kwargs) -> _Series | None:
+        """
+        A series with one formula per row, made from `parts` of an `_expr`
+        ("expr") or `_func` ("func"), where each series is replaced by its
+        element at that row. Instead of a Cell for each row, it holds a
+        `Derived` placeholder, and `parts` are kept once, in its column store.
+        Returns None if a series holds anything but Cells and stored values.
+
+        Rows refer to the series' elements by index, so they shouldn't be
+        rearranged afterward.
+        """
+        series = [x for x in parts if isinstance(x, _Series)]
+        for x in series:
+            types = set(map(type, list.__iter__(x)))
+            if not all(issubclass(t, (Cell, Stored)) for t in types):
+                return None
+
+        new = cls(**kwargs)
+        new._store = ColumnStore()
+        new._store.formula = (
+            kind, [_Operand(x) if isinstance(x, _Series) else x for x in parts]
+        )
+        list.extend(new, _get_derived_rows(min(len(x) for x in series)))
+        return new
+
+    def _derived_parts(self, row: int, cells: bool = False, span: int | None = None) -> list:
+        """
+        Parts of the formula for a `Derived` row. Operand elements are Cells,
+        or when written (`cells` is False), the location of those that are
+        still stored values in a placed series. With `span`, every operand
+        must be placed or derived, and the range of `span` elements from
+        `row` is used instead, for an array formula.
+
+        Operands that are derived too, and not placed, are turned into Cells
+        with a formula of their own. This is done with a stack, so chains of
+        operations can't exceed the recursion limit.
+
+        Mutates inplace: operand series
+        """
+        parts = []
+        stack = [(self, row, parts)]
+        while len(stack) > 0:
+            series, row, res = stack.pop()
+            for part in series._store.formula[1]:
+                if not isinstance(part, _Operand):
+                    res.append(part)
+                    continue
+
+                operand = part.series
+                index = part.position(row)
+                if index is None:
+                    # Rearranged since. Use what it held at the time
+                    elem = list.__getitem__(part, row)
+                    if isinstance(elem, Derived):
+                        cell = Cell()
+                        stack.append((operand, elem, _empty_formula(cell, operand)))
+                    elif isinstance(elem, Stored):
+                        cell = Cell(operand._store[elem])
+                    else:
+                        cell = elem
+                    res.append(cell)
+                    continue
+
+                elem = list.__getitem__(operand, index)
+                if span is not None and operand._loc is not None:
+                    res.append(operand._range_str(index, span))
+                elif span is not None:
+                    cell = Cell()
+                    stack.append((operand, elem, _empty_formula(cell, operand)))
+                    res.append(cell)
+                elif not isinstance(elem, Stored):
+                    res.append(elem)
+                elif cells is False and operand._loc is not None:
+                    res.append(operand._elem_loc(index).full_str)
+                elif isinstance(elem, Derived):
+                    cell = operand._new_cell(index)
+                    stack.append((operand, elem, _empty_formula(cell, operand)))
+                    res.append(cell)
+                else:
+                    res.append(operand._materialize(index))
+        return parts
+
+    def _elem_loc(self, index: int) -> Loc:
+        """
+        Location of the element at `index`, if every element is a single cell.
+        """
+        if self.header_written is True:
+            index -= 1
+        offset = self._offset_by(self._starting_offset(), index)
+        return self._loc.shift(offset.y, offset.x)
+
+    def _range_str(self, index: int, length: int) -> str:
+        """
+        Reference to `length` elements from `index`, if every element is a
+        single cell.
+        """
+        start = self._elem_loc(index)
+        end = self._offset_by(start, length - 1)
+        return start.full_str + ":" + end.cell_str
+
+    def _is_relative(self, array: bool = False) -> bool:
+        """
+        Whether the formula of each `Derived` row is the same, apart from its
+        offset from the others. So every operand is placed alongside self, or
+        derived, and unplaced, in the same way. With `array`, also whether they
+        can be written as one array formula, so none of them are Funcs.
+        """
+        stack = [self]
+        while len(stack) > 0:
+            series = stack.pop()
+            kind, parts = series._store.formula
+            if array is True and kind == "func":
+                return False
+
+            for part in parts:
+                if isinstance(part, Cell):
+                    # Only hardcoded values are the same in every row
+                    if (
+                        part._loc is not None
+                        or part._expr is not None
+                        or part._func is not None
+                        or part.value is None
+                    ):
+                        return False
+
+                if not isinstance(part, _Operand):
+                    continue
+
+                operand = part.series
+                if not part.is_aligned():
+                    return False
+                if operand._loc is not None:
+                    if type(operand) is not type(self):
+                        return False
+                elif operand._store is None or operand._store.formula is None:
+                    return False
+                elif not all(map(is_, list.__iter__(operand), _derived_rows)):
+                    # Each element must still be the row at its index
+                    return False
+                else:
+                    stack.append(operand)
+        return True
+
+    def _formula_runs(self) -> dict[int, int]:
+        """
+        Index and length of each run of `Derived` rows to be written as one
+        shared or array formula, depending on the writer's `formula_mode`.
+        """
+        mode = self._loc.writer.formula_mode
+        if mode == "cell" or self._store is None or self._store.formula is None:
+            return dict()
+
+        template = self._store.template
+        if template.autofit is True and template.col_width is None:
+            # Each would need its own width
+            if isinstance(self, Row):
+                return dict()
+
+        runs = dict()
+        start, prev = None, None
+        for i, elem in enumerate(list.__iter__(self)):
+            if type(elem) is Derived and prev is not None and elem == prev + 1:
+                prev = elem
+                continue
+            if start is not None and i - start > 1:
+                runs[start] = i - start
+            start, prev = (i, elem) if type(elem) is Derived else (None, None)
+        if start is not None and len(self) - start > 1:
+            runs[start] = len(self) - start
+
+        if len(runs) > 0 and not self._is_relative():
+            return dict()
+        return runs
+
+    def _write_derived(self, loc: Loc, row: int) -> None:
+        template = self._store.template
+        kind = self._store.formula[0]
+        template._write_value(loc, template._formula(kind, self._derived_parts(row), loc))
+
+    def _translates(self, text: str, loc: Loc, row: int) -> bool:
+        """
+        Whether moving the references in `text`, the formula of `row` at `loc`,
+        gives the formula of the next row. That's how readers expand a
+        shared formula, so it can't be used otherwise, like if `text` isn't
+        valid, or has a reference that's written like a name.
+        """
+        next_loc = self._offset_by(loc, 1)
+        kind = self._store.formula[0]
+        expected = self._store.template._formula(
+            kind, self._derived_parts(row + 1), next_loc
+        )
+        try:
+            moved = Translator(text, loc.cell_str).translate_formula(next_loc.cell_str)
+        except TokenizerError:
+            return False
+        # Spacing isn't kept
+        return moved.split() == expected.split()
+
+    def _write_formula_run(self, loc: Loc, row: int, length: int) -> None:
+        """
+        Write `length` `Derived` rows, from `row` at `loc`, as a shared formula,
+        or if the writer's `formula_mode` is "array" and it's possible, as
+        an array formula.
+        """
+        template = self._store.template
+        kind = self._store.formula[0]
+        end = self._offset_by(loc, length - 1)
+        ref = loc.cell_str + ":" + end.cell_str
+
+        if loc.writer.formula_mode == "array" and self._is_relative(array=True):
+            text = template._formula(kind, self._derived_parts(row, span=length), loc)
+            values = [ArrayFormula(ref, text)] + [None] * (length - 1)
+        else:
+            text = template._formula(kind, self._derived_parts(row), loc)
+            if not self._translates(text, loc, row):
+                for i in range(length):
+                    self._write_derived(self._offset_by(loc, i), row + i)
+                return
+            si = loc.writer.shared_formula_index()
+            values = [SharedFormula(si, ref, text)] + [SharedFormula(si)] * (length - 1)
+
+        cell = template
+        if template.autofit is True and template.col_width is None:
+            # Formulas only get longer down the column, so the last is widest
+            cell = copy(template)
+            cell.autofit = False
+            last = template._formula(kind, self._derived_parts(row + length - 1), end)
+            if autofit_algorithm(last) > end.column_dimensions.width:
+                end.column_dimensions.width = autofit_algorithm(last)
+
+        cell._write_values(loc, values, vertical=isinstance(self, Col))
+
+    def __iter__(self):
+        if self._store is None:
+            return list.__iter__(self)
+        return (self._materialize(i) for i in range(len(self)))
+
+    def __reversed__(self):
+        if self._store is None:
+            return list.__reversed__(self)
+        return (self._materialize(i) for i in range(len(self) - 1, -1, -1))
+
+    def pop(self, index: int = -1) -> Any:
+        self._materialize(index)
+        return super().pop(index)
+
+    def copy(self) -> list:
+        return list(self)
+
+    def __repr__(self):
+        elems = [
+            f"{Cell.__name__}({{...}})" if isinstance(e, Derived)
+            else f"{Cell.__name__}({self._store[e]})" if isinstance(e, Stored)
+            else repr(e)
+            for e in list.__iter__(self)
+        ]
+        return f"{type(self).__name__}([{', '.join(elems)}])"
+
     def _resolve_background_color(self) -> None:
-        for elem in self:
+        for elem in list.__iter__(self):
             if hasattr(elem, "_resolve_background_color"):
                 if (
                     self.background_color not in [None, False]
@@ -417,7 +904,7 @@ class _Series(CanDoMath, ListIndexableById, HasId, HasHeader, HasBorder):
                 elem._resolve_background_color()
 
         if self.background_color not in [None, False]:
-            for elem in self:
+            for elem in list.__iter__(self):
                 if isinstance(elem, Gap):
                     if "fill_color" not in elem.kwargs:
                         elem.fill = True
@@ -430,19 +917,34 @@ class _Series(CanDoMath, ListIndexableById, HasId, HasHeader, HasBorder):
         self._loc = loc
 
         offset = self._starting_offset()
-        for elem in self:
-            elem._set_loc(
-                Loc((self._loc.y + offset.y, self._loc.x + offset.x), self._loc.ws)
-            )
+        for elem in list.__iter__(self):
+            if not isinstance(elem, Stored):
+                elem._set_loc(
+                    self._loc.shift(offset.y, offset.x)
+                )
             offset = self._inc_offset(offset, elem)
 
     def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop = key.start, key.stop
+            if start is not None:
+                start = self._key_to_idx(start)
+            if stop is not None:
+                stop = self._key_to_idx(stop)
+            for i in range(len(self))[start:stop:key.step]:
+                self._materialize(i)
+            new = ListIndexableById.__getitem__(self, key)
+            if isinstance(new, _Series):
+                new._store = None
+            return new
+
         if not isinstance(key, list):
-            # return super().__getitem__(key)
-            return ListIndexableById.__getitem__(self, key)
+            return self._materialize(self._key_to_idx(key))
 
         new_elements = [self[self._key_to_idx(k)] for k in key]
-        new_dict = {k: v for k, v in self.__dict__.items() if k not in ["_id", "_loc"]}
+        new_dict = {
+            k: v for k, v in self.__dict__.items() if k not in ["_id", "_loc", "_store"]
+        }
         if "_header" in new_dict:
             new_dict["header"] = new_dict.pop("_header")
 
@@ -465,22 +967,64 @@ class _Series(CanDoMath, ListIndexableById, HasId, HasHeader, HasBorder):
             type(self).elem_type,
             Gap,
         )
-        for elem in self:
+        for elem in list.__iter__(self):
+            if isinstance(elem, Stored):
+                continue
             if not isinstance(elem, valid_types):
                 raise TypeError(
                     f"At write time, a {cls_name} can only hold {elem_type_name}s or Gaps. "
                     "To arrange mixed types, place them in a Stack or VStack"
                 )
-            if hasattr(elem, "_validate_child_types"):
-                elem._validate_child_types()
+
+    def _apply_border(self) -> None:
+        if len(self) <= 2 or self.border == HasBorder.empty:
+            return super()._apply_border()
+
+        # Same as `HasBorder._apply_border()`, but stored values in the middle
+        # are left alone. They get their border from `self._store.template`
+        mask = self._border_mask(*self.border)
+        first, last = self[0], self[-1]
+
+        for elem in [first, last]:
+            if getattr(elem, "is_empty", None) is True and hasattr(elem, 'value'):
+                elem.value = ""
+
+        first.border = mask.first
+        last.border = mask.last
+        # Like `inherit_style()`, what each style record becomes is only worked
+        # out once. id of a record: (the record, so the id stays valid, the result)
+        bordered = dict()
+        for i in range(1, len(self) - 1):
+            elem = list.__getitem__(self, i)
+            if isinstance(elem, Stored):
+                continue
+            if getattr(elem, 'is_empty', None) is True and hasattr(elem, 'value'):
+                elem.value = ""
+            before = elem._style
+            result = bordered.get(id(before))
+            if result is None:
+                elem.border = mask.middle
+                bordered[id(before)] = (before, elem._style)
+            else:
+                elem._style = result[1]
 
     def _write(self) -> None:
         require_each_element_to_be_cls_type(self)
 
         self._apply_border()
 
-        for cell in self:
-            cell._inherit_style_without_override(self.cell_style)
+        inherit_style(
+            (cell for cell in list.__iter__(self) if not isinstance(cell, Stored)),
+            self.cell_style,
+        )
+
+        if self._store is not None:
+            template = Cell()
+            if len(self) > 2 and self.border != HasBorder.empty:
+                template.border = self._border_mask(*self.border).middle
+                self._store.empty_value = ""
+            template._inherit_style_without_override(self.cell_style)
+            self._store.template = template
 
         if self.header is not None:
             ensure_value_is_not_number(self.header)
@@ -499,8 +1043,43 @@ class _Series(CanDoMath, ListIndexableById, HasId, HasHeader, HasBorder):
             self.insert(0, new_header)
             self.header_written = True
 
-        for cell in self:
-            cell._write()
+        runs = self._formula_runs()
+        run_end = 0
+        offset = Loc((0, 0), self._loc.writer)
+        # Consecutive stored values, and where the first goes. Written together
+        values, values_loc = [], None
+        for i, cell in enumerate(list.__iter__(self)):
+            is_value = type(cell) is Stored
+            if is_value:
+                value = self._store[cell]
+                if value is None:
+                    value = self._store.empty_value
+                if not is_blank(value):
+                    if len(values) == 0:
+                        values_loc = self._loc.shift(offset.y, offset.x)
+                    values.append(value)
+                    continue
+
+            if len(values) > 0:
+                self._store.template._write_values(values_loc, values, vertical=isinstance(self, Col))
+                offset = self._offset_by(offset, len(values))
+                values = []
+
+            if i in runs:
+                run_end = i + runs[i]
+                loc = self._loc.shift(offset.y, offset.x)
+                self._write_formula_run(loc, cell, runs[i])
+            elif i < run_end or is_value:
+                # Written with its run, or a blank value
+                pass
+            elif isinstance(cell, Derived):
+                self._write_derived(self._loc.shift(offset.y, offset.x), cell)
+            else:
+                cell._write()
+            offset = self._inc_offset(offset, cell)
+
+        if len(values) > 0:
+            self._store.template._write_values(values_loc, values, vertical=isinstance(self, Col))
 
     def _starting_offset(self) -> Loc:
         ...
@@ -533,7 +1112,7 @@ class Col(_Series):
         from pandas import DataFrame
 
         header = "" if self.header is None else self.header
-        elems_to_show = list(self) if len(self) <= 10 else list(self)[:10]
+        elems_to_show = list(self) if len(self) <= 10 else list(self[:10])
 
         if len(self) > 10:
             elems_to_show.append(f"(+{len(self)-10})")
@@ -550,13 +1129,16 @@ class Col(_Series):
 
     @staticmethod
     def _inc_offset(offset: Loc, elem: Any) -> Loc:
-        offset.y += elem.height
-        return offset
+        return offset.shift(y=elem.height)
+
+    @staticmethod
+    def _offset_by(offset: Loc, count: int) -> Loc:
+        return offset.shift(y=count)
 
     def _starting_offset(self) -> Loc:
-        offset = Loc((0, 0), self._loc.ws)
+        offset = Loc((0, 0), self._loc.writer)
         if getattr(self, "_header", None) is not None:
-            offset.y += 1
+            offset = offset.shift(y=1)
         return offset
 
 
@@ -586,7 +1168,7 @@ class Row(_Series):
         from pandas import DataFrame
 
         header = "" if self.header is None else self.header
-        elems_to_show = list(self) if len(self) <= 10 else list(self)[:10]
+        elems_to_show = list(self) if len(self) <= 10 else list(self[:10])
 
         if len(self) > 10:
             elems_to_show.append(f"(+{len(self)-10})")
@@ -610,13 +1192,16 @@ class Row(_Series):
 
     @staticmethod
     def _inc_offset(offset: Loc, elem: Any) -> Loc:
-        offset.x += elem.width
-        return offset
+        return offset.shift(x=elem.width)
+
+    @staticmethod
+    def _offset_by(offset: Loc, count: int) -> Loc:
+        return offset.shift(x=count)
 
     def _starting_offset(self) -> Loc:
-        offset = Loc((0, 0), self._loc.ws)
+        offset = Loc((0, 0), self._loc.writer)
         if getattr(self, "_header", None) is not None:
-            offset.x += 1
+            offset = offset.shift(x=1)
         return offset
 
 Col.sibling_type = Row
@@ -17,12 +17,10 @@ from excelbird._utils.pass_attributes import (
 )
 # Internal core
 from excelbird.core.gap import Gap
-from excelbird.core.cell import Cell
-from excelbird.core.series import Col, Row
+from excelbird.core.blank import BlankRegion
 from excelbird.core.frame import Frame, VFrame
 from excelbird.core.stack import VStack, Stack
-from excelbird.core.expression import Expr
-from excelbird.core.function import Func
+from excelbird.core.resolver import Resolver
 
 
 class Sheet(VStack):
@@ -145,8 +143,6 @@ class Sheet(VStack):
             self._insert_separator(sep)
 
         if self.isolate is True:
-            self._resolve_all_references()
-            self._resolve_all_references()
             self._resolve_all_references()
             #     raise ExpressionResolutionError(
             #         "Couldn't resolve all expression references.\nThis error was raised during the "
@@ -158,19 +154,7 @@ class Sheet(VStack):
             Globals.clear_references()
 
     def _resolve_all_references(self) -> bool:
-        Expr._set_use_ref_for_container_recursive(self)
-
-        all_resolved = False
-        attempts = 0
-        while not all_resolved and attempts <= 5:
-            all_resolved = True
-            attempts += 1
-            if Expr._resolve_container_recursive(self) is False:
-                all_resolved = False
-            if Func._resolve_container_recursive(self) is False:
-                all_resolved = False
-
-        return all_resolved
+        return Resolver(self).run()
 
     def _apply_end_gap(self) -> None:
         gap = self.end_gap
@@ -206,29 +190,19 @@ class Sheet(VStack):
         size, kwargs = int(gap), gap.kwargs
         row_multiplier = kwargs.pop("row_multiplier")
         width, height = self.width, self.height
-        new_elements = []
-        for i, elem in reversed(list(enumerate(self))):
-            new_elements.insert(0, self.pop(i))
+        new_elements = list(self)
+        self.clear()
         new_cols = size
         new_rows = size * row_multiplier
         full_height = height + new_rows
+        # Filler regions are written in bulk, without creating Cells
         self.append(
             Stack(
                 VStack(
                     *new_elements,
-                    VFrame(
-                        *[
-                            Row(*[Cell("", **kwargs) for _ in range(width)])
-                            for _ in range(new_rows)
-                        ]
-                    ),
-                ),
-                Frame(
-                    *[
-                        Col(*[Cell("", **kwargs) for _ in range(full_height)])
-                        for _ in range(new_cols)
-                    ]
+                    BlankRegion(new_rows, width, "", VFrame, kwargs),
                 ),
+                BlankRegion(full_height, new_cols, "", Frame, kwargs),
             )
         )
 
@@ -236,6 +210,11 @@ class Sheet(VStack):
         super()._resolve_gaps()
         self._apply_end_gap()
 
+    def _pass_to_children(self) -> None:
+        pass_dict_to_children(self, "cell_style")
+        pass_dict_to_children(self, "header_style")
+        pass_dict_to_children(self, "table_style")
+
     def _write(self) -> None:
 
         if self.tab_color is not None:
@@ -247,10 +226,6 @@ class Sheet(VStack):
         if self.zoom is not None:
             self._loc.ws.sheet_view.zoomScale = self.zoom
 
-        pass_dict_to_children(self, "cell_style")
-        pass_dict_to_children(self, "header_style")
-        pass_dict_to_children(self, "table_style")
-
         for elem in self:
             elem._write()
 
@@ -3,7 +3,6 @@ Detailed documentation and code examples coming soon.
 """
 from __future__ import annotations
 # External
-from pandas import Series, DataFrame
 from typing import Any
 from copy import deepcopy
 
@@ -20,6 +19,7 @@ from excelbird._base.styling import (
 )
 from excelbird._utils.util import (
     init_from_same_dimension_type,
+    loaded_type,
 )
 from excelbird._utils.pass_attributes import (
     pass_attr_to_children,
@@ -31,7 +31,7 @@ from excelbird._utils.argument_parsing import (
     move_remaining_kwargs_to_dict,
 )
 
-from excelbird.core.cell import Cell
+from excelbird.core.cell import Cell, inherit_style
 from excelbird.core.series import (
     _Series,
     Col,
@@ -281,8 +281,8 @@ class _Stack(ListIndexableById, HasId, HasMargin, HasPadding):
 
     def _format_args(self, args: list) -> None:
         convert_all_to_type(args, (str, int, float), Cell, strict=True)
-        convert_all_to_type(args, Series, Col)
-        convert_all_to_type(args, DataFrame, Frame)
+        convert_all_to_type(args, loaded_type("pandas", "Series"), Col)
+        convert_all_to_type(args, loaded_type("pandas", "DataFrame"), Frame)
         convert_all_to_type(args, set, Expr)
 
     @property
@@ -349,9 +349,8 @@ class _Stack(ListIndexableById, HasId, HasMargin, HasPadding):
                 if elem.padding != HasPadding.empty:
                     top, right, bottom, left = elem.padding
                     elem_type = type(elem)
-                    new_elements = []
-                    for i, item in reversed(list(enumerate(elem))):
-                        new_elements.insert(0, elem.pop(i))
+                    new_elements = list(elem)
+                    elem.clear()
 
                     if issubclass(elem_type, Stack):
                         if left is not None:
@@ -391,9 +390,8 @@ class _Stack(ListIndexableById, HasId, HasMargin, HasPadding):
                 if elem.margin != HasMargin.empty:
                     top, right, bottom, left = elem.margin
                     elem_type = type(elem)
-                    new_elements = []
-                    for i, item in reversed(list(enumerate(elem))):
-                        new_elements.insert(0, elem.pop(i))
+                    new_elements = list(elem)
+                    elem.clear()
 
                     if issubclass(elem_type, Stack):
                         if left is not None:
@@ -439,7 +437,7 @@ class _Stack(ListIndexableById, HasId, HasMargin, HasPadding):
         offset = self._starting_offset()
         for elem in self:
             elem._set_loc(
-                Loc((self._loc.y + offset.y, self._loc.x + offset.x), self._loc.ws)
+                self._loc.shift(offset.y, offset.x)
             )
             offset = self._inc_offset(offset, elem)
 
@@ -469,25 +467,21 @@ class _Stack(ListIndexableById, HasId, HasMargin, HasPadding):
                     f"At write time, a {type(self).__name__} can only hold "
                     "the following types:\n{valid_types}"
                 )
-            if hasattr(elem, "_validate_child_types"):
-                elem._validate_child_types()
 
-    def _write(self) -> None:
+    def _pass_to_children(self) -> None:
         pass_attr_to_children(self, "schema")
         pass_dict_to_children(self, "cell_style")
         pass_dict_to_children(self, "header_style")
         pass_dict_to_children(self, "table_style")
 
-        if len(self.cell_style) > 0:
-            for elem in self:
-                if isinstance(elem, Cell):
-                    elem._inherit_style_without_override(self.cell_style)
+    def _write(self) -> None:
+        inherit_style((elem for elem in self if isinstance(elem, Cell)), self.cell_style)
 
         for elem in self:
             elem._write()
 
     def _starting_offset(self) -> Loc:
-        return Loc((0, 0), self._loc.ws)
+        return Loc((0, 0), self._loc.writer)
 
 
 class Stack(_Stack):
@@ -515,8 +509,7 @@ class Stack(_Stack):
 
     @staticmethod
     def _inc_offset(offset: Loc, elem: Any) -> Loc:
-        offset.x += elem.width
-        return offset
+        return offset.shift(x=elem.width)
 
     @property
     def _gap_size(self) -> int:
@@ -548,8 +541,7 @@ class VStack(_Stack):
 
     @staticmethod
     def _inc_offset(offset: Loc, elem: Any) -> Loc:
-        offset.y += elem.height
-        return offset
+        return offset.shift(y=elem.height)
 
     @property
     def _gap_size(self) -> int:
@@ -48,6 +48,13 @@ after that sheet was created.
         super().__init__(self.message)
 
 
+class CircularReferenceError(ExpressionResolutionError):
+    """
+    Expressions reference each other in a cycle, so none of them can be resolved.
+    """
+    pass
+
+
 class ExpressionExecutionError(Exception):
     def __init__(self, original_exception: Exception, expr_string: str):
         super().__init__(
@@ -63,11 +63,13 @@ common operations. Here are just a few:
 
 from __future__ import annotations
 
-from pandas import DataFrame
 from collections import namedtuple, ChainMap
 from copy import copy
 from excelbird.exceptions import SchemaError
-from typing import overload
+from typing import overload, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
 
 
 # The values held by each key of a Schema.
@@ -459,6 +461,7 @@ class Schema(dict):
         return type(self)(**{copy(k): copy(v) for k, v in self.items()})
 
     def _repr_html_(self):
+        from pandas import DataFrame
 
         return DataFrame(
             list(zip(self.inputs(), self.outputs())),
@@ -0,0 +1,37 @@
+from excelbird import *
+from copy import deepcopy
+
+
+def test_cells_share_style_records():
+    a = Cell(1, bold=True, border=True)
+    b = Cell(2, bold=True, border=True)
+    assert a._style is b._style
+    assert deepcopy(a)._style is a._style
+
+    b.bold = False
+    assert a.bold is True and b.bold is False
+    assert a._style is not b._style
+
+
+def test_inherit_style_without_override():
+    cell = Cell(1, bold=False, cell_style={"bold": True, "size": 9, "not_a_style": 1})
+    assert cell.bold is False
+    assert cell.size == 9
+
+    ref = cell.ref(inherit_style=True)
+    assert ref.size == 9 and ref.bold is False
+    assert ref._expr[0] is cell
+
+
+def test_long_running_total_renders(tmp_path):
+    import openpyxl as xl
+
+    values = Col(*range(1500), header="v")
+    total = values[0]
+    for cell in list(values)[1:]:
+        total = total + cell
+    Book(Sheet(Stack(values, Col(total * 2, header="t")))).write(str(tmp_path / "out.xlsx"))
+
+    formula = xl.load_workbook(tmp_path / "out.xlsx").active["B2"].value.replace(" ", "")
+    assert formula.startswith("=" + "(" * 1499 + "A2+A3)+A4)")
+    assert formula.endswith("+A1501)*2")
@@ -0,0 +1,13 @@
+from excelbird._utils.cell_util import finalize_formula
+
+
+def test_finalize_formula():
+    assert finalize_formula("=DSUM(A1) + SUM(B1, )") == "=_xlfn.DSUM(A1) + _xlfn.SUM(B1)"
+    assert finalize_formula("=  CONCAT(\"SUM( , \", A1)") == "=_xlfn.CONCAT(\"SUM( , \", A1)"
+    assert finalize_formula("=IF(A1 = 'x', 1, 0)") == '=_xlfn.IF(A1 ="x", 1, 0)'
+
+    # Only the formula's own sheet is removed from references
+    formula = "=Sheet1!A1 + MySheet1!A1 + 'Sheet1'!A1"
+    assert finalize_formula(formula, "Sheet1!") == "=A1 + MySheet1!A1 + 'Sheet1'!A1"
+    formula = "=('My Sheet'!A1  +  \"'My Sheet'!\")"
+    assert finalize_formula(formula, "'My Sheet'!", functions=False) == "=(A1  +  \"'My Sheet'!\")"
@@ -0,0 +1,62 @@
+from excelbird import *
+import pandas as pd
+import pytest
+
+
+def test_key_lookup_follows_changes():
+    frame = Frame(Col(1, header="a"), Col(2, header="b"))
+    assert frame._key_to_idx("b") == 1
+
+    frame[0].header = "c"
+    assert frame._key_to_idx("c") == 0
+    with pytest.raises(KeyError):
+        frame._key_to_idx("a")
+
+    frame.insert(0, Col(3, id="b"))
+    assert frame._key_to_idx("b") == 0
+    assert frame._key_to_idx("c") == 1
+
+    frame.append(Col(4, header="d"))
+    frame.pop(0)
+    assert frame._key_to_idx("b") == 1
+    assert frame._key_to_idx("d") == 2
+
+
+def test_id_set_after_lookup_beats_header():
+    a = Col(1, header="k")
+    stack = Stack(a, Col(2, 3))
+    assert stack.get("zzz") is None
+    stack[1].id = "k"
+    assert stack["k"] is stack[1]
+
+
+def test_separator_on_long_col():
+    col = Col(*range(20000), sep=2)
+    assert len(col) == 39999
+    assert all(isinstance(col[i], Gap) for i in range(1, len(col), 2))
+    assert [col[i].value for i in range(0, len(col), 2)] == list(range(20000))
+
+
+def test_key_index_is_updated_in_place():
+    frame = Frame(Col(1, header="a"))
+    assert frame["a"] is frame[0]
+    key_index = frame._key_index
+    for i in range(50):
+        frame.append(Col(i, header=f"h{i}"))
+        Col(i, header="a")  # Elsewhere, so it can't change this index
+        assert frame._key_to_idx(f"h{i}") == i + 1
+    assert frame._key_index is key_index
+
+    frame.insert(-1, Col(0, header="h10"))
+    frame.remove(frame["h3"])
+    del frame[0]
+    frame[1] = Col(0, id="h2")
+    assert frame._key_index is key_index
+    expected = frame._build_key_index()
+    assert (key_index.ids, key_index.headers) == (expected.ids, expected.headers)
+    assert frame._key_to_idx("h10") == 9 and frame._key_to_idx("h2") == 1
+
+    col = Col(pd.Series([1, 2, 3]))
+    assert col.get("x") is None
+    col[1].id = "x"
+    assert col._key_to_idx("x") == 1
@@ -1,6 +1,37 @@
 from excelbird import *
+import openpyxl as xl
 import pytest
 
 
 def test_something():
     pass
+
+
+def test_chained_exprs_resolve_in_dependency_order(tmp_path):
+    # Each Expr references the one after it
+    n = 50
+    cells = [Expr(f"[c{i+1}] + 1", id=f"c{i}") for i in range(n)] + [Cell(1, id=f"c{n}")]
+    Book(Sheet(Col(*cells))).write(str(tmp_path / "out.xlsx"))
+
+    values = [c.value for c in xl.load_workbook(tmp_path / "out.xlsx").active["A"]]
+    assert values == [f"=A{i + 2}  +  1" for i in range(n)] + [1]
+
+
+def test_unresolved_exprs_are_reported(tmp_path):
+    book = Book(Sheet(Col(Expr("[nope] + 1", id="a"), Expr("[a] * 2"))))
+    with pytest.raises(ExpressionResolutionError, match="'nope' \\(not found\\)"):
+        book.write(str(tmp_path / "out.xlsx"))
+
+    book = Book(Sheet(Col(Expr("[b] + 1", id="a"), Expr("[a] * 2", id="b"))))
+    with pytest.raises(CircularReferenceError):
+        book.write(str(tmp_path / "out.xlsx"))
+
+
+def test_expr_strings_are_parsed_once():
+    Expr.cache_clear()
+    exprs = [Expr("[revenue] - ['cost']") for _ in range(10)]
+    info = Expr.cache_info()
+    assert (info.misses, info.hits) == (1, 9)
+
+    exprs[0].refs["revenue"] = 5
+    assert exprs[1].refs == {"revenue": None, "cost": None}
@@ -0,0 +1,32 @@
+import subprocess
+import sys
+import pytest
+
+from excelbird import Func
+from excelbird import fn
+
+
+def test_import_doesnt_load_optional_dependencies():
+    code = (
+        "import sys, excelbird;"
+        "print(*[m for m in ('pandas', 'xlwings', 'excelbird._pygments', 'excelbird._formulae')"
+        " if m in sys.modules])"
+    )
+    res = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert res.stdout.strip() == ""
+
+
+def test_fn_functions_are_created_on_first_access():
+    func = fn.T_DIST_2T
+    assert fn.T_DIST_2T is func
+    assert func.__name__ == "T_DIST_2T"
+    assert "In Excel: ``T.DIST.2T()``" in func.__doc__
+    assert "T_DIST_2T" in dir(fn) and "T_DIST_2T" in fn.__all__
+
+    res = fn.ABS(1, header="a")
+    assert isinstance(res, Func)
+    assert res.inner == Func("ABS(", 1, ")").inner
+    assert res.kwargs["header"] == "a"
+
+    with pytest.raises(AttributeError):
+        fn.NOT_A_FUNCTION
@@ -0,0 +1,120 @@
+from excelbird import *
+from excelbird._base.container import Stored, Derived
+import openpyxl as xl
+import pandas as pd
+import pytest
+
+
+def test_pandas_values_are_stored_until_accessed():
+    col = Col(pd.Series([1, 2, 3], name="a"))
+    assert all(isinstance(e, Stored) for e in list.__iter__(col))
+    assert col.header == "a"
+
+    cell = col[1]
+    assert isinstance(cell, Cell) and cell.value == 2
+    assert col[1] is cell
+    assert [c.value for c in col] == [1, 2, 3]
+
+
+def test_stored_values_write_like_cells(tmp_path):
+    df = pd.DataFrame({"a": [1.5, None, 3.0], "b": ["x", "y", None]})
+    Book(Sheet(Frame(df, border=True, bold=True))).write(str(tmp_path / "stored.xlsx"))
+    Book(
+        Sheet(
+            Frame(
+                Col(*[Cell(v) for v in df["a"]], header="a"),
+                Col(*[Cell(v) for v in df["b"]], header="b"),
+                border=True,
+                bold=True,
+            )
+        )
+    ).write(str(tmp_path / "cells.xlsx"))
+
+    def cells(path):
+        ws = xl.load_workbook(path).active
+        return [
+            (c.coordinate, c.value, c.number_format, c.font.b, repr(c.border))
+            for row in ws
+            for c in row
+        ]
+
+    assert cells(tmp_path / "stored.xlsx") == cells(tmp_path / "cells.xlsx")
+
+
+def test_elementwise_math_writes_one_formula_per_row(tmp_path):
+    a = Col(pd.Series([1, 2, 3], name="a"))
+    b = Col(4, 5, 6, header="b")
+    total = a + b
+    assert all(isinstance(e, Derived) for e in list.__iter__(total))
+
+    cell = (a * b)[1]
+    assert isinstance(cell, Cell) and cell._expr[0] is a[1] and cell._expr[2] is b[1]
+
+    total.header = "sum"
+    other = total * 2 + a  # `total * 2` isn't placed, so it's expanded in place
+    other.header = "other"
+    Book(Sheet(Frame(a, b, total, other, bold=True))).write(
+        str(tmp_path / "math.xlsx"), formulas="cell"
+    )
+
+    ws = xl.load_workbook(tmp_path / "math.xlsx").active
+    assert [c.value for c in ws["C"]] == ["sum", "=A2  +  B2", "=A3  +  B3", "=A4  +  B4"]
+    assert ws["D4"].value == "=(C4  *  2)  +  A4"
+    assert all(c.font.b for c in ws["D"][1:])
+
+
+@pytest.mark.parametrize("mode", ["default", "stream"])
+def test_derived_rows_share_one_formula(tmp_path, mode):
+    def book():
+        a = Col(pd.Series([1, 2, 3], name="a"))
+        b = Col(4, 5, 6, header="b")
+        total = (a + b) * 2
+        total.header = "total"
+        rounded = Func("ROUND(", a, ", 1)", res_type=Col, header="rounded")
+        return Book(Sheet(Frame(a, b, total, rounded, Col(a * Cell(2), header="c"))))
+
+    for formulas in ["shared", "array", "cell"]:
+        book().write(str(tmp_path / f"{formulas}.xlsx"), mode=mode, formulas=formulas)
+
+    def formulas(path):
+        ws = xl.load_workbook(path).active
+        return [
+            [getattr(c.value, "text", c.value) for c in col] for col in ws.iter_cols()
+        ]
+
+    shared, array, cell = [
+        formulas(tmp_path / f"{name}.xlsx") for name in ["shared", "array", "cell"]
+    ]
+    # openpyxl removes extra spaces when it expands shared formulas
+    normalize = lambda values: [" ".join(str(v).split()) for v in values]
+    assert list(map(normalize, shared)) == list(map(normalize, cell))
+    assert shared[2][1] == cell[2][1] == "=(A2  +  B2)  *  2"
+    assert shared[3][3] == "=_xlfn.ROUND(A4, 1)"
+
+    assert array[2][1] == "=(A2:A4  +  B2:B4)  *  2" and array[2][2:] == [None, None]
+    assert array[3] == cell[3]  # Funcs can't be array formulas
+
+
+@pytest.mark.parametrize("formulas", ["shared", "cell"])
+def test_operands_changed_after_math(tmp_path, formulas):
+    def column(change):
+        a = Col(1, 2, 3, 4, 5, header="a")
+        b = Col(10, 20, 30, 40, 50, header="b")
+        total = a + b
+        total.header = "total"
+        change(a, b)
+        path = tmp_path / f"{change.__name__}.xlsx"
+        Book(Sheet(Frame(a, b, total))).write(str(path), formulas=formulas)
+        ws = xl.load_workbook(path).active
+        return [" ".join(str(c.value).split()) for c in ws["C"][1:]]
+
+    def reverse(a, b):
+        b.reverse()
+
+    def replace(a, b):
+        a[3] = Cell(99)
+
+    # Rows still refer to the elements they were computed from
+    assert column(reverse) == ["=A2 + B6", "=A3 + B5", "=A4 + B4", "=A5 + B3", "=A6 + B2"]
+    # Or to what they were, if one was replaced
+    assert column(replace) == ["=A2 + B2", "=A3 + B3", "=A4 + B4", "=4 + B5", "=A6 + B6"]
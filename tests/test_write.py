@@ -0,0 +1,352 @@
+from excelbird import *
+import openpyxl as xl
+import pytest
+
+
+def _layout():
+    return Book(
+        Sheet(
+            Frame(
+                Col(1, 2, 3, header="a"),
+                Col(4, 5, 6, header="b"),
+                Expr("[a] + [b]", header="c", bold=True),
+                table_style=True,
+            ),
+            Cell("merged", merge=(1, 1), border=True),
+            Cell("x", dropdown=["x", "y"]),
+            sep=Gap(1),
+        )
+    )
+
+
+def _cells(path):
+    ws = xl.load_workbook(path).active
+    return (
+        [(c.coordinate, c.value, c.font.b, c.border.top.style) for r in ws for c in r],
+        [str(r) for r in ws.merged_cells.ranges],
+        [(t.ref, [c.name for c in t.tableColumns]) for t in ws.tables.values()],
+        [str(dv.sqref) for dv in ws.data_validations.dataValidation],
+    )
+
+
+def test_stream_mode_matches_default(tmp_path):
+    _layout().write(str(tmp_path / "default.xlsx"))
+    _layout().write(str(tmp_path / "stream.xlsx"), mode="stream")
+    assert _cells(tmp_path / "stream.xlsx") == _cells(tmp_path / "default.xlsx")
+
+
+def test_invalid_write_mode(tmp_path):
+    with pytest.raises(ValueError):
+        _layout().write(str(tmp_path / "out.xlsx"), mode="fast")
+
+
+def test_style_cache_reuses_styles(tmp_path):
+    book = Book(Col(*range(50), bold=True, border=True))
+    book.write(str(tmp_path / "out.xlsx"))
+    assert book.style_cache.misses <= 3
+    assert book.style_cache.hits >= 47
+
+    ws = xl.load_workbook(tmp_path / "out.xlsx").active
+    assert all(c.font.b and c.border.left.style == "thin" for c in ws["A"])
+    assert ws["A1"].border.top.style == "thin"
+    assert ws["A2"].border.top is None
+
+
+@pytest.mark.parametrize("mode", ["default", "stream"])
+def test_write_profile(tmp_path, mode):
+    seen = []
+    profile = _layout().write(str(tmp_path / "out.xlsx"), mode=mode, profile=seen.append)
+    assert [s.name for s in profile.stages] == [s.name for s in seen]
+    assert [s.name for s in profile.stages[:2]] == ["snapshot", "resolve_references"]
+    assert profile.stages[-1].name == "save"
+
+    write = profile["write_sheets"]
+    assert list(write.sheets) == ["Sheet1"]
+    values = [c for c in _cells(tmp_path / "out.xlsx")[0] if c[1] is not None]
+    assert write.cells_written == write.sheets["Sheet1"].cells_written >= len(values)
+    assert write.formulas_written == 3
+    assert profile.counters["styles_created"] > 0
+    assert _layout().write(str(tmp_path / "out.xlsx"), mode=mode) is None
+
+
+def test_loc_is_immutable():
+    from excelbird._base import Loc, SheetWriter
+
+    ws = xl.Workbook().active
+    ws.title = "My Sheet"
+    loc = Loc("B3", SheetWriter(ws))
+    with pytest.raises(AttributeError):
+        loc.y = 5
+
+    moved = loc.shift(y=1, x=2)
+    assert (loc.y, loc.x) == (2, 1)
+    assert moved.full_str == "'My Sheet'!D4"
+
+
+def test_end_gap_and_sep(tmp_path):
+    book = Book(
+        Sheet(
+            Row(1, 2, 3, sep=Gap(1, fill_color="00FF00")),
+            end_gap=dict(size=2, fill_color="FF0000"),
+        )
+    )
+    book.write(str(tmp_path / "out.xlsx"))
+    ws = xl.load_workbook(tmp_path / "out.xlsx").active
+    assert [c.value for c in ws[1]][:5] == [1, None, 2, None, 3]
+    assert ws["B1"].fill.fgColor.rgb == "0000FF00"
+    # 5 wide + 2 gap columns, 1 tall + 6 gap rows
+    assert (ws.max_column, ws.max_row) == (7, 7)
+    assert ws["G7"].fill.fgColor.rgb == "00FF0000"
+
+
+def test_stack_gap_is_written_as_region(tmp_path):
+    from excelbird.core.blank import BlankRegion
+
+    stack = VStack(Col(1, 2), Gap(2, fill_color="DDDDDD"), Col(3, 4))
+    book = Book(Sheet(stack))
+    # Gaps are resolved in the copy of the layout that's written
+    written = book._snapshot()
+    for name, stage, per_sheet in written._write_stages("default", "shared"):
+        stage(written[0]) if per_sheet is True else stage()
+        if name == "gaps":
+            break
+    region = written[0][0][1]
+    assert isinstance(region, BlankRegion)
+    assert (region.height, region.width) == (2, 1)
+
+    book.write(str(tmp_path / "out.xlsx"))
+    assert isinstance(stack[1], Gap)
+
+    ws = xl.load_workbook(tmp_path / "out.xlsx").active
+    assert [c.value for c in ws["A"]] == [1, 2, None, None, 3, 4]
+    assert ws["A3"].fill.fgColor.rgb == "00DDDDDD"
+
+
+@pytest.mark.parametrize("mode", ["default", "stream"])
+def test_parallel_matches_sequential(tmp_path, mode):
+    import datetime as dt
+
+    def layout():
+        sheets = [_layout()[0] for _ in range(3)]
+        sheets.append(Sheet(Col(dt.date(2022, 1, 1), dt.date(2022, 1, 2), header="when")))
+        return Book(*sheets)
+
+    def read(path):
+        wb = xl.load_workbook(path)
+        return [
+            (
+                [(c.coordinate, c.value, c.font.b, c.number_format) for r in ws for c in r],
+                sorted(str(r) for r in ws.merged_cells.ranges),
+                sorted(t.displayName for t in ws.tables.values()),
+                [str(dv.sqref) for dv in ws.data_validations.dataValidation],
+            )
+            for ws in wb
+        ]
+
+    layout().write(str(tmp_path / "one.xlsx"), mode=mode)
+    layout().write(str(tmp_path / "many.xlsx"), mode=mode, workers=2)
+    assert read(tmp_path / "many.xlsx") == read(tmp_path / "one.xlsx")
+    with pytest.raises(ValueError):
+        layout().write(str(tmp_path / "out.xlsx"), workers=0)
+
+
+def test_duplicates_become_refs(tmp_path):
+    col = Col(1, 2, header="a")
+    inner = VStack(col)
+    frame = Frame(Col(1, header="x"), Col(1, 2, 3, header="y"))
+    Book(Sheet(Stack(inner, col, frame))).write(str(tmp_path / "out.xlsx"))
+    assert inner[0] is col and len(frame[0]) == 1
+
+    ws = xl.load_workbook(tmp_path / "out.xlsx").active
+    assert [c.value for c in ws["A"]][:3] == ["a", 1, 2]
+    assert [c.value for c in ws["B"]][:2] == ["=A2", "=A3"]
+    assert [c.value for c in ws["C"]][:2] == ["x", 1]
+
+
+def test_styles_are_passed_down(tmp_path):
+    col = Col(Cell(1), Cell(2, bold=False), Cell(3, border=[None, "thick", None, None]), header="a")
+    book = Book(
+        Sheet(Stack(Frame(col, cell_style=dict(fill_color="FF0000")), italic=True)),
+        bold=True,
+        border=True,
+        header_style=dict(size=14),
+    )
+    book.write(str(tmp_path / "out.xlsx"))
+    assert len(col.cell_style) == 0 and len(col) == 3
+
+    ws = xl.load_workbook(tmp_path / "out.xlsx").active
+    header, first, second, third = ws["A"]
+    assert header.font.sz == 14 and not header.font.b
+    assert first.font.b and first.font.i and first.fill.fgColor.rgb == "00FF0000"
+    assert not second.font.b and second.border.top.style == "thin"
+    assert third.border.right.style == "thick" and third.border.top is None
+
+
+@pytest.mark.parametrize("mode", ["default", "stream"])
+def test_book_can_be_written_again(tmp_path, mode):
+    values = Col(1, 2, 3, header="a")
+    book = Book(
+        Sheet(Frame(values, Expr("[a] * 2", header="b"), table_style=True), Cell("x", merge=(0, 1))),
+        Sheet(Frame(Expr("[b] + 1", header="c")), Cell("y"), sep=Gap(1)),
+    )
+    book.write(str(tmp_path / "first.xlsx"), mode=mode)
+    book.write(str(tmp_path / "second.xlsx"), mode=mode)
+
+    def read(path):
+        return [
+            [(c.coordinate, c.value, c.border.top.style if c.border.top else None) for r in ws for c in r]
+            for ws in xl.load_workbook(path)
+        ]
+
+    assert read(tmp_path / "second.xlsx") == read(tmp_path / "first.xlsx")
+
+    # Only what changed needs to be set
+    values[1].value = 20
+    book.write(str(tmp_path / "third.xlsx"), mode=mode)
+    ws = xl.load_workbook(tmp_path / "third.xlsx")["Sheet1"]
+    assert [c.value for c in ws["A"]][:4] == ["a", 1, 20, 3]
+    assert [c.value for c in ws["B"]][:2] == ["b", "=A2  *  2"]
+
+
+def test_removed_elements_cant_be_referenced(tmp_path):
+    book = Book(Sheet(Frame(Expr("[a] + 1"))), Sheet(Frame(Col(1, 2, 3, header="a"))))
+    book.write(str(tmp_path / "first.xlsx"))
+
+    book[1] = Sheet(Frame(Col(4, 5, 6, header="z")))
+    with pytest.raises(ExpressionResolutionError):
+        book.write(str(tmp_path / "second.xlsx"))
+
+
+@pytest.mark.parametrize("mode", ["default", "stream"])
+def test_incremental_write(tmp_path, mode):
+    values = Col(1, 2, 3, header="a")
+    other = Col(7, 8, header="z")
+    book = Book(
+        Sheet(Frame(values, Expr("[a] * 2", header="b"), table_style=True), Cell("x", merge=(0, 1))),
+        Sheet(Frame(Expr("[b] + 1", header="c")), Cell("y")),
+        Sheet(Frame(other)),
+    )
+    book.write(str(tmp_path / "first.xlsx"), mode=mode, incremental=True)
+    first = {title: rec for title, (_, rec) in book._rendered.items()}
+
+    def read(path):
+        return [
+            [(c.coordinate, c.value, c.border.top.style if c.border.top else None) for r in ws for c in r]
+            + [str(t.ref) for t in ws.tables.values()]
+            for ws in xl.load_workbook(path)
+        ]
+
+    # Nothing changed, so nothing is rendered again
+    book.write(str(tmp_path / "second.xlsx"), mode=mode, incremental=True)
+    assert all(book._rendered[t][1] is rec for t, rec in first.items())
+    assert read(tmp_path / "second.xlsx") == read(tmp_path / "first.xlsx")
+
+    # Only the sheet that changed is rendered again
+    other[0].value = 70
+    book.write(str(tmp_path / "third.xlsx"), mode=mode, incremental=True)
+    assert book._rendered["Sheet1"][1] is first["Sheet1"]
+    assert book._rendered["Sheet2"][1] is first["Sheet2"]
+    assert book._rendered["Sheet3"][1] is not first["Sheet3"]
+
+    book.write(str(tmp_path / "full.xlsx"), mode=mode)
+    assert read(tmp_path / "third.xlsx") == read(tmp_path / "full.xlsx")
+    assert xl.load_workbook(tmp_path / "third.xlsx")["Sheet3"]["A2"].value == 70
+
+
+@pytest.mark.parametrize("mode", ["default", "stream"])
+def test_dropdowns_are_grouped(tmp_path, mode):
+    book = Book(
+        Sheet(
+            Frame(Col(*range(1000), header="a", dropdown=["x", "y"]), Col(*range(1000), header="b", dropdown=["x", "y"])),
+            Cell(1, dropdown=["x", "y"]),
+            Cell(2, dropdown=[1, 2]),
+        )
+    )
+    book.write(str(tmp_path / "dropdowns.xlsx"), mode=mode)
+    ws = xl.load_workbook(tmp_path / "dropdowns.xlsx").active
+    assert [(str(dv.sqref), dv.formula1) for dv in ws.data_validations.dataValidation] == [
+        ("A2:A1002 B2:B1001", '"x,y"'),
+        ("A1003", '"1,2"'),
+    ]
+
+
+@pytest.mark.parametrize("mode", ["default", "stream"])
+def test_stored_values_and_merges(tmp_path, mode):
+    import pandas as pd
+
+    df = pd.DataFrame({"a": [1, 2.5, "long text value", None, 4]})
+    book = Book(
+        Sheet(
+            Frame(df, border=True, cell_style=dict(autofit=True)),
+            *[Cell(i, merge=(0, 1), border=True) for i in range(3)],
+        )
+    )
+    book.write(str(tmp_path / "stored.xlsx"), mode=mode)
+    ws = xl.load_workbook(tmp_path / "stored.xlsx").active
+    assert [(c.value, c.number_format, c.border.left.style) for c in ws["A"][1:6]] == [
+        (1, "#,##0", "thin"),
+        (2.5, "#,##0.00", "thin"),
+        ("long text value", "General", "thin"),
+        (None, "General", "thin"),
+        (4, "#,##0", "thin"),
+    ]
+    assert ws.column_dimensions["A"].width > 13
+    assert sorted(str(r) for r in ws.merged_cells.ranges) == ["A7:B7", "A8:B8", "A9:B9"]
+    # Merged cells on the edge get the border of the first
+    assert ws["B7"].border.right.style == "thin"
+
+
+def test_frame_from_chunks(tmp_path):
+    import pandas as pd
+
+    rows = [(1, "v", 0.5), (2, None, 1.5), (3, "x", None), (4, "y", 3.5), (5, "z", 4.5)]
+    pd.DataFrame(rows, columns=["a", "b", "c"]).to_csv(tmp_path / "data.csv", index=False)
+    schema = Schema(a=("A", "Alpha"))
+
+    frames = [
+        Frame(pd.read_csv(tmp_path / "data.csv"), schema=schema, border=True),
+        Frame.from_csv(str(tmp_path / "data.csv"), chunksize=2, schema=schema, border=True),
+        Frame.from_iter([rows[:3], rows[3:]], headers=["a", "b", "c"], schema=schema, border=True),
+    ]
+    assert [f.shape for f in frames] == [(6, 3)] * 3
+
+    def cells(i):
+        Book(Sheet(frames[i])).write(str(tmp_path / f"{i}.xlsx"))
+        ws = xl.load_workbook(tmp_path / f"{i}.xlsx").active
+        return [(c.coordinate, c.value, c.number_format, c.border.bottom and c.border.bottom.style) for r in ws for c in r]
+
+    expected = cells(0)
+    assert expected[0][1] == "Alpha"
+    assert cells(1) == expected
+    # Python ints get a number format, like in `Col(1, 2)`. numpy ints don't
+    assert [c[:2] + c[3:] for c in cells(2)] == [c[:2] + c[3:] for c in expected]
+
+    with pytest.raises(ValueError):
+        Frame.from_iter([[(1, 2)], [(1, 2, 3)]])
+
+
+def test_frame_from_chunks_keeps_first_dtypes(tmp_path):
+    import pandas as pd
+
+    # Only the first chunk has a missing value, so only it is read as floats
+    (tmp_path / "data.csv").write_text("n,m\n,1\n2,2\n3,3\n4,4\n5,5\n")
+
+    def cells(frame, name):
+        Book(Sheet(frame)).write(str(tmp_path / name))
+        ws = xl.load_workbook(tmp_path / name).active
+        return [(c.value, c.number_format) for c in ws["A"][1:]]
+
+    expected = cells(Frame(pd.read_csv(tmp_path / "data.csv")), "whole.xlsx")
+    assert expected[-1] == (5, "#,##0.00")
+    assert cells(Frame.from_csv(str(tmp_path / "data.csv"), chunksize=2), "chunks.xlsx") == expected
+
+
+def test_frame_from_parquet(tmp_path):
+    pytest.importorskip("pyarrow")
+    import pandas as pd
+
+    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", None]})
+    df.to_parquet(tmp_path / "data.parquet")
+    frame = Frame.from_parquet(str(tmp_path / "data.parquet"), chunksize=2, columns=["b"])
+    assert frame.headers == ["b"]
+    assert [c.value for c in frame[0]] == ["x", "y", None]